@@ -4,6 +4,7 @@ import argparse
 import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
@@ -21,6 +22,7 @@ from neurocode.api import (  # noqa: E402
 
 
 # Function to create and return an OpenAI client instance
+@lru_cache(maxsize=1)
 def get_openai_client():
     try:
         from openai import OpenAI
@@ -33,6 +35,30 @@ def get_openai_client():
     return OpenAI(api_key=api_key)
 
 
+def request_completion(client, *, model: str, messages: list[dict[str, str]], stream: bool = False) -> str:
+    """Return the assistant reply text, optionally streaming it to stderr as it arrives."""
+
+    kwargs: dict[str, Any] = {"model": model, "messages": messages, "temperature": 0}
+    max_tokens = os.environ.get("NEUROCODE_AGENT_MAX_TOKENS")
+    if max_tokens:
+        kwargs["max_tokens"] = int(max_tokens)
+    if not stream:
+        response = client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content or ""
+
+    parts: list[str] = []
+    for chunk in client.chat.completions.create(stream=True, **kwargs):
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content or ""
+        if delta:
+            parts.append(delta)
+            sys.stderr.write(delta)
+            sys.stderr.flush()
+    sys.stderr.write("\n")
+    return "".join(parts)
+
+
 def extract_json_from_text(text: str) -> Any:
     """Strip common fences and parse JSON."""
     cleaned = text.strip()
@@ -123,6 +149,11 @@ def main(argv: Sequence[str] | None = None) -> int:
     parser.add_argument("--dry-run", action="store_true", help="Only run dry-run application.")
     parser.add_argument("--no-apply", action="store_true", help="Show diff but never write files.")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging.")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the LLM reply to stderr as it is generated.",
+    )
     parser.add_argument(
         "--show-plan",
         action="store_true",
@@ -270,15 +301,15 @@ def main(argv: Sequence[str] | None = None) -> int:
             f"{json.dumps(bundle, indent=2)}\n\n"
             "Modify ONLY the allowed fields and output ONLY the updated JSON PatchPlanBundle."
         )
-        response = client.chat.completions.create(
+        raw_text = request_completion(
+            client,
             model=args.model,
             messages=[
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_content},
             ],
-            temperature=0,
+            stream=args.stream,
         )
-        raw_text = response.choices[0].message.content or ""
         try:
             filled_bundle = extract_json_from_text(raw_text)
         except json.JSONDecodeError as exc:
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 import tempfile
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Literal, Mapping, Sequence
 
+from . import json_compat
 from .check import check_file
 from .config import load_config
 from .embedding_model import EmbeddingItem, EmbeddingStore, save_embedding_store
@@ -27,6 +28,8 @@ from .status import _compute_module_status
 from .toon_parse import load_repository_ir
 from .toon_serialize import repository_ir_to_toon
 
+_BY_LINENO = attrgetter("lineno")
+
 
 class NeurocodeError(Exception):
     """Base exception for all NeuroCode library errors."""
@@ -174,7 +177,7 @@ class NeurocodeProject:
                     calls=ir.num_calls,
                     fresh=True,
                 )
-        ir = build_repository_ir(self.repo_root)
+        ir = build_repository_ir(self.repo_root, use_cache=True)
         # Ensure the serialized root reflects the current repo location (e.g., when a copy is made).
         ir.root = self.repo_root
         ir_path.write_text(repository_ir_to_toon(ir), encoding="utf-8")
@@ -230,7 +233,11 @@ class NeurocodeProject:
         provider: str | None = None,
         model: str | None = None,
         update: bool = False,
+        ascii_format: bool = False,
+        single_file: bool = False,
     ) -> None:
+        if ascii_format and single_file:
+            raise ConfigError("ascii_format and single_file are mutually exclusive")
         ir_path = self.repo_root / ".neurocode" / "ir.toon"
         if not ir_path.is_file():
             raise IRNotFoundError("IR not found; run build_ir first.")
@@ -245,7 +252,7 @@ class NeurocodeProject:
         except Exception as exc:
             raise ConfigError(str(exc)) from exc
         docs = build_embedding_documents(ir)
-        vectors = provider_obj.embed_batch([doc.text for doc in docs])
+        vectors = provider_obj.embed_unique([doc.text for doc in docs])
         if len(vectors) != len(docs):
             raise EmbeddingsNotFoundError("Provider returned mismatched embedding count")
         from . import __version__
@@ -286,7 +293,7 @@ class NeurocodeProject:
             for item in store.items:
                 merged[item.id] = item
             store.items = list(merged.values())
-        save_embedding_store(store, emb_path)
+        save_embedding_store(store, emb_path, ascii_format=ascii_format, single_file=single_file)
 
     # Explain -------------------------------------------------------------
     def explain_file(self, file: Path | str) -> ExplainResult:
@@ -295,13 +302,7 @@ class NeurocodeProject:
         module = _find_module_for_file(ir, self.repo_root, file_path)
         if module is None:
             raise IRNotFoundError(f"No module found for file {file_path}")
-        imports = sorted(
-            {
-                edge.imported_module
-                for edge in ir.module_import_edges
-                if edge.importer_module_id == module.id
-            }
-        )
+        imports = list(ir.imports_by_importer().get(module.id, ()))
         functions = [
             {
                 "name": fn.name,
@@ -310,7 +311,7 @@ class NeurocodeProject:
                 "num_calls": len(fn.calls),
             }
             for fn in sorted(
-                [f for f in module.functions if f.kind != "module"], key=lambda f: f.lineno
+                [f for f in module.functions if f.kind != "module"], key=_BY_LINENO
             )
         ]
         classes = [
@@ -320,7 +321,7 @@ class NeurocodeProject:
                 "lineno": cls.lineno,
                 "methods": [m.qualified_name for m in cls.methods],
             }
-            for cls in sorted(module.classes, key=lambda c: c.lineno)
+            for cls in sorted(module.classes, key=_BY_LINENO)
         ]
         return ExplainResult(
             repo_root=self.repo_root,
@@ -455,8 +456,8 @@ class NeurocodeProject:
         show_diff: bool = False,
     ) -> PatchApplyResult:
         plan_data = plan.data if isinstance(plan, PatchPlan) else plan
-        with tempfile.NamedTemporaryFile(mode="w+", suffix=".json", delete=False) as tmp:
-            json.dump(plan_data, tmp)
+        with tempfile.NamedTemporaryFile(mode="wb", suffix=".json", delete=False) as tmp:
+            tmp.write(json_compat.dumps_bytes(plan_data))
             tmp_path = Path(tmp.name)
         try:
             file_rel = plan_data.get("file")
@@ -468,6 +469,8 @@ class NeurocodeProject:
                 tmp_path,
                 dry_run=dry_run,
                 show_diff=show_diff or dry_run,
+                # The temp file is unlinked below; caching its plan would only pin a dead entry.
+                use_plan_cache=False,
             )
         except RuntimeError as exc:
             raise PatchPlanError(str(exc)) from exc
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import ast
+import json
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 
 from .config import Config, load_config
-from .explain import _find_module_for_file, _find_repo_root_for_file
-from .ir_build import compute_file_hash
+from .explain import _find_module_for_file, _find_repo_root_for_file, _staleness_warning
 from .ir_model import FunctionIR, ModuleIR, RepositoryIR
 from .toon_parse import load_repository_ir
 
@@ -96,23 +96,24 @@ def check_file(
         )
 
     cfg = config or Config()
+    enabled = cfg.enabled_checks
 
     results: List[CheckResult] = []
-    if "UNUSED_IMPORT" in cfg.enabled_checks:
+    if "UNUSED_IMPORT" in enabled:
         results.extend(_check_unused_imports(module, file, cfg))
-    if "UNUSED_FUNCTION" in cfg.enabled_checks:
+    if "UNUSED_FUNCTION" in enabled:
         results.extend(_check_functions_without_callers(ir, module, file, cfg))
-    if "HIGH_FANOUT" in cfg.enabled_checks:
+    if "HIGH_FANOUT" in enabled:
         results.extend(_check_high_fanout_functions(ir, module, file, cfg))
-    if "UNUSED_PARAM" in cfg.enabled_checks:
+    if "UNUSED_PARAM" in enabled:
         results.extend(_check_unused_params(repo_root, module, file, cfg))
-    if "LONG_FUNCTION" in cfg.enabled_checks:
+    if "LONG_FUNCTION" in enabled:
         results.extend(_check_long_functions(repo_root, module, file, cfg))
-    if "CALL_CYCLE" in cfg.enabled_checks:
+    if "CALL_CYCLE" in enabled:
         results.extend(_check_call_cycles(ir, module, file, cfg))
-    if "UNUSED_RETURN" in cfg.enabled_checks:
+    if "UNUSED_RETURN" in enabled:
         results.extend(_check_unused_returns(ir, module, file, cfg))
-    if "IMPORT_CYCLE" in cfg.enabled_checks:
+    if "IMPORT_CYCLE" in enabled:
         results.extend(_check_import_cycles(ir, module, file, cfg))
     return results
 
@@ -136,6 +137,7 @@ def _check_unused_params(
     except SyntaxError:
         return []
 
+    severity = config.severity_for("UNUSED_PARAM", "INFO")
     results: List[CheckResult] = []
 
     for node in ast.walk(tree):
@@ -153,7 +155,7 @@ def _check_unused_params(
                 results.append(
                     CheckResult(
                         code="UNUSED_PARAM",
-                        severity=config.severity_for("UNUSED_PARAM", "INFO"),
+                        severity=severity,
                         message=(
                             f"Parameter '{param}' in {module.module_name}.{node.name} "
                             "is never used"
@@ -187,6 +189,7 @@ def _check_long_functions(
     except SyntaxError:
         return []
 
+    severity = config.severity_for("LONG_FUNCTION", "INFO")
     results: List[CheckResult] = []
     threshold = config.long_function_threshold
     for node in ast.walk(tree):
@@ -200,7 +203,7 @@ def _check_long_functions(
             results.append(
                 CheckResult(
                     code="LONG_FUNCTION",
-                    severity=config.severity_for("LONG_FUNCTION", "INFO"),
+                    severity=severity,
                     message=(
                         f"{module.module_name}.{node.name} is {length} lines long "
                         f"(threshold {threshold})"
@@ -225,12 +228,10 @@ def _check_call_cycles(
     # Build adjacency for functions in this module.
     local_fn_ids: Set[int] = {fn.id for fn in _module_functions(module)}
     adj: Dict[int, Set[int]] = {}
-    for edge in ir.call_edges:
-        if (
-            edge.caller_function_id in local_fn_ids
-            and edge.callee_function_id is not None
-        ):
-            adj.setdefault(edge.caller_function_id, set()).add(edge.callee_function_id)
+    columns = ir.call_edge_columns()
+    for caller, callee in zip(columns.caller_function_ids, columns.callee_function_ids):
+        if callee != -1 and caller in local_fn_ids:
+            adj.setdefault(caller, set()).add(callee)
 
     visited: Set[int] = set()
     stack: Set[int] = set()
@@ -257,6 +258,7 @@ def _check_call_cycles(
         return []
 
     fn_by_id: Dict[int, FunctionIR] = {fn.id: fn for fn in _module_functions(module)}
+    severity = config.severity_for("CALL_CYCLE", "WARNING")
     results: List[CheckResult] = []
     for cycle in cycles:
         names = [fn_by_id.get(fid).qualified_name for fid in cycle if fn_by_id.get(fid)]
@@ -267,7 +269,7 @@ def _check_call_cycles(
         results.append(
             CheckResult(
                 code="CALL_CYCLE",
-                severity=config.severity_for("CALL_CYCLE", "WARNING"),
+                severity=severity,
                 message=message,
                 file=file,
                 module=module.module_name,
@@ -287,15 +289,13 @@ def _check_import_cycles(
     """Detect import cycles at the module level (simple DFS)."""
 
     # Build adjacency of module imports.
-    adj: Dict[str, Set[str]] = {}
-    for edge in ir.module_import_edges:
-        importer = next(
-            (m.module_name for m in ir.modules if m.id == edge.importer_module_id),
-            None,
-        )
-        if importer is None:
-            continue
-        adj.setdefault(importer, set()).add(edge.imported_module)
+    adj: Dict[str, Tuple[str, ...]] = {}
+    modules_by_id = ir.modules_by_id()
+    for importer_id, imported in ir.imports_by_importer().items():
+        importer_module = modules_by_id.get(importer_id)
+        if importer_module is not None:
+            name = importer_module.module_name
+            adj[name] = adj.get(name, ()) + imported
 
     visited: Set[str] = set()
     stack: Set[str] = set()
@@ -310,7 +310,7 @@ def _check_import_cycles(
             return
         visited.add(node)
         stack.add(node)
-        for nxt in adj.get(node, set()):
+        for nxt in adj.get(node, ()):
             dfs(nxt, path + [nxt])
         stack.remove(node)
 
@@ -319,13 +319,14 @@ def _check_import_cycles(
     if not cycles:
         return []
 
+    severity = config.severity_for("IMPORT_CYCLE", "WARNING")
     results: List[CheckResult] = []
     for cycle in cycles:
         message = "Import cycle detected: " + " -> ".join(cycle)
         results.append(
             CheckResult(
                 code="IMPORT_CYCLE",
-                severity=config.severity_for("IMPORT_CYCLE", "WARNING"),
+                severity=severity,
                 message=message,
                 file=file,
                 module=module.module_name,
@@ -343,15 +344,10 @@ def _check_unused_returns(
     """Detect functions whose return values are never used (heuristic)."""
 
     fn_ids_in_module: Set[int] = {fn.id for fn in _module_functions(module)}
-    used_returns: Set[int] = set()
-
-    for edge in ir.call_edges:
-        if edge.callee_function_id is None:
-            continue
-        # If caller is in module and callee is tracked, mark used.
-        if edge.callee_function_id in fn_ids_in_module:
-            used_returns.add(edge.callee_function_id)
+    # A tracked function in this module counts as "used" once any edge resolves to it.
+    used_returns: Set[int] = fn_ids_in_module.intersection(ir.call_edge_columns().callee_function_ids)
 
+    severity = config.severity_for("UNUSED_RETURN", "INFO")
     results: List[CheckResult] = []
     for fn in _module_functions(module):
         if fn.id in used_returns:
@@ -370,7 +366,7 @@ def _check_unused_returns(
         results.append(
             CheckResult(
                 code="UNUSED_RETURN",
-                severity=config.severity_for("UNUSED_RETURN", "INFO"),
+                severity=severity,
                 message=message,
                 file=file,
                 module=module.module_name,
@@ -388,8 +384,6 @@ def _render_results(
 ) -> tuple[str, int]:
     warnings = warnings or []
     if output_format == "json":
-        import json
-
         diagnostics = [
             {
                 "code": r.code,
@@ -459,19 +453,6 @@ def _build_status(
     )
 
 
-def _staleness_warning(module: ModuleIR, repo_root: Path) -> str | None:
-    if not module.file_hash:
-        return None
-    curr_path = (repo_root / module.path).resolve()
-    try:
-        current_hash = compute_file_hash(curr_path)
-    except OSError:
-        return f"module file missing on disk: {curr_path}"
-    if current_hash != module.file_hash:
-        return f"IR hash for {module.module_name} is stale; file changed on disk"
-    return None
-
-
 # ---------------------------------------------------------------------------
 # Individual checks
 # ---------------------------------------------------------------------------
@@ -497,6 +478,7 @@ def _check_unused_imports(
             for i in range(1, len(parts) + 1):
                 used_symbols.add(".".join(parts[:i]))
 
+    severity = config.severity_for("UNUSED_IMPORT", "WARNING")
     results: List[CheckResult] = []
 
     for imp in module.imports:
@@ -534,7 +516,7 @@ def _check_unused_imports(
         results.append(
             CheckResult(
                 code="UNUSED_IMPORT",
-                severity=config.severity_for("UNUSED_IMPORT", "WARNING"),
+                severity=severity,
                 message=message,
                 file=file,
                 module=module.module_name,
@@ -556,11 +538,8 @@ def _check_functions_without_callers(
     that are used externally (e.g., via reflection or as public API).
     """
 
-    called_function_ids: Set[int] = {
-        edge.callee_function_id
-        for edge in ir.call_edges
-        if edge.callee_function_id is not None
-    }
+    called_function_ids: Set[int] = set(ir.call_edge_columns().callee_function_ids)
+    called_function_ids.discard(-1)
 
     def should_ignore(fn: FunctionIR) -> bool:
         name = fn.name
@@ -573,6 +552,7 @@ def _check_functions_without_callers(
             return True
         return False
 
+    severity = config.severity_for("UNUSED_FUNCTION", "INFO")
     results: List[CheckResult] = []
 
     for fn in _module_functions(module):
@@ -585,7 +565,7 @@ def _check_functions_without_callers(
             results.append(
                 CheckResult(
                     code="UNUSED_FUNCTION",
-                    severity=config.severity_for("UNUSED_FUNCTION", "INFO"),
+                    severity=severity,
                     message=message,
                     file=file,
                     module=module.module_name,
@@ -625,6 +605,7 @@ def _check_high_fanout_functions(
             key = f"name:{edge.target}"
         targets_by_fn.setdefault(caller_fn_id, set()).add(key)
 
+    severity = config.severity_for("HIGH_FANOUT", "INFO")
     results: List[CheckResult] = []
 
     for fn in _module_functions(module):
@@ -636,7 +617,7 @@ def _check_high_fanout_functions(
             results.append(
                 CheckResult(
                     code="HIGH_FANOUT",
-                    severity=config.severity_for("HIGH_FANOUT", "INFO"),
+                    severity=severity,
                     message=message,
                     file=file,
                     module=module.module_name,
@@ -2,6 +2,7 @@ import argparse
 import sys
 from pathlib import Path
 
+from . import json_compat
 from .api import NeurocodeError, NeurocodeProject, open_project
 from .check import check_file_from_disk
 from .explain import explain_file_from_disk
@@ -225,6 +226,17 @@ def main() -> None:
         action="store_true",
         help="Merge with existing .neurocode/ir-embeddings.toon if present",
     )
+    vector_layout_group = embed_parser.add_mutually_exclusive_group()
+    vector_layout_group.add_argument(
+        "--ascii",
+        action="store_true",
+        help="Keep vectors inline in the TOON file instead of the binary .npy sidecar",
+    )
+    vector_layout_group.add_argument(
+        "--single-file",
+        action="store_true",
+        help="Keep vectors inline in the TOON file as packed base64 float32 (no .npy sidecar)",
+    )
     embed_parser.add_argument(
         "--format",
         choices=["text", "json"],
@@ -396,9 +408,7 @@ def main() -> None:
         try:
             project = open_project(file_path)
             if args.plan:
-                import json
-
-                plan_data = json.loads(Path(args.plan).read_text(encoding="utf-8"))
+                plan_data = json_compat.loads(Path(args.plan).read_bytes())
                 apply_result = project.apply_patch_plan(
                     plan_data,
                     dry_run=args.dry_run,
@@ -533,6 +543,8 @@ def main() -> None:
                 provider=args.provider,
                 model=args.model,
                 update=args.update,
+                ascii_format=args.ascii,
+                single_file=args.single_file,
             )
             emb_path = project.repo_root / ".neurocode" / "ir-embeddings.toon"
             if args.format == "json":
@@ -627,9 +639,7 @@ def main() -> None:
             sys.exit(1)
 
         if args.format == "json":
-            import json
-
-            print(json.dumps(bundle, indent=2))
+            print(json_compat.dumps(bundle))
         else:
             target = bundle.get("target")
             checks = bundle.get("checks", [])
@@ -670,9 +680,7 @@ def main() -> None:
             sys.exit(1)
 
         if args.format == "json":
-            import json
-
-            print(json.dumps(bundle, indent=2))
+            print(json_compat.dumps(bundle))
         else:
             ops = bundle.get("operations", [])
             target = bundle.get("target")
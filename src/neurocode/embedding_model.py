@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import ast
+import base64
+import re
+import sys
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 
 def _escape_value(value: str) -> str:
@@ -37,16 +42,18 @@ def _parse_row(line: str) -> List[str]:
     return fields
 
 
-def _parse_table_header(line: str) -> tuple[str, List[str]]:
-    line = line.strip()
-    name_part, rest = line.split("[", 1)
-    name = name_part.strip()
-    _, rest_after_bracket = rest.split("]", 1)
-    brace_start = rest_after_bracket.index("{")
-    brace_end = rest_after_bracket.index("}")
-    fields_str = rest_after_bracket[brace_start + 1 : brace_end]
-    fields = [field.strip() for field in fields_str.split(",") if field.strip()]
-    return name, fields
+_TABLE_HEADER_RE = re.compile(r"(\w+)\[(\d*)\]\{([^}]*)\}:")
+_HEADER_KV_RE = re.compile(r"\s+(\w+):(.*)")
+
+
+def _parse_table_header(line: str) -> tuple[str, List[str]] | None:
+    """Parse a table header like ``items[3]{a,b,c}:``; return ``None`` for other lines."""
+
+    match = _TABLE_HEADER_RE.fullmatch(line)
+    if match is None:
+        return None
+    fields = [name.strip() for name in match.group(3).split(",") if name.strip()]
+    return match.group(1), fields
 
 
 @dataclass
@@ -72,6 +79,7 @@ class EmbeddingStore:
     created_at: str
     repo_root: Path
     items: List[EmbeddingItem] = field(default_factory=list)
+    embeddings_file: str | None = None  # columnar sidecar relative to the store file
 
     @classmethod
     def new(
@@ -93,85 +101,111 @@ class EmbeddingStore:
         )
 
 
-def embedding_store_to_toon(store: EmbeddingStore) -> str:
-    lines: List[str] = []
-    lines.append("store:")
-    lines.append(f"  version: {store.version}")
-    lines.append(f"  engine_version: {store.engine_version}")
-    lines.append(f"  model: {store.model}")
-    lines.append(f"  provider: {store.provider}")
-    lines.append(f"  created_at: {store.created_at}")
-    lines.append(f"  repo_root: {store.repo_root}")
-    lines.append(f"  num_items: {len(store.items)}")
-    lines.append("")
-
-    lines.append(
-        "items[{n}]{{kind,id,module,name,file,lineno,signature,docstring,text,embedding}}:".format(
-            n=len(store.items)
-        )
-    )
+def _pack_vector(vec: List[float]) -> str:
+    values = array("f", vec)
+    if sys.byteorder == "big":  # pragma: no cover - platform dependent
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _unpack_vector(blob: str) -> List[float]:
+    values = array("f", base64.b64decode(blob))
+    if sys.byteorder == "big":  # pragma: no cover - platform dependent
+        values.byteswap()
+    return values.tolist()
+
+
+def iter_toon_lines(
+    store: EmbeddingStore,
+    *,
+    embeddings_file: str | None = None,
+    packed: bool = False,
+) -> Iterator[str]:
+    """Yield the TOON document for ``store`` line by line (newline-terminated).
+
+    Lets callers stream large stores to disk without materializing the whole
+    text in memory. When ``embeddings_file`` is given, vectors are expected to
+    live in that columnar sidecar and the ``embedding`` column is omitted.
+    With ``packed=True`` each vector is written as one base64 float32 cell
+    (``embedding_b64``) instead of pipe-separated decimals.
+    """
+
+    yield "store:\n"
+    yield f"  version: {store.version}\n"
+    yield f"  engine_version: {store.engine_version}\n"
+    yield f"  model: {store.model}\n"
+    yield f"  provider: {store.provider}\n"
+    yield f"  created_at: {store.created_at}\n"
+    yield f"  repo_root: {store.repo_root}\n"
+    yield f"  num_items: {len(store.items)}\n"
+    if embeddings_file is not None:
+        yield f"  embeddings_file: {embeddings_file}\n"
+    yield "\n"
+
+    columns = "kind,id,module,name,file,lineno,signature,docstring,text"
+    if embeddings_file is None:
+        columns += ",embedding_b64" if packed else ",embedding"
+    yield f"items[{len(store.items)}]{{{columns}}}:\n"
     for item in store.items:
-        emb_str = "|".join(f"{v:.6f}" for v in item.embedding)
         doc = "" if item.docstring is None else item.docstring
-        row = ",".join(
-            [
-                _escape_value(item.kind),
-                _escape_value(item.id),
-                _escape_value(item.module),
-                _escape_value(item.name),
-                _escape_value(item.file),
-                str(item.lineno),
-                _escape_value(item.signature),
-                _escape_value(doc),
-                _escape_value(item.text),
-                _escape_value(emb_str),
-            ]
-        )
-        lines.append(f"  {row}")
-    lines.append("")
-    return "\n".join(lines)
+        values = [
+            _escape_value(item.kind),
+            _escape_value(item.id),
+            _escape_value(item.module),
+            _escape_value(item.name),
+            _escape_value(item.file),
+            str(item.lineno),
+            _escape_value(item.signature),
+            _escape_value(doc),
+            _escape_value(item.text),
+        ]
+        if embeddings_file is None and packed:
+            values.append(_pack_vector(item.embedding))
+        elif embeddings_file is None:
+            values.append(_escape_value("|".join(f"{v:.6f}" for v in item.embedding)))
+        yield f"  {','.join(values)}\n"
+
+
+def embedding_store_to_toon(store: EmbeddingStore) -> str:
+    return "".join(iter_toon_lines(store))
 
 
-def embedding_store_from_toon(text: str) -> EmbeddingStore:
-    lines = text.splitlines()
-    in_header = False
+def embedding_store_from_toon(text: str, base_dir: Path | None = None) -> EmbeddingStore:
+    """Parse a TOON embedding store.
+
+    Stores whose header names an ``embeddings_file`` keep their vectors in that
+    sidecar; it is resolved against ``base_dir``, and omitting ``base_dir`` for
+    such a store raises ``ValueError`` rather than returning empty vectors.
+    """
+
     current_table: str | None = None
     current_fields: List[str] = []
     tables: dict[str, List[dict[str, str]]] = {}
     header: dict[str, str] = {}
 
-    for raw in lines:
-        line = raw.rstrip("\n")
-        stripped = line.strip()
-
-        if not stripped:
-            if in_header:
-                in_header = False
-            continue
-
-        if stripped == "store:":
-            in_header = True
-            current_table = None
+    for raw in text.splitlines():
+        line = raw.rstrip()
+        if not line:
             continue
 
-        if in_header and ":" in stripped and not stripped.startswith("items"):
-            key, value = stripped.split(":", 1)
-            header[key.strip()] = value.strip()
+        table_header = _parse_table_header(line)
+        if table_header is not None:
+            current_table, current_fields = table_header
+            tables.setdefault(current_table, [])
             continue
 
-        if not line.startswith(" ") and "[" in line and "{" in line and line.endswith(":"):
-            table_name, fields = _parse_table_header(line)
-            current_table = table_name
-            current_fields = fields
-            tables.setdefault(table_name, [])
+        if current_table is None:
+            # Everything before the first table belongs to the ``store:`` header.
+            match = _HEADER_KV_RE.fullmatch(line)
+            if match is not None:
+                header[match.group(1)] = match.group(2).strip()
             continue
 
-        if current_table is not None and line.startswith(" "):
-            values = _parse_row(line.strip())
-            row: dict[str, str] = {}
-            for i, field in enumerate(current_fields):
-                row[field] = values[i] if i < len(values) else ""
-            tables[current_table].append(row)
+        values = _parse_row(line.strip())
+        row: dict[str, str] = {}
+        for i, name in enumerate(current_fields):
+            row[name] = values[i] if i < len(values) else ""
+        tables[current_table].append(row)
 
     if "repo_root" not in header:
         raise ValueError("TOON embedding store missing repo_root")
@@ -184,13 +218,17 @@ def embedding_store_from_toon(text: str) -> EmbeddingStore:
         created_at=header.get("created_at", ""),
         repo_root=Path(header["repo_root"]),
         items=[],
+        embeddings_file=header.get("embeddings_file") or None,
     )
 
     items_table = tables.get("items", [])
     for row in items_table:
+        emb_packed = row.get("embedding_b64", "")
         emb_raw = _unescape_value(row.get("embedding", ""))
         emb = []
-        if emb_raw:
+        if emb_packed:
+            emb = _unpack_vector(emb_packed)
+        elif emb_raw:
             emb = [float(v) for v in emb_raw.split("|") if v]
         doc = _unescape_value(row.get("docstring", ""))
         item = EmbeddingItem(
@@ -206,13 +244,112 @@ def embedding_store_from_toon(text: str) -> EmbeddingStore:
             embedding=emb,
         )
         store.items.append(item)
+
+    if store.embeddings_file:
+        if base_dir is None:
+            raise ValueError(
+                f"embedding vectors are stored in {store.embeddings_file}; "
+                "pass base_dir or use load_embedding_store()"
+            )
+        vectors = _read_npy_matrix(base_dir / store.embeddings_file)
+        if len(vectors) != len(store.items):
+            raise ValueError(
+                f"{store.embeddings_file} holds {len(vectors)} vectors but the store has {len(store.items)} items"
+            )
+        for item, vec in zip(store.items, vectors):
+            item.embedding = vec
     return store
 
 
-def load_embedding_store(path: Path) -> EmbeddingStore:
-    text = path.read_text(encoding="utf-8")
-    return embedding_store_from_toon(text)
+def _write_npy_matrix(path: Path, vectors: List[List[float]], dim: int) -> None:
+    """Write ``vectors`` as a little-endian float32 ``.npy`` matrix (no numpy required)."""
+
+    values = array("f")
+    for vec in vectors:
+        values.extend(vec)
+    if sys.byteorder == "big":  # pragma: no cover - platform dependent
+        values.byteswap()
+    header = f"{{'descr': '<f4', 'fortran_order': False, 'shape': ({len(vectors)}, {dim}), }}"
+    # Magic (6) + version (2) + header length (2) + header must be 64-byte aligned.
+    padding = 64 - (10 + len(header) + 1) % 64
+    header = header + " " * (padding % 64) + "\n"
+    with path.open("wb") as fh:
+        fh.write(b"\x93NUMPY\x01\x00")
+        fh.write(len(header).to_bytes(2, "little"))
+        fh.write(header.encode("latin1"))
+        values.tofile(fh)
+
+
+def _read_npy_matrix(path: Path) -> List[List[float]]:
+    """Read a float32 matrix written by ``_write_npy_matrix``.
+
+    The file is read in one ``array.fromfile`` call, not memory-mapped: items
+    carry their vectors as ``List[float]``, so the rows are materialized here.
+    """
+
+    with path.open("rb") as fh:
+        if fh.read(6) != b"\x93NUMPY":
+            raise ValueError(f"{path} is not a .npy file")
+        version = fh.read(2)
+        if len(version) != 2:
+            raise ValueError(f"{path} is truncated")
+        len_size = 2 if version[0] == 1 else 4
+        raw_len = fh.read(len_size)
+        if len(raw_len) != len_size:
+            raise ValueError(f"{path} is truncated")
+        header_len = int.from_bytes(raw_len, "little")
+        raw_header = fh.read(header_len)
+        if len(raw_header) != header_len:
+            raise ValueError(f"{path} is truncated")
+        header = ast.literal_eval(raw_header.decode("latin1"))
+        if header.get("descr") != "<f4" or header.get("fortran_order"):
+            raise ValueError(f"{path} must hold a C-ordered little-endian float32 matrix")
+        rows, dim = header["shape"]
+        values = array("f")
+        try:
+            values.fromfile(fh, rows * dim)
+        except EOFError:
+            raise ValueError(f"{path} is truncated") from None
+    if sys.byteorder == "big":  # pragma: no cover - platform dependent
+        values.byteswap()
+    return [values[i * dim : (i + 1) * dim].tolist() for i in range(rows)]
+
+
+def _embeddings_path(path: Path) -> Path:
+    return path.with_suffix(".npy")
 
 
-def save_embedding_store(store: EmbeddingStore, path: Path) -> None:
-    path.write_text(embedding_store_to_toon(store), encoding="utf-8")
+def load_embedding_store(path: Path) -> EmbeddingStore:
+    text = path.read_text(encoding="utf-8")
+    return embedding_store_from_toon(text, base_dir=path.parent)
+
+
+def save_embedding_store(
+    store: EmbeddingStore,
+    path: Path,
+    *,
+    ascii_format: bool = False,
+    single_file: bool = False,
+) -> None:
+    """Persist ``store`` at ``path``.
+
+    By default metadata is written as TOON and the vectors as a columnar
+    float32 ``.npy`` sidecar next to it. ``single_file=True`` keeps the vectors
+    inline as packed base64 float32 cells, and ``ascii_format=True`` keeps them
+    inline as human-readable decimals. The two inline layouts are mutually exclusive.
+    """
+
+    if ascii_format and single_file:
+        raise ValueError("ascii_format and single_file are mutually exclusive")
+
+    npy_path = _embeddings_path(path)
+    dims = {len(item.embedding) for item in store.items}
+    if not ascii_format and not single_file and len(dims) == 1 and 0 not in dims:
+        _write_npy_matrix(npy_path, [item.embedding for item in store.items], dims.pop())
+        embeddings_file: str | None = npy_path.name
+    else:
+        embeddings_file = None
+        if npy_path.exists():
+            npy_path.unlink()
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+        fh.writelines(iter_toon_lines(store, embeddings_file=embeddings_file, packed=not ascii_format))
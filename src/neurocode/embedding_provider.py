@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import atexit
+import base64
 import hashlib
+import sys
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Sequence
+from array import array
+from typing import Any, Dict, List, Sequence
+
+from . import json_compat
+
+try:  # optional pooled HTTP client
+    import httpx  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - depends on installed extras
+    httpx = None  # type: ignore[assignment]
 
 
 class EmbeddingProvider(ABC):
@@ -12,6 +24,21 @@ class EmbeddingProvider(ABC):
     def embed_batch(self, texts: Sequence[str]) -> List[List[float]]:
         """Return embeddings for each text in order."""
 
+    def embed_unique(self, texts: Sequence[str]) -> List[List[float]]:
+        """Like ``embed_batch`` but sends each distinct text to the provider only once.
+
+        Duplicate texts get equal but separate vector lists. If the provider
+        returns an unexpected number of vectors they are passed through unchanged
+        so callers can detect the mismatch.
+        """
+
+        slot_by_text: Dict[str, int] = {}
+        slots = [slot_by_text.setdefault(text, len(slot_by_text)) for text in texts]
+        vectors = self.embed_batch(list(slot_by_text))
+        if len(vectors) != len(slot_by_text):
+            return vectors
+        return [list(vectors[slot]) for slot in slots]
+
 
 class DummyEmbeddingProvider(EmbeddingProvider):
     """Deterministic, offline embeddings for testing and local/dev use only."""
@@ -40,13 +67,35 @@ class DummyEmbeddingProvider(EmbeddingProvider):
 
 
 class OpenAIEmbeddingProvider(EmbeddingProvider):
-    """Embedding provider backed by OpenAI-compatible API."""
-
-    def __init__(self, model: str, api_key: str, base_url: str | None = None, dim: int | None = None) -> None:
+    """Embedding provider backed by OpenAI-compatible API.
+
+    Uses a pooled keep-alive ``httpx`` client (HTTP/2 when ``h2`` is installed)
+    if ``httpx`` is available, otherwise falls back to ``urllib``. Unless one is
+    passed in, the client is shared per ``base_url`` across providers and holds
+    no credentials; the API key is sent with each request.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        api_key: str,
+        base_url: str | None = None,
+        dim: int | None = None,
+        http_client: Any | None = None,
+    ) -> None:
         self.model = model
         self.api_key = api_key
         self.base_url = base_url or "https://api.openai.com/v1/embeddings"
         self.dim = dim
+        self._client = http_client
+
+    def close(self) -> None:
+        """Drop this provider's reference to its HTTP client.
+
+        Shared clients stay open for other providers; see :func:`close_shared_http_clients`.
+        """
+
+        self._client = None
 
     @staticmethod
     def _normalize(vec: List[float]) -> List[float]:
@@ -55,44 +104,77 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             return vec
         return [v / norm for v in vec]
 
-    def embed_batch(self, texts: Sequence[str]) -> List[List[float]]:
-        import json
-        import time
-        import urllib.error
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+
+    def _get_client(self) -> Any | None:
+        if self._client is None and httpx is not None:
+            self._client = _shared_http_client(self.base_url)
+        return self._client
+
+    def _post(self, data: bytes) -> bytes:
+        client = self._get_client()
+        if client is not None:
+            resp = client.post(self.base_url, content=data, headers=self._headers())
+            resp.raise_for_status()
+            return resp.content
+
         import urllib.request
 
-        payload = {"model": self.model, "input": list(texts)}
-        data = json.dumps(payload).encode("utf-8")
         req = urllib.request.Request(
             self.base_url,
             data=data,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {self.api_key}",
-            },
+            headers=self._headers(),
             method="POST",
         )
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.read()
+
+    def embed_batch(self, texts: Sequence[str]) -> List[List[float]]:
+        import time
+        import urllib.error
+
+        retryable: tuple[type[Exception], ...] = (urllib.error.HTTPError, urllib.error.URLError, TimeoutError)
+        if httpx is not None:
+            retryable += (httpx.HTTPError,)
+
+        payload = {"model": self.model, "input": list(texts), "encoding_format": "base64"}
+        data = json_compat.dumps_bytes(payload)
         attempts = 0
         last_error: Exception | None = None
         while attempts < 3:
             attempts += 1
             try:
-                with urllib.request.urlopen(req, timeout=30) as resp:
-                    resp_data = resp.read()
-                parsed = json.loads(resp_data.decode("utf-8"))
-                embeddings = [item["embedding"] for item in parsed.get("data", [])]
+                resp_data = self._post(data)
+                parsed = json_compat.loads(resp_data)
+                embeddings = [_decode_embedding(item["embedding"]) for item in parsed.get("data", [])]
                 processed: List[List[float]] = []
                 for vec in embeddings:
                     if self.dim:
                         vec = vec[: self.dim]
-                    processed.append(self._normalize([float(v) for v in vec]))
+                    processed.append(self._normalize(vec))
                 return processed
-            except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError) as exc:
+            except retryable as exc:
                 last_error = exc
                 time.sleep(2**attempts * 0.1)
         raise RuntimeError(f"Failed to fetch embeddings from OpenAI: {last_error}") from last_error
 
 
+def _decode_embedding(raw: str | List[float]) -> List[float]:
+    """Decode an embedding returned as base64 float32 or as a plain JSON array."""
+
+    if isinstance(raw, str):
+        vec = array("f", base64.b64decode(raw))
+        if sys.byteorder == "big":  # pragma: no cover - platform dependent
+            vec.byteswap()
+        return vec.tolist()
+    # OpenAI-compatible servers may ignore encoding_format and send floats.
+    return [float(v) for v in raw]
+
+
 def _resolve_api_key(config, override: str | None) -> str | None:
     if override:
         return override
@@ -103,6 +185,36 @@ def _resolve_api_key(config, override: str | None) -> str | None:
     return os.getenv("OPENAI_API_KEY")
 
 
+# base_url -> pooled httpx client shared by every OpenAIEmbeddingProvider posting there.
+_SHARED_HTTP_CLIENTS: Dict[str, Any] = {}
+_SHARED_HTTP_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_http_client(base_url: str) -> Any:
+    with _SHARED_HTTP_CLIENTS_LOCK:
+        client = _SHARED_HTTP_CLIENTS.get(base_url)
+        if client is None:
+            try:
+                client = httpx.Client(http2=True, timeout=30.0)
+            except ImportError:  # pragma: no cover - h2 not installed
+                client = httpx.Client(timeout=30.0)
+            _SHARED_HTTP_CLIENTS[base_url] = client
+        return client
+
+
+def close_shared_http_clients() -> None:
+    """Close the pooled HTTP clients shared by OpenAI providers; called at interpreter exit."""
+
+    with _SHARED_HTTP_CLIENTS_LOCK:
+        clients = list(_SHARED_HTTP_CLIENTS.values())
+        _SHARED_HTTP_CLIENTS.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_shared_http_clients)
+
+
 def make_embedding_provider(
     config,
     *,
@@ -137,7 +249,6 @@ def make_embedding_provider(
                 "OpenAI provider requires an API key (set embedding.api_key in config or OPENAI_API_KEY)."
             )
         base_url = getattr(config, "embedding_base_url", None)
-        provider = OpenAIEmbeddingProvider(model=model_name, api_key=api_key, base_url=base_url)
-        return provider, provider_name, model_name
+        return OpenAIEmbeddingProvider(model=model_name, api_key=api_key, base_url=base_url), provider_name, model_name
 
     raise RuntimeError(f"Unknown embedding provider: {provider_name}")
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Dict, List
 
 from .ir_model import FunctionIR, RepositoryIR
 
+_BY_LINENO = attrgetter("lineno")
+
 
 @dataclass
 class EmbeddingDocument:
@@ -41,7 +44,7 @@ def build_embedding_documents(repository_ir: RepositoryIR) -> List[EmbeddingDocu
     for module in sorted(repository_ir.modules, key=lambda m: m.module_name):
         for fn in sorted(
             [f for f in module.functions if f.kind != "module"],
-            key=lambda f: f.lineno,
+            key=_BY_LINENO,
         ):
             signature = fn.signature or f"def {fn.qualified_name}(...)"  # fallback if missing
             docstring = fn.docstring
@@ -1,24 +1,46 @@
 from __future__ import annotations
 
+import io
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Tuple
 
-from .ir_build import compute_file_hash
+from . import json_compat
+from .ir_build import cached_file_hash
 from .ir_model import FunctionIR, ModuleIR, RepositoryIR
 from .toon_parse import load_repository_ir
 
+_BY_LINENO = attrgetter("lineno")
+_realpath = lru_cache(maxsize=4096)(os.path.realpath)
+
+
+# resolved parent directory -> repository root that contained `.neurocode/ir.toon`
+_REPO_ROOT_CACHE: Dict[Path, Path] = {}
+_REPO_ROOT_CACHE_SIZE = 1024
+
 
 def _find_repo_root_for_file(file_path: Path) -> Path | None:
     """Find the repository root for a file by looking for `.neurocode/ir.toon`.
 
     Walks upward from the file's parent directory until it finds a directory
     containing `.neurocode/ir.toon`. Returns that directory, or ``None`` if not found.
+    Hits are memoized per directory and re-validated with a single ``is_file()``;
+    misses are not cached so a later `neurocode ir` run is picked up.
     """
 
     current = file_path.resolve().parent
+    cached = _REPO_ROOT_CACHE.get(current)
+    if cached is not None and (cached / ".neurocode" / "ir.toon").is_file():
+        return cached
     for directory in (current, *current.parents):
         ir_file = directory / ".neurocode" / "ir.toon"
         if ir_file.is_file():
+            if len(_REPO_ROOT_CACHE) >= _REPO_ROOT_CACHE_SIZE:
+                _REPO_ROOT_CACHE.clear()
+            _REPO_ROOT_CACHE[current] = directory
             return directory
     return None
 
@@ -39,92 +61,198 @@ def _find_module_for_file(ir: RepositoryIR, root: Path, file_path: Path) -> Modu
     except ValueError:
         rel_path = None
 
-    for module in ir.modules:
-        if rel_path is not None and module.path == rel_path:
+    if rel_path is not None:
+        module = ir.modules_by_path().get(rel_path)
+        if module is not None:
             return module
-        if (root / module.path).resolve() == file_path:
+
+    # Fallback for paths that only match after resolving (e.g. symlinks).
+    root_str = os.fspath(root)
+    file_str = os.fspath(file_path)
+    for module in ir.modules:
+        if _realpath(os.path.join(root_str, module.path)) == file_str:
             return module
     return None
 
 
-def _explain_module_json(ir: RepositoryIR, module: ModuleIR, warning: str | None = None) -> str:
-    """Return a JSON string summarizing the module using the IR."""
+_CALL_FIELDS = ("lineno", "target", "resolved_callee")
 
-    import json
 
-    fn_by_id: Dict[int, FunctionIR] = {}
-    for m in ir.modules:
-        for fn in m.functions:
-            fn_by_id[fn.id] = fn
+@dataclass
+class CallColumns:
+    """Call edges of one function stored column-wise (one list per field).
 
-    imports = sorted(
-        {
-            edge.imported_module
-            for edge in ir.module_import_edges
-            if edge.importer_module_id == module.id
-        }
+    ``resolved_callees[i]`` is the callee's qualified name when known.
+    """
+
+    linenos: List[int] = field(default_factory=list)
+    targets: List[str] = field(default_factory=list)
+    resolved_callees: List[str | None] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.linenos)
+
+    def rows(self) -> Iterator[Tuple[int, str, str | None]]:
+        return zip(self.linenos, self.targets, self.resolved_callees)
+
+
+@dataclass
+class FunctionView:
+    name: str
+    qualified_name: str
+    lineno: int
+    calls: CallColumns = field(default_factory=CallColumns)
+
+
+@dataclass
+class ClassView:
+    name: str
+    qualified_name: str
+    lineno: int
+    base_names: List[str] = field(default_factory=list)
+    methods: List[FunctionView] = field(default_factory=list)
+
+
+@dataclass
+class ModuleView:
+    """Renderer-neutral snapshot of a module, collected in a single IR traversal."""
+
+    module_name: str
+    path: Path
+    imports: Tuple[str, ...]
+    classes: List[ClassView]
+    functions: List[FunctionView]
+
+
+def _collect_module_view(ir: RepositoryIR, module: ModuleIR) -> ModuleView:
+    """Walk ``module`` once, resolving call edges through the cached IR indexes."""
+
+    fn_by_id = ir.functions_by_id()
+    edges_by_caller = ir.call_edges_by_caller()
+
+    def resolve(cid: int | None) -> str | None:
+        callee = fn_by_id.get(cid) if cid is not None else None
+        return callee.qualified_name if callee else None
+
+    def function_view(fn: FunctionIR) -> FunctionView:
+        edges = edges_by_caller.get(fn.id, ())
+        calls = CallColumns(
+            [edge.lineno for edge in edges],
+            [edge.target for edge in edges],
+            [resolve(edge.callee_function_id) for edge in edges],
+        )
+        return FunctionView(fn.name, fn.qualified_name, fn.lineno, calls)
+
+    classes = [
+        ClassView(
+            cls.name,
+            cls.qualified_name,
+            cls.lineno,
+            cls.base_names,
+            [function_view(m) for m in sorted(cls.methods, key=_BY_LINENO)],
+        )
+        for cls in sorted(module.classes, key=_BY_LINENO)
+    ]
+    functions = [
+        function_view(fn)
+        for fn in ir.functions_by_module().get(module.id, ())
+        if fn.parent_class_id is None
+    ]
+    return ModuleView(
+        module_name=module.module_name,
+        path=module.path,
+        imports=ir.imports_by_importer().get(module.id, ()),
+        classes=classes,
+        functions=functions,
     )
 
-    def call_edges_for(fn: FunctionIR) -> List[dict]:
-        edges = [
-            edge for edge in ir.call_edges if edge.caller_function_id == fn.id
-        ]
-        edges_sorted = sorted(edges, key=lambda e: e.lineno)
-        items: List[dict] = []
-        for edge in edges_sorted:
-            callee = fn_by_id.get(edge.callee_function_id) if edge.callee_function_id is not None else None
-            items.append(
-                {
-                    "lineno": edge.lineno,
-                    "target": edge.target,
-                    "resolved_callee": callee.qualified_name if callee else None,
-                }
-            )
-        return items
-
-    classes_payload: List[dict] = []
-    for cls in sorted(module.classes, key=lambda c: c.lineno):
-        classes_payload.append(
+
+def _explain_module_json(view: ModuleView, warning: str | None = None) -> str:
+    """Return a JSON string summarizing the module view."""
+
+    def function_payload(fn: FunctionView) -> dict:
+        return {
+            "name": fn.name,
+            "qualified_name": fn.qualified_name,
+            "lineno": fn.lineno,
+            "calls": [dict(zip(_CALL_FIELDS, row)) for row in fn.calls.rows()],
+        }
+
+    payload = {
+        "module": view.module_name,
+        "path": str(view.path),
+        "imports": view.imports,
+        "classes": [
             {
                 "name": cls.name,
                 "qualified_name": cls.qualified_name,
                 "lineno": cls.lineno,
                 "base_names": cls.base_names,
-                "methods": [
-                    {
-                        "name": m.name,
-                        "qualified_name": m.qualified_name,
-                        "lineno": m.lineno,
-                        "calls": call_edges_for(m),
-                    }
-                    for m in sorted(cls.methods, key=lambda f: f.lineno)
-                ],
+                "methods": [function_payload(m) for m in cls.methods],
             }
-        )
-
-    functions_payload: List[dict] = []
-    for fn in sorted(
-        [f for f in module.functions if f.parent_class_id is None and f.kind != "module"],
-        key=lambda f: f.lineno,
-    ):
-        functions_payload.append(
-            {
-                "name": fn.name,
-                "qualified_name": fn.qualified_name,
-                "lineno": fn.lineno,
-                "calls": call_edges_for(fn),
-            }
-        )
-
-    payload = {
-        "module": module.module_name,
-        "path": str(module.path),
-        "imports": imports,
-        "classes": classes_payload,
-        "functions": functions_payload,
+            for cls in view.classes
+        ],
+        "functions": [function_payload(fn) for fn in view.functions],
         "warning": warning,
     }
-    return json.dumps(payload, indent=2)
+    return json_compat.dumps(payload)
+
+
+def _explain_module_text(view: ModuleView, warning: str | None = None) -> str:
+    """Return the plain-text explanation for the module view."""
+
+    buf = io.StringIO()
+    w = buf.write
+    if warning:
+        w(f"[neurocode] warning: {warning}\n")
+    w(f"Module: {view.module_name}\nPath: {view.path}\n\n")
+
+    w("Imports:\n")
+    if view.imports:
+        for name in view.imports:
+            w(f"  - {name}\n")
+    else:
+        w("  (none)\n")
+    w("\n")
+
+    def _write_calls(fn: FunctionView, header: str, indent: str) -> None:
+        if not fn.calls:
+            w(f"{header}calls: (none)\n")
+            return
+
+        w(f"{header}calls:\n")
+        for lineno, target, resolved in fn.calls.rows():
+            if resolved is not None:
+                w(f"{indent}line {lineno}: {target} -> {resolved}\n")
+            else:
+                w(f"{indent}line {lineno}: {target}\n")
+
+    # Classes and methods.
+    w("Classes:\n")
+    if view.classes:
+        for cls in view.classes:
+            w(f"- {cls.qualified_name} (line {cls.lineno})\n")
+            if not cls.methods:
+                w("    methods: (none)\n")
+                continue
+            for method in cls.methods:
+                w(f"    * {method.qualified_name} (line {method.lineno})\n")
+                _write_calls(method, "        ", "          ")
+    else:
+        w("  (none)\n")
+
+    w("\n")
+
+    # Module-level functions.
+    w("Functions:\n")
+    if not view.functions:
+        w("  (none)\n")
+    for fn in view.functions:
+        w(f"- {fn.qualified_name} (line {fn.lineno})\n")
+        _write_calls(fn, "    ", "      ")
+
+    # Every section ends with a newline; drop the final one to match "\n".join semantics.
+    return buf.getvalue()[:-1]
 
 
 def _staleness_warning(module: ModuleIR, repo_root: Path) -> str | None:
@@ -132,7 +260,7 @@ def _staleness_warning(module: ModuleIR, repo_root: Path) -> str | None:
         return None
     curr_path = (repo_root / module.path).resolve()
     try:
-        current_hash = compute_file_hash(curr_path)
+        current_hash = cached_file_hash(curr_path)
     except OSError:
         return f"module file missing on disk: {curr_path}"
     if current_hash != module.file_hash:
@@ -182,114 +310,7 @@ def explain_file(
 
     warning = _staleness_warning(module, repo_root)
 
+    view = _collect_module_view(ir, module)
     if output_format == "json":
-        return _explain_module_json(ir, module, warning=warning)
-
-    lines: List[str] = []
-    if warning:
-        lines.append(f"[neurocode] warning: {warning}")
-    lines.append(f"Module: {module.module_name}")
-    lines.append(f"Path: {module.path}")
-    lines.append("")
-
-    # Build lookup for functions by id for resolving call graph edges.
-    fn_by_id: Dict[int, FunctionIR] = {}
-    for m in ir.modules:
-        for fn in m.functions:
-            fn_by_id[fn.id] = fn
-
-    # Imports via module_import_edges.
-    imported_modules = sorted(
-        {
-            edge.imported_module
-            for edge in ir.module_import_edges
-            if edge.importer_module_id == module.id
-        }
-    )
-
-    lines.append("Imports:")
-    if imported_modules:
-        for name in imported_modules:
-            lines.append(f"  - {name}")
-    else:
-        lines.append("  (none)")
-    lines.append("")
-
-    def _append_function_section(fn: FunctionIR) -> None:
-        lines.append(f"    * {fn.qualified_name} (line {fn.lineno})")
-        call_edges = [
-            edge for edge in ir.call_edges if edge.caller_function_id == fn.id
-        ]
-        if not call_edges:
-            lines.append("        calls: (none)")
-            return
-
-        lines.append("        calls:")
-        for edge in sorted(call_edges, key=lambda e: e.lineno):
-            callee_desc: str
-            if edge.callee_function_id is not None:
-                callee_fn = fn_by_id.get(edge.callee_function_id)
-                if callee_fn is not None:
-                    callee_desc = f" -> {callee_fn.qualified_name}"
-                else:  # pragma: no cover - very defensive
-                    callee_desc = ""
-            else:
-                callee_desc = ""
-            lines.append(
-                f"          line {edge.lineno}: {edge.target}{callee_desc}"
-            )
-
-    # Classes and methods.
-    lines.append("Classes:")
-    if module.classes:
-        for cls in sorted(module.classes, key=lambda c: c.lineno):
-            lines.append(f"- {cls.qualified_name} (line {cls.lineno})")
-            methods = sorted(cls.methods, key=lambda f: f.lineno)
-            if not methods:
-                lines.append("    methods: (none)")
-                continue
-            for method in methods:
-                _append_function_section(method)
-    else:
-        lines.append("  (none)")
-
-    lines.append("")
-
-    # Module-level functions.
-    module_level_functions = [
-        fn for fn in module.functions if fn.parent_class_id is None and fn.kind != "module"
-    ]
-    lines.append("Functions:")
-    if not module_level_functions:
-        lines.append("  (none)")
-        return "\n".join(lines)
-
-    for fn in sorted(module_level_functions, key=lambda f: f.lineno):
-        lines.append(f"- {fn.qualified_name} (line {fn.lineno})")
-        call_edges = [
-            edge
-            for edge in ir.call_edges
-            if edge.caller_function_id == fn.id
-        ]
-
-        if not call_edges:
-            lines.append("    calls: (none)")
-            continue
-
-        lines.append("    calls:")
-        for edge in sorted(call_edges, key=lambda e: e.lineno):
-            callee_desc: str
-            if edge.callee_function_id is not None:
-                callee_fn = fn_by_id.get(edge.callee_function_id)
-                if callee_fn is not None:
-                    callee_desc = f" -> {callee_fn.qualified_name}"
-                else:  # pragma: no cover - very defensive
-                    callee_desc = ""
-            else:
-                callee_desc = ""
-
-            lines.append(
-                f"      line {edge.lineno}: {edge.target}{callee_desc}"
-            )
-
-    return "\n".join(lines)
+        return _explain_module_json(view, warning=warning)
+    return _explain_module_text(view, warning=warning)
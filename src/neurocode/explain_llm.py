@@ -1,23 +1,39 @@
 from __future__ import annotations
 
 import ast
+import os
+import re
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Collection, Dict, List, Tuple
 
 from .check import CheckResult, check_file
-from .config import load_config
+from .config import Config, load_config
+from .embedding_model import EmbeddingStore, load_embedding_store
 from .embedding_provider import DummyEmbeddingProvider, make_embedding_provider
 from .explain import _find_module_for_file, _find_repo_root_for_file
 from .ir_model import FunctionIR, ModuleIR, RepositoryIR
 from .search import (
     build_query_embedding_from_symbol,
     build_query_embedding_from_text,
-    load_ir_and_embeddings,
     search_embeddings,
 )
 from .toon_parse import load_repository_ir
 
+_BY_LINENO = attrgetter("lineno")
+
+# Cap on the whole-file ``source.text`` section of a bundle, in characters.
+SOURCE_TEXT_LIMIT = 20000
+# Cap on each per-symbol ``source_slices`` entry, in characters.
+SLICE_TEXT_LIMIT = 40000
+
+# Bundle sections that cost real work and can be skipped via ``include``.
+OPTIONAL_SECTIONS = frozenset({"checks", "semantic_neighbors", "source_slices", "source"})
+
 
 @dataclass
 class ExplainLLMBundle:
@@ -25,48 +41,38 @@ class ExplainLLMBundle:
 
 
 def _function_by_qualified_name(ir: RepositoryIR, name: str) -> FunctionIR | None:
-    for module in ir.modules:
-        for fn in module.functions:
-            if fn.qualified_name == name or fn.qualified_name.endswith(f".{name}"):
-                return fn
-    return None
+    fn = ir.functions_by_qualified_name().get(name)
+    if fn is not None:
+        return fn
+    matches = ir.functions_by_qualified_suffix().get(name)
+    return matches[0] if matches else None
 
 
 def _function_by_symbol_id(ir: RepositoryIR, symbol_id: str) -> FunctionIR | None:
-    for module in ir.modules:
-        for fn in module.functions:
-            if fn.symbol_id == symbol_id:
-                return fn
-    return None
+    return ir.functions_by_symbol_id().get(symbol_id)
 
 
 def _module_summary(ir: RepositoryIR, module: ModuleIR) -> dict:
-    # Imports from module_import_edges
-    imports = sorted(
-        {edge.imported_module for edge in ir.module_import_edges if edge.importer_module_id == module.id}
-    )
-    functions = []
-    for fn in sorted(
-        [f for f in module.functions if f.kind != "module"], key=lambda f: f.lineno
-    ):
-        functions.append(
-            {
-                "name": fn.name,
-                "qualified_name": fn.qualified_name,
-                "lineno": fn.lineno,
-                "num_calls": len(fn.calls),
-            }
-        )
-    classes = []
-    for cls in sorted(module.classes, key=lambda c: c.lineno):
-        classes.append(
-            {
-                "name": cls.name,
-                "qualified_name": cls.qualified_name,
-                "lineno": cls.lineno,
-                "methods": [m.qualified_name for m in cls.methods],
-            }
-        )
+    # Imports come pre-sorted from the cached module import index.
+    imports = list(ir.imports_by_importer().get(module.id, ()))
+    functions = [
+        {
+            "name": fn.name,
+            "qualified_name": fn.qualified_name,
+            "lineno": fn.lineno,
+            "num_calls": len(fn.calls),
+        }
+        for fn in ir.functions_by_module().get(module.id, ())
+    ]
+    classes = [
+        {
+            "name": cls.name,
+            "qualified_name": cls.qualified_name,
+            "lineno": cls.lineno,
+            "methods": [m.qualified_name for m in cls.methods],
+        }
+        for cls in sorted(module.classes, key=_BY_LINENO)
+    ]
     return {
         "module": module.module_name,
         "imports": imports,
@@ -76,40 +82,34 @@ def _module_summary(ir: RepositoryIR, module: ModuleIR) -> dict:
 
 
 def _callers_and_callees(ir: RepositoryIR, target: FunctionIR) -> dict:
-    fn_by_id: Dict[int, FunctionIR] = {}
-    for m in ir.modules:
-        for fn in m.functions:
-            fn_by_id[fn.id] = fn
+    fn_get = ir.functions_by_id().get
+    path_get = ir.module_paths_by_id().get
+    target_id = target.id
+
+    def entry(fn: FunctionIR, lineno: int) -> dict:
+        path = path_get(fn.module_id)
+        return {
+            "symbol": fn.symbol_id,
+            "module": fn.module,
+            "file": str(path) if path is not None else "",
+            "lineno": lineno,
+        }
+
     callers = []
+    for edge in ir.call_edges_by_callee().get(target_id, ()):
+        caller_fn = fn_get(edge.caller_function_id)
+        if caller_fn:
+            callers.append(entry(caller_fn, edge.lineno))
     callees = []
-    for edge in ir.call_edges:
-        if edge.callee_function_id == target.id:
-            caller_fn = fn_by_id.get(edge.caller_function_id)
-            if caller_fn:
-                callers.append(
-                    {
-                        "symbol": caller_fn.symbol_id,
-                        "module": caller_fn.module,
-                        "file": str(next((m.path for m in ir.modules if m.id == caller_fn.module_id), "")),
-                        "lineno": edge.lineno,
-                    }
-                )
-        if edge.caller_function_id == target.id and edge.callee_function_id is not None:
-            callee_fn = fn_by_id.get(edge.callee_function_id)
-            if callee_fn:
-                callees.append(
-                    {
-                        "symbol": callee_fn.symbol_id,
-                        "module": callee_fn.module,
-                        "file": str(next((m.path for m in ir.modules if m.id == callee_fn.module_id), "")),
-                        "lineno": edge.lineno,
-                    }
-                )
+    # Unresolved edges (``callee_function_id is None``) simply miss in ``fn_get``.
+    for edge in ir.call_edges_by_caller().get(target_id, ()):
+        callee_fn = fn_get(edge.callee_function_id)
+        if callee_fn:
+            callees.append(entry(callee_fn, edge.lineno))
     return {"callers": callers, "callees": callees}
 
 
-def _checks_for_file(ir: RepositoryIR, repo_root: Path, file: Path) -> List[dict]:
-    config = load_config(repo_root)
+def _checks_for_file(ir: RepositoryIR, repo_root: Path, file: Path, config: Config) -> List[dict]:
     results: List[CheckResult] = check_file(ir=ir, repo_root=repo_root, file=file, config=config)
     checks = []
     for r in results:
@@ -127,9 +127,9 @@ def _checks_for_file(ir: RepositoryIR, repo_root: Path, file: Path) -> List[dict
     return checks
 
 
-def _build_end_lineno_map(file_path: Path) -> Dict[int, int]:
+def _build_end_lineno_map(text: str | bytes, file_path: str) -> Dict[int, int]:
     try:
-        tree = ast.parse(file_path.read_text(encoding="utf-8"), filename=str(file_path))
+        tree = ast.parse(text, filename=file_path)
     except Exception:
         return {}
     mapping: Dict[int, int] = {}
@@ -142,35 +142,106 @@ def _build_end_lineno_map(file_path: Path) -> Dict[int, int]:
     return mapping
 
 
-def _function_source_slice(
-    fn: FunctionIR,
-    repo_root: Path,
-    module_paths: Dict[int, Path],
-    end_map_cache: Dict[Path, Dict[int, int]],
-) -> Tuple[str, bool]:
-    file_path = module_paths.get(fn.module_id)
-    if file_path is None:
-        file_path = (repo_root / fn.module.replace(".", "/")).with_suffix(".py")
-    else:
-        file_path = repo_root / file_path
-    if not file_path.exists():
-        return "", False
-    end_map = end_map_cache.get(file_path)
-    if end_map is None:
-        end_map = _build_end_lineno_map(file_path)
-        end_map_cache[file_path] = end_map
+@dataclass
+class _SourceFile:
+    """Raw bytes of a source file plus a newline offset table for cheap line slicing."""
+
+    path: str
+    raw: bytes
+    offsets: array  # byte offset where each line starts, followed by len(raw)
+
+    @cached_property
+    def end_map(self) -> Dict[int, int]:
+        """def/class start line -> end line, parsed only for IR without ``end_lineno``."""
+
+        return _build_end_lineno_map(self.raw, self.path)
+
+    @property
+    def num_lines(self) -> int:
+        return len(self.offsets) - 1
+
+    def lines_text(self, start: int, end: int, limit: int | None = None) -> str:
+        """Return lines ``[start, end)`` (0-based) joined by ``\\n``, without a trailing newline.
+
+        With ``limit``, only enough bytes to yield more than ``limit`` characters are
+        decoded, so the result may be cut short (but is still longer than ``limit``).
+        """
+
+        if start >= end:
+            return ""
+        lo, hi = self.offsets[start], self.offsets[end]
+        # UTF-8 needs at most 4 bytes per character.
+        if limit is not None and hi - lo > 4 * (limit + 1):
+            chunk = _trim_partial_utf8(self.raw[lo : lo + 4 * (limit + 1)])
+            return _normalize_newlines(chunk.decode("utf-8"))
+        chunk = self.raw[lo:hi]
+        if chunk.endswith(b"\r\n"):
+            chunk = chunk[:-2]
+        elif chunk.endswith((b"\n", b"\r")):
+            chunk = chunk[:-1]
+        return _normalize_newlines(chunk.decode("utf-8"))
+
+
+def _trim_partial_utf8(chunk: bytes) -> bytes:
+    """Drop a multi-byte UTF-8 character cut off at the end of ``chunk``; other bytes are left as-is."""
+
+    start = len(chunk) - 1
+    while start >= 0 and len(chunk) - start < 4 and chunk[start] & 0xC0 == 0x80:
+        start -= 1
+    if start < 0:
+        return chunk
+    lead = chunk[start]
+    if lead < 0xC0:
+        return chunk
+    width = 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+    return chunk[:start] if len(chunk) - start < width else chunk
+
+
+def _normalize_newlines(text: str) -> str:
+    if "\r" not in text:
+        return text
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+_LINE_END_RE = re.compile(rb"\r\n?|\n")
+
+
+def _load_source_file(file_path: str) -> _SourceFile | None:
+    """Read ``file_path`` once and index its line starts."""
+
     try:
-        lines = file_path.read_text(encoding="utf-8").splitlines()
+        with open(file_path, "rb") as fh:
+            raw = fh.read()
     except OSError:
+        return None
+    offsets = array("Q", [0])
+    if b"\r" in raw:
+        # Lone CRs end lines too (as for ``splitlines`` and the tokenizer's line numbers).
+        offsets.extend(match.end() for match in _LINE_END_RE.finditer(raw))
+    else:
+        find = raw.find
+        pos = find(b"\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = find(b"\n", pos + 1)
+    if offsets[-1] != len(raw):
+        offsets.append(len(raw))
+    return _SourceFile(file_path, raw, offsets)
+
+
+def _function_source_slice(fn: FunctionIR, source: _SourceFile | None) -> Tuple[str, bool]:
+    if source is None:
         return "", False
+    num_lines = source.num_lines
     start = max(fn.lineno - 1, 0)
-    end = end_map.get(fn.lineno, len(lines))
-    end = min(end, len(lines))
-    slice_text = "\n".join(lines[start:end])
+    end = fn.end_lineno
+    if end is None:
+        end = source.end_map.get(fn.lineno, num_lines)
+    end = min(end, num_lines)
+    slice_text = source.lines_text(start, end, SLICE_TEXT_LIMIT)
     truncated = False
-    SOURCE_LIMIT = 40000
-    if len(slice_text) > SOURCE_LIMIT:
-        slice_text = slice_text[:SOURCE_LIMIT]
+    if len(slice_text) > SLICE_TEXT_LIMIT:
+        slice_text = slice_text[:SLICE_TEXT_LIMIT]
         truncated = True
     return slice_text, truncated
 
@@ -182,13 +253,42 @@ def _collect_source_slices(
 ) -> tuple[dict, dict]:
     slices: Dict[str, dict] = {}
     truncation = {"applied": False, "reason": "", "functions_included": 0}
-    end_map_cache: Dict[Path, Dict[int, int]] = {}
+    # A recursive target can also be its own neighbour; slice each symbol once.
+    unique: Dict[str, FunctionIR] = {}
+    for fn in symbols:
+        unique.setdefault(fn.symbol_id or fn.qualified_name, fn)
+    symbols = list(unique.values())
+    # Resolve each module's file once, as a plain string path.
+    root = os.fspath(repo_root)
+    path_by_module: Dict[int, str] = {}
+    symbol_paths: List[str] = []
     for fn in symbols:
-        text, truncated = _function_source_slice(fn, repo_root, module_paths, end_map_cache)
+        path = path_by_module.get(fn.module_id)
+        if path is None:
+            rel = module_paths.get(fn.module_id)
+            if rel is None:
+                path = os.path.join(root, fn.module.replace(".", os.sep) + ".py")
+            else:
+                path = os.path.join(root, rel)
+            path_by_module[fn.module_id] = path
+        symbol_paths.append(path)
+    # Read every distinct file up front; slicing below is then pure CPU.
+    paths = list(dict.fromkeys(symbol_paths))
+    if len(paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+            file_cache = dict(zip(paths, pool.map(_load_source_file, paths)))
+    else:
+        file_cache = {path: _load_source_file(path) for path in paths}
+    slice_files: Dict[str, str] = {}  # module name -> "pkg/mod.py"
+    for fn, path in zip(symbols, symbol_paths):
+        text, truncated = _function_source_slice(fn, file_cache[path])
         if not text:
             continue
+        slice_file = slice_files.get(fn.module)
+        if slice_file is None:
+            slice_file = slice_files[fn.module] = fn.module.replace(".", "/") + ".py"
         slices[fn.symbol_id or fn.qualified_name] = {
-            "file": str(fn.module.replace(".", "/") + ".py"),
+            "file": slice_file,
             "text": text,
             "truncated": truncated,
         }
@@ -199,51 +299,77 @@ def _collect_source_slices(
     return slices, truncation
 
 
-def build_explain_llm_bundle(
-    file_path: Path,
-    *,
-    symbol: str | None = None,
-    k_neighbors: int = 10,
-) -> ExplainLLMBundle:
-    file_path = file_path.resolve()
-    repo_root = _find_repo_root_for_file(file_path)
-    if repo_root is None:
-        raise RuntimeError("Could not find .neurocode/ir.toon. Run `neurocode ir` first.")
+def _read_source_prefix(file_path: Path, limit: int) -> Tuple[str, bool]:
+    """Read at most ``limit`` characters of ``file_path``; report whether it was cut short."""
 
-    ir_file = repo_root / ".neurocode" / "ir.toon"
-    if not ir_file.is_file():
-        raise RuntimeError(f"{ir_file} not found. Run `neurocode ir {repo_root}` first.")
+    try:
+        with file_path.open(encoding="utf-8") as fh:
+            text = fh.read(limit + 1)
+    except OSError:
+        return "", False
+    if len(text) > limit:
+        return text[:limit], True
+    return text, False
 
-    ir = load_repository_ir(ir_file)
-    module = _find_module_for_file(ir, repo_root, file_path)
-    if module is None:
-        raise RuntimeError(f"No module found in IR for file {file_path}")
 
-    target_fn: FunctionIR | None = None
-    if symbol:
-        target_fn = _function_by_qualified_name(ir, symbol.replace(":", "."))
-        if target_fn is None:
-            raise RuntimeError(f"Symbol not found in IR: {symbol}")
+# (ir path, st_mtime_ns, st_size) -> parsed IR
+_REPOSITORY_IR_CACHE: Dict[Tuple[str, int, int], RepositoryIR] = {}
+_REPOSITORY_IR_CACHE_SIZE = 4
+
+
+def _cached_repository_ir(ir_file: Path) -> RepositoryIR:
+    """Parse ``ir_file`` once per on-disk version; the result is shared and must not be mutated."""
+
+    st = ir_file.stat()
+    key = (str(ir_file), st.st_mtime_ns, st.st_size)
+    ir = _REPOSITORY_IR_CACHE.get(key)
+    if ir is None:
+        if len(_REPOSITORY_IR_CACHE) >= _REPOSITORY_IR_CACHE_SIZE:
+            _REPOSITORY_IR_CACHE.clear()
+        ir = load_repository_ir(ir_file)
+        _REPOSITORY_IR_CACHE[key] = ir
+    return ir
 
-    call_graph = {}
-    neighbors_symbols: List[FunctionIR] = []
-    if target_fn:
-        call_graph = _callers_and_callees(ir, target_fn)
-        neighbor_ids = {n["symbol"] for n in call_graph.get("callers", []) if n.get("symbol")}
-        neighbor_ids.update({n["symbol"] for n in call_graph.get("callees", []) if n.get("symbol")})
-        for sid in neighbor_ids:
-            fn_obj = _function_by_symbol_id(ir, sid)
-            if fn_obj:
-                neighbors_symbols.append(fn_obj)
 
-    checks = _checks_for_file(ir, repo_root, file_path)
+# (embeddings path, st_mtime_ns, st_size) -> (store, {qualified name: query embedding})
+_EMBEDDING_STORE_CACHE: Dict[Tuple[str, int, int], Tuple[EmbeddingStore, Dict[str, List[float]]]] = {}
+_EMBEDDING_STORE_CACHE_SIZE = 8
+
+
+def _cached_embedding_store(repo_root: Path) -> Tuple[EmbeddingStore, Dict[str, List[float]]]:
+    """Load the repo's embedding store once per on-disk version of the file.
+
+    Returns the store together with a per-store memo of symbol query embeddings.
+    Raises ``OSError`` when the store does not exist.
+    """
+
+    emb_file = repo_root / ".neurocode" / "ir-embeddings.toon"
+    st = emb_file.stat()
+    key = (str(emb_file), st.st_mtime_ns, st.st_size)
+    entry = _EMBEDDING_STORE_CACHE.get(key)
+    if entry is None:
+        if len(_EMBEDDING_STORE_CACHE) >= _EMBEDDING_STORE_CACHE_SIZE:
+            _EMBEDDING_STORE_CACHE.clear()
+        entry = (load_embedding_store(emb_file), {})
+        _EMBEDDING_STORE_CACHE[key] = entry
+    return entry
+
+
+def _semantic_neighbors(
+    ir: RepositoryIR,
+    repo_root: Path,
+    file_path: Path,
+    module: ModuleIR,
+    target_fn: FunctionIR | None,
+    k_neighbors: int,
+    config: Config,
+) -> Tuple[dict, List[dict]]:
+    """Return ``(embedding_meta, semantic_neighbors)``, degrading gracefully without a store."""
 
-    # Semantic neighbors via embeddings/search
     semantic_neighbors: List[dict] = []
     embedding_meta: dict = {}
     try:
-        config = load_config(repo_root)
-        _, store = load_ir_and_embeddings(repo_root)
+        store, symbol_queries = _cached_embedding_store(repo_root)
         embedding_meta = {
             "model": store.model,
             "provider": store.provider,
@@ -251,7 +377,10 @@ def build_explain_llm_bundle(
             "available": True,
         }
         if target_fn:
-            query_embedding = build_query_embedding_from_symbol(store, target_fn.qualified_name)
+            query_embedding = symbol_queries.get(target_fn.qualified_name)
+            if query_embedding is None:
+                query_embedding = build_query_embedding_from_symbol(store, target_fn.qualified_name)
+                symbol_queries[target_fn.qualified_name] = query_embedding
         else:
             text = file_path.read_text(encoding="utf-8")
             try:
@@ -283,19 +412,81 @@ def build_explain_llm_bundle(
         embedding_meta = {"model": None, "provider": None, "store_path": None, "available": False}
         semantic_neighbors = []
 
+    return embedding_meta, semantic_neighbors
+
+
+def build_explain_llm_bundle(
+    file_path: Path,
+    *,
+    symbol: str | None = None,
+    k_neighbors: int = 10,
+    max_source_chars: int = SOURCE_TEXT_LIMIT,
+    include: Collection[str] | None = None,
+) -> ExplainLLMBundle:
+    """Build the explain-llm bundle for ``file_path``.
+
+    ``include`` limits which of :data:`OPTIONAL_SECTIONS` are computed; omitted
+    sections are left empty. ``None`` computes everything.
+    """
+
+    sections = OPTIONAL_SECTIONS if include is None else OPTIONAL_SECTIONS.intersection(include)
+    file_path = file_path.resolve()
+    repo_root = _find_repo_root_for_file(file_path)
+    if repo_root is None:
+        raise RuntimeError("Could not find .neurocode/ir.toon. Run `neurocode ir` first.")
+
+    ir_file = repo_root / ".neurocode" / "ir.toon"
+    if not ir_file.is_file():
+        raise RuntimeError(f"{ir_file} not found. Run `neurocode ir {repo_root}` first.")
+
+    ir = _cached_repository_ir(ir_file)
+    module = _find_module_for_file(ir, repo_root, file_path)
+    if module is None:
+        raise RuntimeError(f"No module found in IR for file {file_path}")
+
+    target_fn: FunctionIR | None = None
+    if symbol:
+        target_fn = _function_by_qualified_name(ir, symbol.replace(":", "."))
+        if target_fn is None:
+            raise RuntimeError(f"Symbol not found in IR: {symbol}")
+
+    config = load_config(repo_root)
+    checks: List[dict] = []
+    embedding_meta: dict = {}
+    semantic_neighbors: List[dict] = []
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # Checks and the embedding search are IO-bound; walk the call graph meanwhile.
+        checks_future = None
+        semantic_future = None
+        if "checks" in sections:
+            checks_future = pool.submit(_checks_for_file, ir, repo_root, file_path, config)
+        if "semantic_neighbors" in sections:
+            semantic_future = pool.submit(
+                _semantic_neighbors, ir, repo_root, file_path, module, target_fn, k_neighbors, config
+            )
+
+        call_graph = {}
+        neighbors_symbols: List[FunctionIR] = []
+        if target_fn:
+            call_graph = _callers_and_callees(ir, target_fn)
+            neighbor_ids = {n["symbol"] for n in call_graph.get("callers", []) if n.get("symbol")}
+            neighbor_ids.update({n["symbol"] for n in call_graph.get("callees", []) if n.get("symbol")})
+            for sid in neighbor_ids:
+                fn_obj = _function_by_symbol_id(ir, sid)
+                if fn_obj:
+                    neighbors_symbols.append(fn_obj)
+
+        if checks_future is not None:
+            checks = checks_future.result()
+        if semantic_future is not None:
+            embedding_meta, semantic_neighbors = semantic_future.result()
+
     # IR slice
     module_summary = _module_summary(ir, module)
 
-    source_text = ""
-    truncated = False
-    SOURCE_LIMIT = 20000
-    try:
-        source_text = file_path.read_text(encoding="utf-8")
-        if len(source_text) > SOURCE_LIMIT:
-            source_text = source_text[:SOURCE_LIMIT]
-            truncated = True
-    except OSError:
-        source_text = ""
+    source_text, truncated = "", False
+    if "source" in sections:
+        source_text, truncated = _read_source_prefix(file_path, max_source_chars)
 
     target_payload = None
     if target_fn:
@@ -305,9 +496,10 @@ def build_explain_llm_bundle(
             "lineno": target_fn.lineno,
         }
 
-    module_paths: Dict[int, Path] = {m.id: m.path for m in ir.modules}
+    module_paths: Dict[int, Path] = ir.module_paths_by_id()
 
-    related_files = {str(file_path.relative_to(repo_root))}
+    rel_file = str(file_path.relative_to(repo_root))
+    related_files = {rel_file}
     for n in neighbors_symbols:
         try:
             mod_path = module_paths[n.module_id]
@@ -328,11 +520,12 @@ def build_explain_llm_bundle(
     }
 
     slice_symbols: List[FunctionIR] = []
-    if target_fn:
-        slice_symbols.append(target_fn)
-        slice_symbols.extend(neighbors_symbols)
-    else:
-        slice_symbols.extend([fn for fn in module.functions if fn.kind != "module"])
+    if "source_slices" in sections:
+        if target_fn:
+            slice_symbols.append(target_fn)
+            slice_symbols.extend(neighbors_symbols)
+        else:
+            slice_symbols.extend([fn for fn in module.functions if fn.kind != "module"])
 
     source_slices, trunc_info = _collect_source_slices(repo_root, slice_symbols, module_paths)
 
@@ -340,7 +533,7 @@ def build_explain_llm_bundle(
         "version": 1,
         "engine_version": "",
         "repo_root": str(repo_root),
-        "file": str(file_path.relative_to(repo_root)),
+        "file": rel_file,
         "module": module.module_name,
         "target": target_payload,
         "ir": {"module_summary": module_summary},
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Iterator, List
 
+try:  # POSIX advisory locks; other platforms append unlocked
+    import fcntl
+except ModuleNotFoundError:  # pragma: no cover - platform dependent
+    fcntl = None  # type: ignore[assignment]
 
-@dataclass
+
+@dataclass(slots=True)
 class PatchHistoryEntry:
     id: str
     timestamp: str
@@ -18,7 +24,7 @@ class PatchHistoryEntry:
     plan_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PatchHistory:
     entries: List[PatchHistoryEntry]
 
@@ -28,36 +34,48 @@ def _history_path(repo_root: Path) -> Path:
 
 
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
 
-def history_to_toon(history: PatchHistory) -> str:
-    lines: list[str] = []
-    lines.append("patch_history:")
-    lines.append(f"  count: {len(history.entries)}")
-    lines.append("")
-    lines.append(
-        f"entries[{len(history.entries)}]{{id,timestamp,fix,files_changed,is_noop,summary,warnings,plan_id}}:"
+# Row escapes applied in one pass; str.translate accepts multi-character replacements.
+_ROW_ESCAPES = str.maketrans({",": "\\,", "\n": "\\n"})
+
+
+_ENTRY_FIELDS = "id,timestamp,fix,files_changed,is_noop,summary,warnings,plan_id"
+
+
+def _history_header(count: int) -> str:
+    return f"patch_history:\n  count: {count}\n\nentries[{count}]{{{_ENTRY_FIELDS}}}:\n"
+
+
+def _serialize_entry(entry: PatchHistoryEntry) -> str:
+    """Return the TOON row for ``entry``, indented and newline-terminated."""
+
+    row = ",".join(
+        [
+            entry.id,
+            entry.timestamp,
+            entry.fix.translate(_ROW_ESCAPES),
+            "|".join(entry.files_changed).translate(_ROW_ESCAPES),
+            "1" if entry.is_noop else "0",
+            entry.summary.translate(_ROW_ESCAPES),
+            "|".join(entry.warnings).translate(_ROW_ESCAPES),
+            entry.plan_id or "",
+        ]
     )
+    return f"  {row}\n"
+
+
+def iter_history_lines(history: PatchHistory) -> Iterator[str]:
+    """Yield the TOON document for ``history`` line by line (newline-terminated)."""
+
+    yield _history_header(len(history.entries))
     for entry in history.entries:
-        files = "|".join(entry.files_changed)
-        warns = "|".join(entry.warnings)
-        plan_id = entry.plan_id or ""
-        row = ",".join(
-            [
-                entry.id,
-                entry.timestamp,
-                entry.fix.replace(",", "\\,").replace("\n", "\\n"),
-                files.replace(",", "\\,").replace("\n", "\\n"),
-                "1" if entry.is_noop else "0",
-                entry.summary.replace(",", "\\,").replace("\n", "\\n"),
-                warns.replace(",", "\\,").replace("\n", "\\n"),
-                plan_id,
-            ]
-        )
-        lines.append(f"  {row}")
-    lines.append("")
-    return "\n".join(lines)
+        yield _serialize_entry(entry)
+
+
+def history_to_toon(history: PatchHistory) -> str:
+    return "".join(iter_history_lines(history))
 
 
 def history_from_toon(text: str) -> PatchHistory:
@@ -83,11 +101,11 @@ def history_from_toon(text: str) -> PatchHistory:
             entry = PatchHistoryEntry(
                 id=row["id"],
                 timestamp=row["timestamp"],
-                fix=_unescape(row["fix"]),
+                fix=row["fix"],
                 files_changed=files,
                 is_noop=row["is_noop"] == "1",
-                summary=_unescape(row["summary"]),
-                warnings=[_unescape(w) for w in warnings],
+                summary=row["summary"],
+                warnings=warnings,
                 plan_id=row.get("plan_id") or None,
             )
             entries.append(entry)
@@ -95,26 +113,16 @@ def history_from_toon(text: str) -> PatchHistory:
 
 
 def _parse_row(line: str) -> list[str]:
-    fields: list[str] = []
-    current: list[str] = []
-    escaped = False
-    for ch in line:
-        if escaped:
-            current.append(ch)
-            escaped = False
-        elif ch == "\\":
-            escaped = True
-        elif ch == ",":
-            fields.append("".join(current))
-            current = []
-        else:
-            current.append(ch)
-    fields.append("".join(current))
-    return fields
-
-
-def _unescape(value: str) -> str:
-    return value.replace("\\,", ",").replace("\\n", "\n")
+    """Split a row on unescaped commas and decode ``\\,``/``\\n`` in each field.
+
+    Escapes are swapped for sentinel characters so the split and the decoding are
+    plain ``str`` operations instead of a per-character loop.
+    """
+
+    if "\\" not in line:
+        return line.split(",")
+    tmp = line.replace("\\,", "\x00").replace("\\n", "\x01")
+    return [field.replace("\x00", ",").replace("\x01", "\n") for field in tmp.split(",")]
 
 
 def load_patch_history(repo_root: Path) -> PatchHistory:
@@ -131,7 +139,8 @@ def load_patch_history(repo_root: Path) -> PatchHistory:
 def save_patch_history(repo_root: Path, history: PatchHistory) -> None:
     path = _history_path(repo_root)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(history_to_toon(history), encoding="utf-8")
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as fh:
+        fh.writelines(iter_history_lines(history))
 
 
 def append_patch_history(
@@ -144,10 +153,10 @@ def append_patch_history(
     warnings: list[str] | None = None,
     plan_id: str | None = None,
 ) -> None:
-    history = load_patch_history(repo_root)
+    now = _now_iso()
     entry = PatchHistoryEntry(
-        id=_now_iso(),
-        timestamp=_now_iso(),
+        id=now,
+        timestamp=now,
         fix=fix,
         files_changed=files_changed,
         is_noop=is_noop,
@@ -155,9 +164,53 @@ def append_patch_history(
         warnings=warnings or [],
         plan_id=plan_id,
     )
-    history.entries.append(entry)
+    path = _history_path(repo_root)
     try:
-        save_patch_history(repo_root, history)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # One locked read-append-patch sequence on the file itself, so concurrent
+        # writers serialize instead of both bumping the same header count.
+        with os.fdopen(os.open(path, os.O_RDWR | os.O_CREAT, 0o644), "r+b") as fh:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            if _append_entry_in_place(fh, entry):
+                return
+            fh.seek(0)
+            history = history_from_toon(fh.read().decode("utf-8"))
+            history.entries.append(entry)
+            fh.seek(0)
+            fh.truncate()
+            fh.write(history_to_toon(history).encode("utf-8"))
     except Exception:
         # non-fatal
         return
+
+
+def _append_entry_in_place(fh: BinaryIO, entry: PatchHistoryEntry) -> bool:
+    """Append one row to the open history file without re-serializing it.
+
+    The header counts are patched in place, which only works while the new count
+    has as many digits as the old one; returns ``False`` when the caller must fall
+    back to a full rewrite (empty or unrecognized file, or a count rollover).
+    """
+
+    fh.seek(0)
+    head = [fh.readline() for _ in range(4)]
+    count_line = head[1].decode("utf-8", "replace")
+    if not count_line.startswith("  count: "):
+        return False
+    try:
+        count = int(count_line[len("  count: ") :])
+    except ValueError:
+        return False
+    old_header = _history_header(count).encode("utf-8")
+    new_header = _history_header(count + 1).encode("utf-8")
+    if b"".join(head) != old_header or len(new_header) != len(old_header):
+        return False
+    end = fh.seek(0, 2)
+    fh.seek(end - 1)
+    if fh.read(1) != b"\n":
+        return False
+    fh.write(_serialize_entry(entry).encode("utf-8"))
+    fh.seek(0)
+    fh.write(new_header)
+    return True
@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import ast
 import hashlib
+import os
+import sys
 import time
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass
+from itertools import repeat
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
+from . import json_compat
+from .ir_cache import IRFragmentCache
 from .ir_model import (
     CallEdgeIR,
     CallIR,
@@ -19,21 +26,39 @@ from .ir_model import (
 )
 from .pyproject import load_console_scripts
 
+# Virtual environments and typical build artifacts, skipped by convention.
+_SKIP_DIR_NAMES = frozenset({".venv", "venv", "dist", "build", "__pycache__"})
+
 
 def discover_python_files(root: Path) -> List[Path]:
     """Recursively discover Python source files under ``root``.
 
-    Returns paths relative to ``root``.
+    Returns paths relative to ``root``. Skipped directories are pruned before
+    descending, and symlinked directories are not followed.
     """
 
     root = root.resolve()
-    paths: List[Path] = []
-    for path in root.rglob("*.py"):
-        # Skip virtual environments and typical build artifacts by convention.
-        if any(part in {".venv", "venv", "dist", "build", "__pycache__"} for part in path.parts):
+    rel_names: List[str] = []
+    stack: List[Tuple[str, str]] = [(os.fspath(root), "")]
+    while stack:
+        dir_path, rel_dir = stack.pop()
+        try:
+            entries = os.scandir(dir_path)
+        except OSError:
             continue
-        paths.append(path.relative_to(root))
-    return sorted(paths)
+        with entries:
+            for entry in entries:
+                name = entry.name
+                rel = f"{rel_dir}{name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if name not in _SKIP_DIR_NAMES:
+                            stack.append((entry.path, f"{rel}/"))
+                    elif name.endswith(".py") and entry.is_file():
+                        rel_names.append(rel)
+                except OSError:
+                    continue
+    return sorted(Path(rel) for rel in rel_names)
 
 
 def module_name_from_path(root: Path, rel_path: Path) -> str:
@@ -56,18 +81,60 @@ def compute_file_hash(path: Path) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
-@dataclass
-class _FunctionContext:
-    function: FunctionIR
+# A file modified this close to the moment it was stat'ed may change again without its stamp moving
+# (coarse timestamp granularity), so such stamps are never trusted on their own; the file is re-hashed.
+_RACY_WINDOW_NS = 2_000_000_000
 
+# (st_mtime_ns, st_size, st_ino, st_ctime_ns): restoring an mtime after an edit still moves the ctime.
+_StatStamp = Tuple[int, int, int, int]
+
+
+def _stat_stamp(st: os.stat_result) -> _StatStamp:
+    return (st.st_mtime_ns, st.st_size, st.st_ino, st.st_ctime_ns)
 
-@dataclass
-class _ClassContext:
-    class_ir: ClassIR
 
+# path -> (stat stamp, ns when stat'ed, sha256 hex digest); an edited file overwrites its own entry
+_FILE_HASH_CACHE: Dict[str, Tuple[_StatStamp, int, str]] = {}
 
-class _IRVisitor(ast.NodeVisitor):
-    """AST visitor that populates imports, functions, and call sites for a module."""
+
+def cached_file_hash(path: Path) -> str:
+    """Like :func:`compute_file_hash`, but skip re-hashing files whose stat is unchanged.
+
+    Uses the same stamp and racy-mtime rules as the IR fragment memo. Raises
+    ``OSError`` when the file cannot be stat'ed or read.
+    """
+
+    key_path = os.fspath(path)
+    stat_ns = time.time_ns()
+    st = os.stat(key_path)
+    stamp = _stat_stamp(st)
+    cached = _FILE_HASH_CACHE.get(key_path)
+    if cached is not None and cached[0] == stamp and max(st.st_mtime_ns, st.st_ctime_ns) < cached[1] - _RACY_WINDOW_NS:
+        return cached[2]
+    digest = compute_file_hash(path)
+    _FILE_HASH_CACHE[key_path] = (stamp, stat_ns, digest)
+    return digest
+
+
+# Leaf-ish nodes that can never contain imports, definitions, or calls; never pushed on the walk stack.
+_LEAF_NODE_TYPES = frozenset(
+    {ast.Name, ast.Constant, ast.alias, ast.Pass, ast.Break, ast.Continue, ast.Global, ast.Nonlocal}
+    | {
+        cls
+        for base in (ast.expr_context, ast.operator, ast.unaryop, ast.cmpop, ast.boolop)
+        for cls in base.__subclasses__()
+    }
+)
+
+
+class _IRExtractor:
+    """Single-pass AST walker that populates imports, functions, and call sites for a module.
+
+    Nodes are visited with an explicit stack and a type -> handler dict instead of
+    ``ast.NodeVisitor``'s per-node ``getattr`` dispatch. Handlers that open a scope
+    (classes, functions, ``__main__`` guards) push a closing callable below the node's
+    children, so results come out in the same order as a recursive visitor.
+    """
 
     def __init__(self, module_id: int, module_name: str) -> None:
         self.module_id = module_id
@@ -77,16 +144,44 @@ class _IRVisitor(ast.NodeVisitor):
         self.classes: List[ClassIR] = []
         self._next_class_id = 0
         self._next_function_id = 0
-        self._current_stack: List[_FunctionContext] = []
-        self._class_stack: List[_ClassContext] = []
+        self._function_stack: List[FunctionIR] = []
+        self._class_stack: List[ClassIR] = []
         self.module_calls: List[CallIR] = []
         self.main_guard_calls: List[CallIR] = []
         self.has_main_guard: bool = False
-        self._in_main_guard_stack: List[bool] = []
+        self._main_guard_depth = 0
+        self._stack: List[object] = []
+        self._handlers = {
+            ast.Import: self._handle_import,
+            ast.ImportFrom: self._handle_import_from,
+            ast.ClassDef: self._handle_class,
+            ast.FunctionDef: self._handle_function,
+            ast.AsyncFunctionDef: self._handle_function,
+            ast.Call: self._handle_call,
+            ast.If: self._handle_if,
+        }
+
+    def extract(self, tree: ast.AST) -> None:
+        stack = self._stack
+        handlers = self._handlers
+        leaf_types = _LEAF_NODE_TYPES
+        iter_children = ast.iter_child_nodes
+        stack.append(tree)
+        while stack:
+            item = stack.pop()
+            if not isinstance(item, ast.AST):
+                item()  # scope exit pushed by a handler
+                continue
+            handler = handlers.get(type(item))
+            if handler is not None and not handler(item):
+                continue
+            children = [child for child in iter_children(item) if type(child) not in leaf_types]
+            children.reverse()
+            stack.extend(children)
 
     # Imports -------------------------------------------------------------
 
-    def visit_Import(self, node: ast.Import) -> None:  # type: ignore[override]
+    def _handle_import(self, node: ast.Import) -> bool:
         for alias in node.names:
             self.imports.append(
                 ImportIR(
@@ -96,9 +191,9 @@ class _IRVisitor(ast.NodeVisitor):
                     alias=alias.asname,
                 )
             )
-        self.generic_visit(node)
+        return False
 
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # type: ignore[override]
+    def _handle_import_from(self, node: ast.ImportFrom) -> bool:
         module_name = node.module or ""
         for alias in node.names:
             self.imports.append(
@@ -109,15 +204,15 @@ class _IRVisitor(ast.NodeVisitor):
                     alias=alias.asname,
                 )
             )
-        self.generic_visit(node)
+        return False
 
     # Classes -------------------------------------------------------------
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # type: ignore[override]
+    def _handle_class(self, node: ast.ClassDef) -> bool:
         class_id = self._next_class_id
         self._next_class_id += 1
 
-        ancestor_names = [ctx.class_ir.name for ctx in self._class_stack]
+        ancestor_names = [cls.name for cls in self._class_stack]
         path_parts = [self.module_name, *ancestor_names, node.name]
         qualified_name = ".".join(path_parts)
         class_qualname = ".".join([*ancestor_names, node.name]) if ancestor_names else node.name
@@ -133,35 +228,27 @@ class _IRVisitor(ast.NodeVisitor):
             lineno=node.lineno,
             base_names=[name for name in base_names if name],
         )
-        ctx = _ClassContext(class_ir=class_ir)
-        self._class_stack.append(ctx)
-        try:
-            self.generic_visit(node)
-        finally:
-            self._class_stack.pop()
-            self.classes.append(class_ir)
+        self._class_stack.append(class_ir)
+        self._stack.append(self._exit_class)
+        return True
 
-    # Functions & calls ---------------------------------------------------
+    def _exit_class(self) -> None:
+        self.classes.append(self._class_stack.pop())
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # type: ignore[override]
-        self._handle_function(node)
-
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> None:  # type: ignore[override]
-        self._handle_function(node)
+    # Functions & calls ---------------------------------------------------
 
-    def _handle_function(self, node: ast.AST) -> None:
-        assert isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    def _handle_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
         func_id = self._next_function_id
         self._next_function_id += 1
 
-        name = node.name  # type: ignore[attr-defined]
-        class_names = [ctx.class_ir.name for ctx in self._class_stack]
+        name = node.name
+        class_names = [cls.name for cls in self._class_stack]
         signature = _render_function_signature(self.module_name, class_names, name, node)
         docstring = ast.get_docstring(node)
         if class_names:
             qualified_name = ".".join([self.module_name, *class_names, name])
             qualname = ".".join([*class_names, name])
-            parent_class = self._class_stack[-1].class_ir
+            parent_class = self._class_stack[-1]
             parent_class_id = parent_class.id
             parent_class_qualified = parent_class.qualified_name
             kind = "method"
@@ -181,99 +268,97 @@ class _IRVisitor(ast.NodeVisitor):
             qualname=qualname,
             symbol_id=_make_symbol_id(self.module_name, qualname),
             kind=kind,
-            lineno=node.lineno,  # type: ignore[attr-defined]
+            lineno=node.lineno,
+            end_lineno=getattr(node, "end_lineno", None),
             parent_class_id=parent_class_id,
             parent_class_qualified_name=parent_class_qualified,
             signature=signature,
             docstring=docstring,
         )
         if self._class_stack:
-            self._class_stack[-1].class_ir.methods.append(fn_ir)
-        ctx = _FunctionContext(function=fn_ir)
-        self._current_stack.append(ctx)
-        try:
-            self.generic_visit(node)
-        finally:
-            self._current_stack.pop()
-            self.functions.append(fn_ir)
+            self._class_stack[-1].methods.append(fn_ir)
+        self._function_stack.append(fn_ir)
+        self._stack.append(self._exit_function)
+        return True
+
+    def _exit_function(self) -> None:
+        self.functions.append(self._function_stack.pop())
 
-    def visit_Call(self, node: ast.Call) -> None:  # type: ignore[override]
+    def _handle_call(self, node: ast.Call) -> bool:
         target = render_call_target(node.func)
-        if self._current_stack:
-            self._current_stack[-1].function.calls.append(
-                CallIR(lineno=node.lineno, target=target)
-            )
+        if self._function_stack:
+            self._function_stack[-1].calls.append(CallIR(lineno=node.lineno, target=target))
         else:
-            in_main = any(self._in_main_guard_stack)
+            in_main = self._main_guard_depth > 0
             call = CallIR(lineno=node.lineno, target=target, in_entrypoint=in_main)
             self.module_calls.append(call)
             if in_main:
                 self.main_guard_calls.append(call)
-        self.generic_visit(node)
+        return True
 
-    def visit_If(self, node: ast.If) -> None:  # type: ignore[override]
-        is_main_guard = _is_main_guard(node.test)
-        if is_main_guard:
+    def _handle_if(self, node: ast.If) -> bool:
+        if _is_main_guard(node.test):
             self.has_main_guard = True
-        self._in_main_guard_stack.append(is_main_guard)
-        try:
-            self.generic_visit(node)
-        finally:
-            self._in_main_guard_stack.pop()
+            self._main_guard_depth += 1
+            self._stack.append(self._exit_main_guard)
+        return True
 
+    def _exit_main_guard(self) -> None:
+        self._main_guard_depth -= 1
 
-def render_call_target(node: ast.AST) -> str:
-    """Best-effort string representation of a call target.
 
-    Examples: ``foo``, ``module.func``, ``obj.method``.
+def _render_dotted(node: ast.AST, *, keep_subscripts: bool) -> str:
+    """Cheap textual form of a callee/base expression without going through ``ast.unparse``.
+
+    Handles ``Name``/``Attribute`` chains, subscripts, nested calls and constants;
+    anything else renders as ``<expr>``.
     """
 
-    if isinstance(node, ast.Name):
+    # Exact type checks: AST node classes are never subclassed, and ``type(x) is C`` skips isinstance's MRO walk.
+    node_type = type(node)
+    if node_type is ast.Name:
         return node.id
-    if isinstance(node, ast.Attribute):
+    if node_type is ast.Attribute:
+        value = node.value
+        if type(value) is ast.Name:
+            # ``obj.method`` is by far the most common shape; skip the parts list.
+            return f"{value.id}.{node.attr}"
         parts: List[str] = []
-        curr: ast.AST | None = node
-        while isinstance(curr, ast.Attribute):
+        curr: ast.AST = node
+        while type(curr) is ast.Attribute:
             parts.append(curr.attr)
             curr = curr.value
-        if isinstance(curr, ast.Name):
-            parts.append(curr.id)
-            parts.reverse()
-            return ".".join(parts)
-        # Fallback to ``ast.unparse`` if available.
-        try:
-            return ast.unparse(node)
-        except Exception:  # pragma: no cover - very defensive
-            return "<attr>"
-    try:
-        return ast.unparse(node)  # type: ignore[no-any-return]
-    except Exception:  # pragma: no cover - very defensive
-        return "<expr>"
+        parts.append(curr.id if type(curr) is ast.Name else _render_dotted(curr, keep_subscripts=keep_subscripts))
+        parts.reverse()
+        return ".".join(parts)
+    if node_type is ast.Subscript:
+        value = _render_dotted(node.value, keep_subscripts=keep_subscripts)
+        return f"{value}[]" if keep_subscripts else value
+    if node_type is ast.Call:
+        return f"{_render_dotted(node.func, keep_subscripts=keep_subscripts)}()"
+    if node_type is ast.Constant:
+        return repr(node.value)
+    return "<expr>"
+
+
+def render_call_target(node: ast.AST) -> str:
+    """Best-effort string representation of a call target.
+
+    Examples: ``foo``, ``module.func``, ``obj.method``, ``make()``, ``handlers[]``.
+    Subscripts keep a ``[]`` marker so ``handlers[key]()`` never resolves to a
+    function named ``handlers``.
+    """
+
+    return _render_dotted(node, keep_subscripts=True)
 
 
 def render_base_name(node: ast.AST) -> str:
-    """Best-effort textual representation of a class base expression."""
+    """Best-effort textual representation of a class base expression.
 
-    if isinstance(node, ast.Name):
-        return node.id
-    if isinstance(node, ast.Attribute):
-        parts: List[str] = []
-        curr: ast.AST | None = node
-        while isinstance(curr, ast.Attribute):
-            parts.append(curr.attr)
-            curr = curr.value
-        if isinstance(curr, ast.Name):
-            parts.append(curr.id)
-            parts.reverse()
-            return ".".join(parts)
-    try:
-        value = ast.unparse(node)
-    except Exception:  # pragma: no cover - very defensive
-        return ""
-    # Drop generic parameters like Base[T].
-    if "[" in value:
-        value = value.split("[", 1)[0]
-    return value
+    Generic parameters are dropped, so ``Base[T]`` renders as ``Base``.
+    """
+
+    return _render_dotted(node, keep_subscripts=False)
 
 
 def _safe_unparse(node: ast.AST | None) -> str:
@@ -338,15 +423,337 @@ def _render_function_signature(module: str, class_names: List[str], name: str, n
     return f"{prefix} {qual}({args_text}){ret}"
 
 
-def build_repository_ir(root: Path) -> RepositoryIR:
+@dataclass
+class _ParsedModule:
+    """Per-file IR fragment produced by :func:`_parse_module`, before ids are assigned."""
+
+    rel_path: Path
+    module_name: str
+    file_hash: str
+    imports: List[ImportIR]
+    functions: List[FunctionIR]
+    classes: List[ClassIR]
+    has_main_guard: bool
+    module_calls: List[CallIR]
+    main_guard_calls: List[CallIR]
+
+
+# Below this many files a process pool costs more to start than it saves.
+_PARALLEL_PARSE_MIN_FILES = 32
+
+# Source reads go through a thread pool from this many files on.
+_THREADED_READ_MIN_FILES = 16
+
+# Bump whenever the IR dataclasses or _encode_fragment change shape.
+_IR_CACHE_VERSION = 2
+
+
+def _parse_module(root: Path, rel_path: Path, source: str, file_hash: str) -> _ParsedModule | None:
+    """Parse and visit one file's ``source``; ``None`` when it is not valid Python.
+
+    Module and class ids are left as placeholders for the caller to assign, which
+    keeps this function free of shared state so it can run in a worker process.
+    """
+
+    abs_path = root / rel_path
+    try:
+        tree = ast.parse(source, filename=str(abs_path))
+    except (SyntaxError, ValueError):
+        # Skip files that fail to parse (ValueError: null bytes on older 3.x); we may want to log these later.
+        return None
+
+    mod_name = module_name_from_path(root, rel_path)
+    visitor = _IRExtractor(module_id=-1, module_name=mod_name)
+    visitor.extract(tree)
+    return _ParsedModule(
+        rel_path=rel_path,
+        module_name=mod_name,
+        file_hash=file_hash,
+        imports=visitor.imports,
+        functions=visitor.functions,
+        classes=visitor.classes,
+        has_main_guard=visitor.has_main_guard,
+        module_calls=visitor.module_calls,
+        main_guard_calls=visitor.main_guard_calls,
+    )
+
+
+def _encode_fragment(parsed: _ParsedModule) -> bytes:
+    """Serialize a freshly parsed fragment for the IR cache (methods by function index)."""
+
+    fn_index = {id(fn): i for i, fn in enumerate(parsed.functions)}
+    classes = []
+    for cls in parsed.classes:
+        data = asdict(cls)
+        data["methods"] = [fn_index[id(m)] for m in cls.methods]
+        classes.append(data)
+    return json_compat.dumps_bytes(
+        {
+            "module_name": parsed.module_name,
+            "has_main_guard": parsed.has_main_guard,
+            "imports": [asdict(imp) for imp in parsed.imports],
+            "functions": [asdict(fn) for fn in parsed.functions],
+            "classes": classes,
+            "module_calls": [asdict(call) for call in parsed.module_calls],
+        }
+    )
+
+
+def _decode_fragment(rel_path: Path, file_hash: str, blob: bytes) -> _ParsedModule:
+    data = json_compat.loads(blob)
+    functions = []
+    for fn_data in data["functions"]:
+        fn_data["calls"] = [CallIR(**call) for call in fn_data["calls"]]
+        functions.append(FunctionIR(**fn_data))
+    classes = []
+    for cls_data in data["classes"]:
+        cls_data["methods"] = [functions[i] for i in cls_data["methods"]]
+        classes.append(ClassIR(**cls_data))
+    module_calls = [CallIR(**call) for call in data["module_calls"]]
+    return _ParsedModule(
+        rel_path=rel_path,
+        module_name=data["module_name"],
+        file_hash=file_hash,
+        imports=[ImportIR(**imp) for imp in data["imports"]],
+        functions=functions,
+        classes=classes,
+        has_main_guard=data["has_main_guard"],
+        module_calls=module_calls,
+        main_guard_calls=[call for call in module_calls if call.in_entrypoint],
+    )
+
+
+def _read_source(path: Path) -> Tuple[str, str] | None:
+    """Read ``path`` as UTF-8 and hash it; ``None`` when it cannot be read.
+
+    Uses one ``os.read`` sized by ``fstat`` instead of the buffered text IO stack, but keeps
+    ``read_text`` semantics (universal newlines) so hashes and parses are unchanged.
+    """
+
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            size = os.fstat(fd).st_size
+            chunks: List[bytes] = []
+            while True:
+                chunk = os.read(fd, max(size, 1 << 16))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size = 0  # anything past st_size (file grew) is read in default-sized chunks
+        finally:
+            os.close(fd)
+        source = (chunks[0] if len(chunks) == 1 else b"".join(chunks)).decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    return source, hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+# root -> {relative posix path -> (stat stamp, ns when stat'ed, sha256 hex digest, encoded fragment)}; lets
+# repeated builds in one process (watch loops, tests, library callers) skip reading and hashing files whose
+# stat is unchanged. Keyed by root because fragments embed the module name derived from it.
+_FRAGMENT_MEMO: Dict[str, Dict[str, Tuple[_StatStamp, int, str, bytes]]] = {}
+_FRAGMENT_MEMO_ROOTS = 4
+
+
+def _parse_modules(root: Path, rel_paths: List[Path], cache: IRFragmentCache | None) -> List[_ParsedModule | None]:
+    """Parse ``rel_paths`` in order, reusing cached fragments and fanning misses out to worker processes.
+
+    With a ``cache``, files whose stat matches the in-process memo are decoded without being read,
+    unless they were modified within ``_RACY_WINDOW_NS`` of the build that recorded them.
+    """
+
+    results: List[_ParsedModule | None] = [None] * len(rel_paths)
+    misses: List[Tuple[int, str, str]] = []  # (index, source, file_hash)
+    stamps: List[_StatStamp | None] = [None] * len(rel_paths)
+    to_read: List[int] = []
+    root_memo = _fragment_memo_for_root(root) if cache is not None else {}
+    stat_ns = time.time_ns()
+    for i, rel_path in enumerate(rel_paths):
+        if cache is None:
+            to_read.append(i)
+            continue
+        try:
+            st = os.stat(root / rel_path)
+        except OSError:
+            continue
+        stamp = _stat_stamp(st)
+        memo = root_memo.get(rel_path.as_posix())
+        if memo is not None and memo[0] == stamp and max(st.st_mtime_ns, st.st_ctime_ns) < memo[1] - _RACY_WINDOW_NS:
+            results[i] = _decode_fragment(rel_path, memo[2], memo[3])
+            continue
+        stamps[i] = stamp
+        to_read.append(i)
+
+    abs_paths = [root / rel_paths[i] for i in to_read]
+    if len(abs_paths) >= _THREADED_READ_MIN_FILES:
+        # Keep many reads in flight so cold-cache I/O overlaps; hashing also releases the GIL.
+        with ThreadPoolExecutor(max_workers=min(32, len(abs_paths))) as pool:
+            loaded = list(pool.map(_read_source, abs_paths))
+    else:
+        loaded = [_read_source(path) for path in abs_paths]
+    for i, item in zip(to_read, loaded):
+        if item is None:
+            # Skip unreadable files; we may want to surface these later.
+            continue
+        rel_path = rel_paths[i]
+        source, file_hash = item
+        blob = None
+        if cache is not None:
+            memo = root_memo.get(rel_path.as_posix())
+            blob = memo[3] if memo is not None and memo[2] == file_hash else cache.get(rel_path.as_posix(), file_hash)
+        if blob is not None:
+            try:
+                results[i] = _decode_fragment(rel_path, file_hash, blob)
+            except (ValueError, KeyError, TypeError):
+                pass  # corrupt entry; re-parse below
+            else:
+                _remember_fragment(root_memo, rel_path, stamps[i], stat_ns, file_hash, blob)
+                continue
+        misses.append((i, source, file_hash))
+
+    miss_paths = [rel_paths[i] for i, _, _ in misses]
+    sources = [source for _, source, _ in misses]
+    hashes = [file_hash for _, _, file_hash in misses]
+    parsed: List[_ParsedModule | None] | None = None
+    if len(misses) >= _PARALLEL_PARSE_MIN_FILES and (os.cpu_count() or 1) > 1:
+        try:
+            with ProcessPoolExecutor() as pool:
+                parsed = list(pool.map(_parse_module, repeat(root), miss_paths, sources, hashes, chunksize=8))
+        except (OSError, BrokenProcessPool):
+            # No usable worker processes here (e.g. sandboxed); parse serially instead.
+            parsed = None
+    if parsed is None:
+        parsed = [_parse_module(root, *args) for args in zip(miss_paths, sources, hashes)]
+
+    for (i, _, file_hash), fragment in zip(misses, parsed):
+        results[i] = fragment
+        if cache is not None and fragment is not None:
+            # Encode before the caller assigns repository-wide ids.
+            blob = _encode_fragment(fragment)
+            cache.put(rel_paths[i].as_posix(), file_hash, blob)
+            _remember_fragment(root_memo, rel_paths[i], stamps[i], stat_ns, file_hash, blob)
+    return results
+
+
+def _fragment_memo_for_root(root: Path) -> Dict[str, Tuple[_StatStamp, int, str, bytes]]:
+    key = os.fspath(root)
+    memo = _FRAGMENT_MEMO.get(key)
+    if memo is None:
+        if len(_FRAGMENT_MEMO) >= _FRAGMENT_MEMO_ROOTS:
+            _FRAGMENT_MEMO.clear()
+        memo = _FRAGMENT_MEMO[key] = {}
+    return memo
+
+
+def _remember_fragment(
+    memo: Dict[str, Tuple[_StatStamp, int, str, bytes]],
+    rel_path: Path,
+    stamp: _StatStamp | None,
+    stat_ns: int,
+    file_hash: str,
+    blob: bytes,
+) -> None:
+    if stamp is not None:
+        memo[rel_path.as_posix()] = (stamp, stat_ns, file_hash, blob)
+
+
+@dataclass(slots=True)
+class _ResolutionContext:
+    """Per-module name tables consulted while resolving call targets."""
+
+    module_aliases: Dict[str, str]  # local alias -> imported module
+    func_imports: Dict[str, Tuple[str, str]]  # local name -> (module, imported name)
+    class_lookup: Dict[str, ClassIR]  # bare, module-local and qualified class names
+    local_functions: Dict[str, FunctionIR]  # bare names and qualnames; first definition wins
+
+
+def _module_resolution_context(module: ModuleIR) -> _ResolutionContext:
+    module_aliases: Dict[str, str] = {}
+    func_imports: Dict[str, Tuple[str, str]] = {}
+    class_lookup: Dict[str, ClassIR] = {}
+    prefix = f"{module.module_name}."
+    for cls in module.classes:
+        class_lookup[cls.name] = cls
+        qual = cls.qualified_name
+        class_lookup[qual] = cls
+        if qual.startswith(prefix):
+            class_lookup[qual[len(prefix) :]] = cls
+    for imp in module.imports:
+        if imp.kind == "import":
+            imported_module = imp.name
+            local_name = imp.alias or imported_module.split(".")[-1]
+            module_aliases[local_name] = imported_module
+        elif imp.kind == "from":
+            imported_module = imp.module or ""
+            local_name = imp.alias or imp.name
+            func_imports[local_name] = (imported_module, imp.name)
+    local_functions: Dict[str, FunctionIR] = {}
+    for candidate in module.functions:
+        local_functions.setdefault(candidate.name, candidate)
+        local_functions.setdefault(candidate.qualname, candidate)
+    return _ResolutionContext(module_aliases, func_imports, class_lookup, local_functions)
+
+
+def _build_reexport_parents(modules: List[ModuleIR]) -> Dict[str, str]:
+    """Map ``package.name`` spellings to where the name is actually defined.
+
+    Covers absolute ``from src import orig as name`` re-exports (``module.name -> src.orig``)
+    and functions defined in a package's ``__init__`` (``pkg.f -> pkg.__init__.f``). Entries
+    chain, so callers resolve them with :func:`_find_canonical_name`.
+    """
+
+    parents: Dict[str, str] = {}
+    for module in modules:
+        owner = module.module_name
+        if owner.endswith(".__init__"):
+            owner = owner[: -len(".__init__")]
+            for fn in module.functions:
+                if fn.kind == "function":
+                    parents.setdefault(f"{owner}.{fn.name}", fn.qualified_name)
+        for imp in module.imports:
+            if imp.kind != "from" or not imp.module or imp.name == "*":
+                continue
+            spelled = f"{owner}.{imp.alias or imp.name}"
+            source = f"{imp.module}.{imp.name}"
+            if spelled != source:
+                parents.setdefault(spelled, source)
+    return parents
+
+
+def _find_canonical_name(parents: Dict[str, str], name: str) -> str:
+    """Follow re-export links from ``name`` to its definition, compressing the path behind it."""
+
+    path: List[str] = []
+    seen: Set[str] = set()
+    while name in parents and name not in seen:
+        seen.add(name)
+        path.append(name)
+        name = parents[name]
+    for alias in path:
+        parents[alias] = name
+    return name
+
+
+def build_repository_ir(root: Path, *, use_cache: bool = False) -> RepositoryIR:
     """Build a RepositoryIR for all Python files under ``root``.
 
     Currently extracts modules, imports, functions, intra-function call sites,
-    and derives module import and call graph edges.
+    and derives module import and call graph edges. Without ``use_cache`` the
+    build is read-only. With it, per-file fragments are reused from (and written
+    to) ``.neurocode/ir-cache.sqlite`` when the source is unchanged.
     """
 
     root = root.resolve()
     rel_paths = discover_python_files(root)
+    cache = IRFragmentCache.for_repo(root, _IR_CACHE_VERSION) if use_cache else None
+    try:
+        parsed_modules = _parse_modules(root, rel_paths, cache)
+    finally:
+        if cache is not None:
+            cache.close(keep_paths=[rel_path.as_posix() for rel_path in rel_paths])
 
     modules: List[ModuleIR] = []
     module_id = 0
@@ -355,47 +762,47 @@ def build_repository_ir(root: Path) -> RepositoryIR:
     # First pass: build per-module IR (imports, functions, call sites).
     module_extras: Dict[int, Dict[str, object]] = {}
 
-    for rel_path in rel_paths:
-        abs_path = root / rel_path
-        try:
-            source = abs_path.read_text(encoding="utf-8")
-        except OSError:
-            # Skip unreadable files; we may want to surface these later.
-            continue
-
-        try:
-            tree = ast.parse(source, filename=str(abs_path))
-        except SyntaxError:
-            # Skip files that fail to parse; we may want to log these later.
+    for parsed in parsed_modules:
+        if parsed is None:
             continue
 
-        mod_name = module_name_from_path(root, rel_path)
-        visitor = _IRVisitor(module_id=module_id, module_name=mod_name)
-        visitor.visit(tree)
-
-        for cls in visitor.classes:
+        # Fragments arrive from worker processes or the JSON cache as fresh strings; intern the
+        # ones used as lookup keys during call resolution so repeats share one object.
+        for imp in parsed.imports:
+            imp.kind = sys.intern(imp.kind)
+            imp.name = sys.intern(imp.name)
+            if imp.module is not None:
+                imp.module = sys.intern(imp.module)
+        for fn in parsed.functions:
+            fn.module_id = module_id
+            fn.qualified_name = sys.intern(fn.qualified_name)
+            for call in fn.calls:
+                call.target = sys.intern(call.target)
+        for call in parsed.module_calls:
+            call.target = sys.intern(call.target)
+        for cls in parsed.classes:
+            cls.module_id = module_id
+            cls.qualified_name = sys.intern(cls.qualified_name)
             cls.id = next_class_id
             next_class_id += 1
             for method in cls.methods:
                 method.parent_class_id = cls.id
                 method.parent_class_qualified_name = cls.qualified_name
 
-        file_hash = hashlib.sha256(source.encode("utf-8")).hexdigest()
-
         module_ir = ModuleIR(
             id=module_id,
-            path=rel_path,
-            module_name=mod_name,
-            file_hash=file_hash,
-            classes=visitor.classes,
-            imports=visitor.imports,
-            functions=visitor.functions,
-            has_main_guard=visitor.has_main_guard,
+            path=parsed.rel_path,
+            module_name=sys.intern(parsed.module_name),
+            file_hash=parsed.file_hash,
+            classes=parsed.classes,
+            imports=parsed.imports,
+            functions=parsed.functions,
+            has_main_guard=parsed.has_main_guard,
         )
         modules.append(module_ir)
         module_extras[module_id] = {
-            "module_calls": visitor.module_calls,
-            "main_guard_calls": visitor.main_guard_calls,
+            "module_calls": parsed.module_calls,
+            "main_guard_calls": parsed.main_guard_calls,
         }
         module_id += 1
 
@@ -449,8 +856,10 @@ def build_repository_ir(root: Path) -> RepositoryIR:
                 function_by_symbol_id[fn.symbol_id] = fn
 
     # Module import edges (module -> imported module name).
-    module_import_edge_pairs: set[Tuple[int, str]] = set()
+    # Modules are visited in id order, so sorting each module's names yields the (id, name) order.
+    module_import_edges: List[ModuleImportEdgeIR] = []
     for module in modules:
+        imported_names: Set[str] = set()
         for imp in module.imports:
             imported_module: str | None
             if imp.kind == "import":
@@ -460,12 +869,10 @@ def build_repository_ir(root: Path) -> RepositoryIR:
             else:  # pragma: no cover - defensive
                 imported_module = None
             if imported_module:
-                module_import_edge_pairs.add((module.id, imported_module))
-
-    module_import_edges = [
-        ModuleImportEdgeIR(importer_module_id=mod_id, imported_module=mod_name)
-        for (mod_id, mod_name) in sorted(module_import_edge_pairs, key=lambda pair: pair)
-    ]
+                imported_names.add(imported_module)
+        module_import_edges.extend(
+            ModuleImportEdgeIR(importer_module_id=module.id, imported_module=name) for name in sorted(imported_names)
+        )
 
     # Call graph edges (caller function -> callee function when resolvable).
     call_edges: List[CallEdgeIR] = []
@@ -475,30 +882,29 @@ def build_repository_ir(root: Path) -> RepositoryIR:
         for cls in module.classes:
             class_by_id[cls.id] = cls
             class_by_qualified_name[cls.qualified_name] = cls
+    reexport_parents = _build_reexport_parents(modules)
+    # Module ids are list positions, so contexts can be indexed by ``module.id``.
+    resolution_contexts = [_module_resolution_context(module) for module in modules]
 
     for module in modules:
-        # Build simple import alias maps for this module.
-        module_aliases: Dict[str, str] = {}
-        func_imports: Dict[str, Tuple[str, str]] = {}
-        class_lookup: Dict[str, ClassIR] = {}
-        for cls in module.classes:
-            class_lookup[cls.name] = cls
-            qual = cls.qualified_name
-            class_lookup[qual] = cls
-            if qual.startswith(f"{module.module_name}."):
-                local = qual[len(module.module_name) + 1 :]
-                class_lookup[local] = cls
-        for imp in module.imports:
-            if imp.kind == "import":
-                imported_module = imp.name
-                local_name = imp.alias or imported_module.split(".")[-1]
-                module_aliases[local_name] = imported_module
-            elif imp.kind == "from":
-                imported_module = imp.module or ""
-                local_name = imp.alias or imp.name
-                func_imports[local_name] = (imported_module, imp.name)
+        ctx = resolution_contexts[module.id]
+        module_aliases = ctx.module_aliases
+        func_imports = ctx.func_imports
+        class_lookup = ctx.class_lookup
+        local_functions = ctx.local_functions
+
+        # Base-name resolution depends on this module's class_lookup, so both memos are per module.
+        resolved_class_names: Dict[str, ClassIR | None] = {}
+        hierarchy_cache: Dict[int, List[ClassIR]] = {}
 
         def _resolve_class_name(name: str) -> ClassIR | None:
+            if name in resolved_class_names:
+                return resolved_class_names[name]
+            resolved = _lookup_class_name(name)
+            resolved_class_names[name] = resolved
+            return resolved
+
+        def _lookup_class_name(name: str) -> ClassIR | None:
             if not name:
                 return None
             candidate = class_lookup.get(name)
@@ -518,6 +924,9 @@ def build_repository_ir(root: Path) -> RepositoryIR:
             return None
 
         def _iter_class_hierarchy(start_cls: ClassIR) -> List[ClassIR]:
+            cached = hierarchy_cache.get(start_cls.id)
+            if cached is not None:
+                return cached
             ordered: List[ClassIR] = []
             stack: List[ClassIR] = [start_cls]
             seen: Set[int] = set()
@@ -531,8 +940,32 @@ def build_repository_ir(root: Path) -> RepositoryIR:
                     base_cls = _resolve_class_name(base_name)
                     if base_cls is not None and base_cls.id not in seen:
                         stack.append(base_cls)
+            hierarchy_cache[start_cls.id] = ordered
             return ordered
 
+        def _resolve_imported_name(target: str) -> FunctionIR | None:
+            imported = func_imports.get(target)
+            if imported is None:
+                return None
+            imported_module, original_name = imported
+            if not imported_module:
+                return None
+            return _resolve_module_attribute(imported_module, original_name)
+
+        def _resolve_module_attribute(imported_module: str, name: str) -> FunctionIR | None:
+            qualified = f"{imported_module}.{name}"
+            fn_obj = function_by_qualified.get(qualified)
+            if fn_obj is not None:
+                return fn_obj
+            fn_obj = function_by_symbol_id.get(_make_symbol_id(imported_module, name))
+            if fn_obj is not None:
+                return fn_obj
+            # Re-exported through a package (``from pkg import f`` with f defined in pkg.impl).
+            canonical = _find_canonical_name(reexport_parents, qualified)
+            if canonical != qualified:
+                return function_by_qualified.get(canonical)
+            return None
+
         def _resolve_call_target(target: str, caller: FunctionIR) -> FunctionIR | None:
             # 1) Fully-qualified function name.
             fn_obj = function_by_qualified.get(target)
@@ -544,126 +977,96 @@ def build_repository_ir(root: Path) -> RepositoryIR:
                 return function_by_symbol_id[target]
 
             # 3) Local function in the same module.
-            for candidate in module.functions:
-                if candidate.name == target or candidate.qualname == target:
-                    return candidate
+            fn_obj = local_functions.get(target)
+            if fn_obj is not None:
+                return fn_obj
+
+            # Everything below either needs ``from``-imports or splits a dotted target; split it once.
+            if "." not in target:
+                return _resolve_imported_name(target)
+            head, _, rest = target.partition(".")
+            head_attr = rest.partition(".")[0]
+            owner_expr, _, last_attr = target.rpartition(".")
 
             # 3b) Methods referenced via self/cls.
-            if "." in target and caller.parent_class_id is not None:
+            if caller.parent_class_id is not None:
                 owning_class = class_by_id.get(caller.parent_class_id)
                 if owning_class is not None:
-                    prefix, rest = target.split(".", 1)
-                    method_name: str | None = None
                     candidate_classes: List[ClassIR] = []
                     hierarchy = _iter_class_hierarchy(owning_class)
-                    if prefix in {"self", "cls"}:
-                        method_name = rest.split(".", 1)[0]
-                        candidate_classes.extend(hierarchy)
-                    elif prefix.startswith("super()") or prefix.startswith("super("):
-                        method_name = rest.split(".", 1)[0]
-                        candidate_classes.extend(hierarchy[1:])
-                    if method_name:
+                    if head in {"self", "cls"}:
+                        candidate_classes = hierarchy
+                    elif head.startswith("super()") or head.startswith("super("):
+                        candidate_classes = hierarchy[1:]
+                    if head_attr:
                         for candidate_cls in candidate_classes:
-                            qualified = f"{candidate_cls.qualified_name}.{method_name}"
+                            qualified = f"{candidate_cls.qualified_name}.{head_attr}"
                             fn_obj = function_by_qualified.get(qualified)
                             if fn_obj is not None:
                                 return fn_obj
 
             # 4) Imported function via "from module import name".
-            if target in func_imports:
-                imported_module, original_name = func_imports[target]
-                if imported_module:
-                    qualified = f"{imported_module}.{original_name}"
-                    fn_obj = function_by_qualified.get(qualified)
-                    if fn_obj is not None:
-                        return fn_obj
-                    symbol_id = _make_symbol_id(imported_module, original_name)
-                    fn_obj = function_by_symbol_id.get(symbol_id)
-                    if fn_obj is not None:
-                        return fn_obj
+            fn_obj = _resolve_imported_name(target)
+            if fn_obj is not None:
+                return fn_obj
 
             # 5) Module alias + attribute: alias.func
-            if "." in target:
-                prefix, rest = target.split(".", 1)
-                if prefix in module_aliases:
-                    imported_module = module_aliases[prefix]
-                    func_name = rest.split(".", 1)[0]
-                    qualified = f"{imported_module}.{func_name}"
-                    fn_obj = function_by_qualified.get(qualified)
-                    if fn_obj is not None:
-                        return fn_obj
-                    symbol_id = _make_symbol_id(imported_module, func_name)
-                    fn_obj = function_by_symbol_id.get(symbol_id)
-                    if fn_obj is not None:
-                        return fn_obj
+            imported_module = module_aliases.get(head)
+            if imported_module is not None:
+                fn_obj = _resolve_module_attribute(imported_module, head_attr)
+                if fn_obj is not None:
+                    return fn_obj
 
             # 6) Direct class reference: ClassName.method
-            if "." in target:
-                class_expr, method_expr = target.rsplit(".", 1)
-                cls = class_lookup.get(class_expr)
-                if cls is not None:
-                    method_name = method_expr.split(".", 1)[0]
-                    qualified = f"{cls.qualified_name}.{method_name}"
-                    fn_obj = function_by_qualified.get(qualified)
-                    if fn_obj is not None:
-                        return fn_obj
-                    symbol_id = _make_symbol_id(cls.module, f"{cls.qualified_name.split('.',1)[-1]}.{method_name}")
-                    fn_obj = function_by_symbol_id.get(symbol_id)
-                    if fn_obj is not None:
-                        return fn_obj
-
-            # 7) Best-effort: dotted string with module prefix.
-            if "." in target:
-                parts = target.split(".")
-                if len(parts) >= 2:
-                    module_part = ".".join(parts[:-1])
-                    qual_part = parts[-1]
-                    symbol_candidate = _make_symbol_id(module_part, qual_part)
-                    fn_obj = function_by_symbol_id.get(symbol_candidate)
-                    if fn_obj is not None:
-                        return fn_obj
-                    qualified = f"{module_part}.{qual_part}"
-                    fn_obj = function_by_qualified.get(qualified)
-                    if fn_obj is not None:
-                        return fn_obj
-            return None
+            cls = class_lookup.get(owner_expr)
+            if cls is not None:
+                qualified = f"{cls.qualified_name}.{last_attr}"
+                fn_obj = function_by_qualified.get(qualified)
+                if fn_obj is not None:
+                    return fn_obj
+                symbol_id = _make_symbol_id(cls.module, f"{cls.qualified_name.split('.', 1)[-1]}.{last_attr}")
+                fn_obj = function_by_symbol_id.get(symbol_id)
+                if fn_obj is not None:
+                    return fn_obj
+
+            # 7) Best-effort: dotted string with module prefix. (The plain qualified form
+            # ``owner.attr`` is the target itself, already tried in step 1.)
+            return function_by_symbol_id.get(_make_symbol_id(owner_expr, last_attr))
+
+        # The same targets (builtins, self.helper, imported names) recur throughout a module, and
+        # resolution only depends on the caller through its owning class, so memoize per module.
+        resolved_targets: Dict[Tuple[str, int | None], Tuple[int | None, str | None]] = {}
+
+        def _append_edges(caller: FunctionIR, calls: List[CallIR]) -> None:
+            caller_id = caller.id
+            caller_symbol_id = caller.symbol_id
+            class_id = caller.parent_class_id
+            append_edge = call_edges.append
+            for call in calls:
+                target = call.target
+                key = (target, class_id)
+                resolved = resolved_targets.get(key)
+                if resolved is None:
+                    callee = _resolve_call_target(target, caller)
+                    resolved = (callee.id, callee.symbol_id) if callee else (None, None)
+                    resolved_targets[key] = resolved
+                callee_id, callee_symbol_id = resolved
+                # Positional in field order: caller_function_id, callee_function_id, lineno, target,
+                # caller_symbol_id, callee_symbol_id. Keyword passing costs ~2x per edge here.
+                append_edge(CallEdgeIR(caller_id, callee_id, call.lineno, target, caller_symbol_id, callee_symbol_id))
 
         # Regular function bodies
         for fn in module.functions:
             if fn.kind == "module":
                 continue
-            for call in fn.calls:
-                target = call.target
-                callee = _resolve_call_target(target, fn)
-
-                call_edges.append(
-                    CallEdgeIR(
-                        caller_function_id=fn.id,
-                        callee_function_id=callee.id if callee else None,
-                        lineno=call.lineno,
-                        target=target,
-                        caller_symbol_id=fn.symbol_id,
-                        callee_symbol_id=callee.symbol_id if callee else None,
-                    )
-                )
+            _append_edges(fn, fn.calls)
 
         # Module-level entry calls
         module_call_list = module_extras.get(module.id, {}).get("module_calls", [])  # type: ignore[index]
         entry_fn = next((f for f in module.functions if f.kind == "module"), None)
-        if entry_fn:
-            for call in module_call_list or []:
-                callee = _resolve_call_target(call.target, entry_fn)
-                entry_fn.calls.append(call)
-                call_edges.append(
-                    CallEdgeIR(
-                        caller_function_id=entry_fn.id,
-                        callee_function_id=callee.id if callee else None,
-                        lineno=call.lineno,
-                        target=call.target,
-                        caller_symbol_id=entry_fn.symbol_id,
-                        callee_symbol_id=callee.symbol_id if callee else None,
-                    )
-                )
+        if entry_fn and module_call_list:
+            entry_fn.calls.extend(module_call_list)  # type: ignore[arg-type]
+            _append_edges(entry_fn, module_call_list)  # type: ignore[arg-type]
 
     # Entry points from pyproject
     console_scripts = load_console_scripts(root)
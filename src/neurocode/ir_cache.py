@@ -0,0 +1,77 @@
+"""Persistent per-file cache of IR fragments, stored in ``.neurocode/ir-cache.sqlite``.
+
+Entries are keyed by ``(relative path, sha256 of the source)`` so an edited file
+simply misses. Blobs are opaque bytes; encoding them is up to the caller.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+IR_CACHE_FILENAME = "ir-cache.sqlite"
+
+
+class IRFragmentCache:
+    """A small SQLite-backed ``(path, sha) -> blob`` store.
+
+    ``schema_version`` is recorded in ``PRAGMA user_version``; a mismatch drops all
+    cached rows, so bump it whenever the blob encoding changes. Writes are buffered
+    and committed in one transaction by :meth:`close`.
+    """
+
+    def __init__(self, db_path: Path, schema_version: int) -> None:
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path))
+        self._pending: Dict[str, Tuple[str, bytes]] = {}
+        conn = self._conn
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != schema_version:
+            conn.execute("DROP TABLE IF EXISTS ir_cache")
+            conn.execute(f"PRAGMA user_version = {int(schema_version)}")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS ir_cache(path TEXT PRIMARY KEY, sha TEXT NOT NULL, blob BLOB NOT NULL)"
+        )
+        conn.commit()
+
+    @classmethod
+    def for_repo(cls, root: Path, schema_version: int) -> "IRFragmentCache | None":
+        """Open the cache under ``root/.neurocode``; ``None`` when it cannot be used."""
+
+        try:
+            return cls(root / ".neurocode" / IR_CACHE_FILENAME, schema_version)
+        except (OSError, sqlite3.Error):
+            return None
+
+    def get(self, path: str, sha: str) -> bytes | None:
+        try:
+            row = self._conn.execute("SELECT blob FROM ir_cache WHERE path = ? AND sha = ?", (path, sha)).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def put(self, path: str, sha: str, blob: bytes) -> None:
+        self._pending[path] = (sha, blob)
+
+    def close(self, keep_paths: Iterable[str] | None = None) -> None:
+        """Flush pending writes and close; rows for paths outside ``keep_paths`` are pruned."""
+
+        conn = self._conn
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO ir_cache(path, sha, blob) VALUES (?, ?, ?)",
+                    [(path, sha, blob) for path, (sha, blob) in self._pending.items()],
+                )
+                if keep_paths is not None:
+                    keep = set(keep_paths)
+                    stale = [(p,) for (p,) in conn.execute("SELECT path FROM ir_cache") if p not in keep]
+                    conn.executemany("DELETE FROM ir_cache WHERE path = ?", stale)
+        except sqlite3.Error:
+            # The cache is an optimization only; a failed flush just means a colder next run.
+            pass
+        finally:
+            self._pending.clear()
+            conn.close()
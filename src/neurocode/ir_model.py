@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import Any, Callable, Dict, List, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class ImportIR:
     """Represents a single import statement in a module."""
 
@@ -15,7 +17,7 @@ class ImportIR:
     alias: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class CallIR:
     """Represents a single call site inside a function."""
 
@@ -24,7 +26,7 @@ class CallIR:
     in_entrypoint: bool = False  # True when call is from module-level/__main__
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleImportEdgeIR:
     """Represents a module-level import edge: importer -> imported module name."""
 
@@ -32,7 +34,7 @@ class ModuleImportEdgeIR:
     imported_module: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CallEdgeIR:
     """Represents a resolved call graph edge between functions.
 
@@ -48,7 +50,20 @@ class CallEdgeIR:
     callee_symbol_id: str | None
 
 
-@dataclass
+@dataclass(slots=True)
+class CallEdgeColumns:
+    """Struct-of-arrays view of ``RepositoryIR.call_edges``; row ``i`` mirrors ``call_edges[i]``.
+
+    Unresolved callees are stored as ``-1`` so every column is a flat ``array("q")``
+    that graph-wide filters can scan without touching the edge objects.
+    """
+
+    caller_function_ids: array
+    callee_function_ids: array
+    linenos: array
+
+
+@dataclass(slots=True)
 class FunctionIR:
     """Represents a function or method within a module."""
 
@@ -67,9 +82,10 @@ class FunctionIR:
     parent_class_id: int | None = None
     parent_class_qualified_name: str | None = None
     calls: List[CallIR] = field(default_factory=list)
+    end_lineno: int | None = None  # last line of the def body; None when unknown
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassIR:
     """Represents a class defined within a module."""
 
@@ -84,7 +100,7 @@ class ClassIR:
     methods: List[FunctionIR] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleIR:
     """Represents a single Python module (file) in the repository."""
 
@@ -100,7 +116,7 @@ class ModuleIR:
     functions: List[FunctionIR] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryIR:
     """Top-level IR for a repository.
 
@@ -117,6 +133,8 @@ class RepositoryIR:
     test_mappings: List[tuple[str, str]] = field(default_factory=list)  # (test_symbol_id, target_symbol_id)
     config_paths: List[str] = field(default_factory=list)
     console_scripts: List[tuple[str, str]] = field(default_factory=list)  # (name, target_symbol)
+    # Lazily built lookup tables shared by the explain/query helpers; see ``invalidate_indexes``.
+    _indexes: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @property
     def num_modules(self) -> int:
@@ -124,12 +142,182 @@ class RepositoryIR:
 
     @property
     def num_classes(self) -> int:
-        return sum(len(m.classes) for m in self.modules)
+        return self._counts()[0]
 
     @property
     def num_functions(self) -> int:
-        return sum(len([fn for fn in m.functions if fn.kind != "module"]) for m in self.modules)
+        return self._counts()[1]
 
     @property
     def num_calls(self) -> int:
-        return sum(len(f.calls) for m in self.modules for f in m.functions)
+        return self._counts()[2]
+
+    def _counts(self) -> Tuple[int, int, int]:
+        """Cached ``(classes, non-module functions, calls)``, gathered in one pass over the modules."""
+
+        def build() -> Tuple[int, int, int]:
+            num_classes = num_functions = num_calls = 0
+            for module in self.modules:
+                num_classes += len(module.classes)
+                for fn in module.functions:
+                    num_calls += len(fn.calls)
+                    if fn.kind != "module":
+                        num_functions += 1
+            return num_classes, num_functions, num_calls
+
+        return self._cached_index("counts", build)
+
+    def _cached_index(self, key: str, build: Callable[[], Any]) -> Any:
+        index = self._indexes.get(key)
+        if index is None:
+            index = build()
+            self._indexes[key] = index
+        return index
+
+    def invalidate_indexes(self) -> None:
+        """Drop cached lookup tables and counts; call after mutating modules or edges in place."""
+
+        self._indexes.clear()
+
+    def modules_by_id(self) -> Dict[int, ModuleIR]:
+        """Return a cached ``{module id: ModuleIR}`` map."""
+
+        return self._cached_index("modules_by_id", lambda: {m.id: m for m in self.modules})
+
+    def module_paths_by_id(self) -> Dict[int, Path]:
+        """Return a cached ``{module id: repo-relative path}`` map."""
+
+        return self._cached_index("module_paths_by_id", lambda: {m.id: m.path for m in self.modules})
+
+    def functions_by_id(self) -> Dict[int, FunctionIR]:
+        """Return a cached ``{function id: FunctionIR}`` map across all modules."""
+
+        return self._cached_index(
+            "functions_by_id",
+            lambda: {fn.id: fn for m in self.modules for fn in m.functions},
+        )
+
+    def functions_by_qualified_name(self) -> Dict[str, FunctionIR]:
+        """Return a cached ``{qualified name: FunctionIR}`` map (first definition wins)."""
+
+        def build() -> Dict[str, FunctionIR]:
+            index: Dict[str, FunctionIR] = {}
+            for m in self.modules:
+                for fn in m.functions:
+                    index.setdefault(fn.qualified_name, fn)
+            return index
+
+        return self._cached_index("functions_by_qualified_name", build)
+
+    def functions_by_symbol_id(self) -> Dict[str, FunctionIR]:
+        """Return a cached ``{symbol id: FunctionIR}`` map (first definition wins)."""
+
+        def build() -> Dict[str, FunctionIR]:
+            index: Dict[str, FunctionIR] = {}
+            for m in self.modules:
+                for fn in m.functions:
+                    index.setdefault(fn.symbol_id, fn)
+            return index
+
+        return self._cached_index("functions_by_symbol_id", build)
+
+    def functions_by_module(self) -> Dict[int, List[FunctionIR]]:
+        """Return cached ``{module id: [FunctionIR, ...]}`` sorted by line, without module entries."""
+
+        def build() -> Dict[int, List[FunctionIR]]:
+            by_lineno = attrgetter("lineno")
+            return {
+                m.id: sorted((fn for fn in m.functions if fn.kind != "module"), key=by_lineno)
+                for m in self.modules
+            }
+
+        return self._cached_index("functions_by_module", build)
+
+    def call_edges_by_caller(self) -> Dict[int, List[CallEdgeIR]]:
+        """Return cached ``{caller function id: [CallEdgeIR, ...]}`` buckets sorted by line."""
+
+        def build() -> Dict[int, List[CallEdgeIR]]:
+            buckets: Dict[int, List[CallEdgeIR]] = {}
+            for edge in self.call_edges:
+                buckets.setdefault(edge.caller_function_id, []).append(edge)
+            by_lineno = attrgetter("lineno")
+            for edges in buckets.values():
+                edges.sort(key=by_lineno)
+            return buckets
+
+        return self._cached_index("call_edges_by_caller", build)
+
+    def call_edge_columns(self) -> CallEdgeColumns:
+        """Return a cached :class:`CallEdgeColumns` view of ``call_edges``."""
+
+        def build() -> CallEdgeColumns:
+            edges = self.call_edges
+            return CallEdgeColumns(
+                caller_function_ids=array("q", [edge.caller_function_id for edge in edges]),
+                callee_function_ids=array(
+                    "q", [-1 if edge.callee_function_id is None else edge.callee_function_id for edge in edges]
+                ),
+                linenos=array("q", [edge.lineno for edge in edges]),
+            )
+
+        return self._cached_index("call_edge_columns", build)
+
+    def call_edges_by_callee(self) -> Dict[int, List[CallEdgeIR]]:
+        """Return cached ``{callee function id: [CallEdgeIR, ...]}`` buckets in edge order.
+
+        Unresolved edges (``callee_function_id is None``) are not indexed.
+        """
+
+        def build() -> Dict[int, List[CallEdgeIR]]:
+            buckets: Dict[int, List[CallEdgeIR]] = {}
+            for edge in self.call_edges:
+                if edge.callee_function_id is not None:
+                    buckets.setdefault(edge.callee_function_id, []).append(edge)
+            return buckets
+
+        return self._cached_index("call_edges_by_callee", build)
+
+    def imports_by_importer(self) -> Dict[int, Tuple[str, ...]]:
+        """Return cached ``{importer module id: sorted unique imported module names}``.
+
+        Values are tuples so callers can share them without copying.
+        """
+
+        def build() -> Dict[int, Tuple[str, ...]]:
+            grouped: Dict[int, set[str]] = {}
+            for edge in self.module_import_edges:
+                grouped.setdefault(edge.importer_module_id, set()).add(edge.imported_module)
+            return {module_id: tuple(sorted(names)) for module_id, names in grouped.items()}
+
+        return self._cached_index("imports_by_importer", build)
+
+    def modules_by_path(self) -> Dict[Path, ModuleIR]:
+        """Return a cached ``{repo-relative path: ModuleIR}`` map (first module wins)."""
+
+        def build() -> Dict[Path, ModuleIR]:
+            index: Dict[Path, ModuleIR] = {}
+            for m in self.modules:
+                index.setdefault(m.path, m)
+            return index
+
+        return self._cached_index("modules_by_path", build)
+
+    def functions_by_qualified_suffix(self) -> Dict[str, List[FunctionIR]]:
+        """Return a cached map from every dotted suffix of a qualified name to its functions.
+
+        ``pkg.mod.Cls.run`` is indexed under ``mod.Cls.run``, ``Cls.run`` and ``run``;
+        each list keeps module/definition order so ``[0]`` is the first match.
+        """
+
+        def build() -> Dict[str, List[FunctionIR]]:
+            index: Dict[str, List[FunctionIR]] = {}
+            for m in self.modules:
+                for fn in m.functions:
+                    qualified_name = fn.qualified_name
+                    dot = qualified_name.find(".")
+                    while dot != -1:
+                        index.setdefault(qualified_name[dot + 1 :], []).append(fn)
+                        dot = qualified_name.find(".", dot + 1)
+            return index
+
+        return self._cached_index("functions_by_qualified_suffix", build)
@@ -0,0 +1,50 @@
+"""JSON helpers that use ``orjson`` when installed and fall back to ``json``."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # optional C-accelerated codec
+    import orjson  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - depends on installed extras
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    # orjson serializes dataclasses and datetimes natively; pass them through so they fail like ``json``.
+    _ORJSON_DUMPS_OPTIONS = (
+        orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document from ``bytes`` or ``str``."""
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode ``obj`` as compact UTF-8 JSON bytes."""
+
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Encode ``obj`` as a human-readable JSON string indented by two spaces.
+
+    Both backends coerce non-``str`` dict keys to strings and raise ``TypeError``
+    for dataclasses and datetimes, and finite values decode to the same data.
+    The text itself may differ, so callers must not compare it byte for byte:
+    the ``json`` fallback keeps its default ASCII escaping where ``orjson``
+    writes UTF-8, floats in exponent range are spelled differently (``3.2e-05``
+    vs ``0.000032``, ``1e+16`` vs ``1e16``), and ``NaN``/``Infinity`` become
+    ``null`` under ``orjson``.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_DUMPS_OPTIONS).decode("utf-8")
+    return json.dumps(obj, indent=2)
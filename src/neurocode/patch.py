@@ -2,13 +2,17 @@ from __future__ import annotations
 
 import ast
 import difflib
-from dataclasses import dataclass, field
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 
 from .explain import _find_module_for_file, _find_repo_root_for_file
 from .history_model import append_patch_history
-from .ir_build import compute_file_hash
+from .ir_build import cached_file_hash
 from .ir_model import FunctionIR, ModuleIR, RepositoryIR
 from .patch_plan import load_patch_plan
 from .toon_parse import load_repository_ir
@@ -30,6 +34,13 @@ class PatchResult:
     status: str = "applied"  # applied|planned|noop|error
 
 
+# No-change results of ``apply_patch`` keyed by file, source sha256 and request, so re-running the
+# same fix over an unchanged file skips the parse and idempotency scan. Least recently used entries
+# are evicted beyond ``_NOOP_RESULTS_SIZE``.
+_NOOP_RESULTS: OrderedDict[Tuple[object, ...], PatchResult] = OrderedDict()
+_NOOP_RESULTS_SIZE = 128
+
+
 def apply_patch_from_disk(
     file: Path,
     fix_description: str,
@@ -113,7 +124,7 @@ def apply_patch(
     if module.file_hash:
         curr_path = (repo_root / module.path).resolve()
         try:
-            current_hash = compute_file_hash(curr_path)
+            current_hash = cached_file_hash(curr_path)
         except OSError:
             warnings.append(f"module file missing on disk: {curr_path}")
         else:
@@ -131,40 +142,62 @@ def apply_patch(
     if require_target and target_fn is None:
         raise RuntimeError(f"No target function found in module {module.module_name}")
 
-    source = file.read_text(encoding="utf-8")
-    lines = source.splitlines()
-    had_trailing_newline = source.endswith("\n")
+    source, lines, newline, had_trailing_newline = _read_lines(file)
+    noop_key = (
+        str(file),
+        hashlib.sha256(source.encode("utf-8")).hexdigest(),
+        fix_description,
+        strategy,
+        # The line number is part of the key because the AST lookup below matches on it: a stale IR
+        # that misses the node falls back to the TODO path, and that result must not outlive the IR.
+        target_fn.symbol_id if target_fn is not None else None,
+        target_fn.lineno if target_fn is not None else None,
+        inject_kind,
+        inject_message,
+    )
+    cached_noop = _NOOP_RESULTS.get(noop_key)
+    if cached_noop is not None:
+        _NOOP_RESULTS.move_to_end(noop_key)
+        return replace(cached_noop, warnings=warnings)
     working_lines = list(lines)
 
     guard_inserted = False
 
+    # Parse once for whichever strategy runs; the helpers only receive the target node.
+    func_node: _FunctionNode | None = None
+    if target_fn is not None and strategy in ("guard", "inject"):
+        function_nodes = _function_nodes("\n".join(lines) + "\n")
+        if function_nodes is not None:
+            func_node = function_nodes.get((target_fn.lineno, target_fn.name))
+
     if strategy == "guard" and target_fn is not None:
         guard_inserted, result, inserted_text = _insert_guard_clause(
             lines=working_lines,
             target_fn=target_fn,
+            func_node=func_node,
             fix_description=fix_description,
         )
         if guard_inserted:
             summary = f"guard inserted near {target_fn.qualified_name}"
-            new_text = "\n".join(working_lines)
-            if had_trailing_newline or source == "":
-                new_text += "\n"
             diff_text = _render_diff(lines, working_lines, file)
             if not diff_text:
                 summary = f"guard already present near {target_fn.qualified_name}"
-                return PatchResult(
-                    file=file,
-                    description=fix_description,
-                    target_function=target_fn.qualified_name,
-                    inserted_line=result,
-                    inserted_text=inserted_text,
-                    summary=summary,
-                    diff=None,
-                    warnings=warnings,
-                    no_change=True,
+                return _remember_noop(
+                    noop_key,
+                    PatchResult(
+                        file=file,
+                        description=fix_description,
+                        target_function=target_fn.qualified_name,
+                        inserted_line=result,
+                        inserted_text=inserted_text,
+                        summary=summary,
+                        diff=None,
+                        warnings=warnings,
+                        no_change=True,
+                    ),
                 )
             if not dry_run:
-                file.write_text(new_text, encoding="utf-8")
+                _write_lines(file, working_lines, had_trailing_newline or source == "", newline)
             return PatchResult(
                 file=file,
                 description=fix_description,
@@ -182,31 +215,32 @@ def apply_patch(
         inserted, line_num, injected_text = _inject_stub(
             lines=working_lines,
             target_fn=target_fn,
+            func_node=func_node,
             fix_description=fix_description,
             kind=inject_kind,
             message_override=inject_message,
         )
         if inserted:
             summary = f"inject stub near {target_fn.qualified_name}"
-            new_text = "\n".join(working_lines)
-            if had_trailing_newline or source == "":
-                new_text += "\n"
             diff_text = _render_diff(lines, working_lines, file)
             if not diff_text:
                 summary = f"inject already present near {target_fn.qualified_name}"
-                return PatchResult(
-                    file=file,
-                    description=fix_description,
-                    target_function=target_fn.qualified_name,
-                    inserted_line=line_num,
-                    inserted_text=injected_text,
-                    summary=summary,
-                    diff=None,
-                    warnings=warnings,
-                    no_change=True,
+                return _remember_noop(
+                    noop_key,
+                    PatchResult(
+                        file=file,
+                        description=fix_description,
+                        target_function=target_fn.qualified_name,
+                        inserted_line=line_num,
+                        inserted_text=injected_text,
+                        summary=summary,
+                        diff=None,
+                        warnings=warnings,
+                        no_change=True,
+                    ),
                 )
             if not dry_run:
-                file.write_text(new_text, encoding="utf-8")
+                _write_lines(file, working_lines, had_trailing_newline or source == "", newline)
             return PatchResult(
                 file=file,
                 description=fix_description,
@@ -227,17 +261,20 @@ def apply_patch(
     for idx, line in enumerate(working_lines):
         stripped = line.strip()
         if stripped == comment or stripped.startswith("# TODO(neurocode):"):
-            return PatchResult(
-                file=file,
-                description=fix_description,
-                target_function=target_fn.qualified_name if target_fn else None,
-                inserted_line=idx + 1,
-                inserted_text=comment,
-                summary="todo already present",
-                diff=None,
-                warnings=warnings,
-                no_change=True,
-                status="noop",
+            return _remember_noop(
+                noop_key,
+                PatchResult(
+                    file=file,
+                    description=fix_description,
+                    target_function=target_fn.qualified_name if target_fn else None,
+                    inserted_line=idx + 1,
+                    inserted_text=comment,
+                    summary="todo already present",
+                    diff=None,
+                    warnings=warnings,
+                    no_change=True,
+                    status="noop",
+                ),
             )
     insert_at = 0
     if lines and lines[0].startswith("#!"):
@@ -245,12 +282,9 @@ def apply_patch(
     working_lines.insert(insert_at, comment)
 
     summary = "todo inserted at top of file"
-    new_text = "\n".join(working_lines)
-    if had_trailing_newline or source == "":
-        new_text += "\n"
     diff_text = _render_diff(lines, working_lines, file)
     if not dry_run:
-        file.write_text(new_text, encoding="utf-8")
+        _write_lines(file, working_lines, had_trailing_newline or source == "", newline)
 
     return PatchResult(
         file=file,
@@ -265,50 +299,52 @@ def apply_patch(
     )
 
 
+def _remember_noop(key: Tuple[object, ...], result: PatchResult) -> PatchResult:
+    _NOOP_RESULTS[key] = result
+    _NOOP_RESULTS.move_to_end(key)
+    if len(_NOOP_RESULTS) > _NOOP_RESULTS_SIZE:
+        _NOOP_RESULTS.popitem(last=False)
+    return result
+
+
 def _select_target_function(module: ModuleIR, target: str | None) -> FunctionIR | None:
     """Pick a function to anchor the patch (prefers explicit targets, then module-level)."""
 
-    functions = [fn for fn in module.functions if fn.kind != "module"]
-
     if target:
-        for fn in functions:
-            if fn.qualified_name == target or fn.name == target or fn.qualified_name.endswith(target):
+        # ``qualified_name.endswith(target)`` also covers exact qualified-name and bare-name matches.
+        for fn in module.functions:
+            if fn.kind != "module" and fn.qualified_name.endswith(target):
                 return fn
         return None
 
-    module_level: List[FunctionIR] = [fn for fn in functions if fn.parent_class_id is None]
-    if module_level:
-        return min(module_level, key=lambda f: f.lineno)
-    if functions:
-        return min(functions, key=lambda f: f.lineno)
-    return None
+    # Earliest module-level function, else earliest method; ties keep definition order.
+    first_module_level: FunctionIR | None = None
+    first_any: FunctionIR | None = None
+    for fn in module.functions:
+        if fn.kind == "module":
+            continue
+        if first_any is None or fn.lineno < first_any.lineno:
+            first_any = fn
+        if fn.parent_class_id is None and (first_module_level is None or fn.lineno < first_module_level.lineno):
+            first_module_level = fn
+    return first_module_level or first_any
 
 
 def _insert_guard_clause(
     lines: List[str],
     target_fn: FunctionIR,
+    func_node: _FunctionNode | None,
     fix_description: str,
 ) -> tuple[bool, int, str]:
     """Insert a simple guard clause at the top of the target function body."""
 
-    source = "\n".join(lines) + "\n"
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return False, 0, ""
-
-    func_node: ast.FunctionDef | ast.AsyncFunctionDef | None = None
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if node.lineno == target_fn.lineno and node.name == target_fn.name:
-                func_node = node
-                break
-
     if func_node is None:
         return False, 0, ""
 
     # Skip property-style functions that likely shouldn't get guard clauses.
-    if any(_decorator_name(dec) == "property" for dec in func_node.decorator_list):
+    if func_node.decorator_list and not _GUARD_SKIP_DECORATORS.isdisjoint(
+        map(_decorator_name, func_node.decorator_list)
+    ):
         return False, 0, ""
 
     arg_name = _choose_arg_name(func_node)
@@ -322,9 +358,8 @@ def _insert_guard_clause(
     if _has_neurocode_guard(func_node):
         return True, def_line_idx + 1, ""
 
-    indent = lines[def_line_idx][: len(lines[def_line_idx]) - len(lines[def_line_idx].lstrip())]
+    indent = _leading_whitespace(lines[def_line_idx])
 
-    insert_at = def_line_idx + 1
     insert_at = _body_insert_index(func_node, lines, def_line_idx)
 
     guard_lines = [
@@ -358,18 +393,36 @@ def _apply_replace(lines: List[str], lineno: int, end_lineno: int, code: str) ->
     lines[start:end] = snippet
 
 
-def _find_function_end(source: str, target_lineno: int) -> int:
+_FunctionNode = ast.FunctionDef | ast.AsyncFunctionDef
+
+
+@lru_cache(maxsize=8)
+def _function_nodes(source: str) -> Dict[Tuple[int, str], _FunctionNode] | None:
+    """Parse ``source`` once and index its function nodes by ``(lineno, name)``; ``None`` on syntax errors.
+
+    Cached on the source text so repeated lookups against an unchanged buffer skip the parse.
+    The returned nodes are shared between callers and must not be mutated.
+    """
+
     try:
         tree = ast.parse(source)
     except SyntaxError:
-        return 0
-    end = 0
+        return None
+    index: Dict[Tuple[int, str], _FunctionNode] = {}
     for node in ast.walk(tree):
         if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if node.lineno == target_lineno:
-                end = getattr(node, "end_lineno", 0)
-                break
-    return end
+            index.setdefault((node.lineno, node.name), node)
+    return index
+
+
+def _find_function_end(source: str, target_lineno: int) -> int:
+    function_nodes = _function_nodes(source)
+    if function_nodes is None:
+        return 0
+    for (lineno, _name), node in function_nodes.items():
+        if lineno == target_lineno:
+            return getattr(node, "end_lineno", 0)
+    return 0
 
 
 def apply_patch_plan_from_disk(
@@ -378,16 +431,18 @@ def apply_patch_plan_from_disk(
     *,
     dry_run: bool = False,
     show_diff: bool = False,
+    use_plan_cache: bool = True,
 ) -> PatchResult:
     repo_root = _find_repo_root_for_file(file)
     if repo_root is None:
         raise RuntimeError(
             "Could not find .neurocode/ir.toon. Run `neurocode ir` at the repository root first."
         )
-    plan = load_patch_plan(plan_path, expected_file=file, require_filled=True, allow_multi_file=True)
+    plan = load_patch_plan(
+        plan_path, expected_file=file, require_filled=True, allow_multi_file=True, use_cache=use_plan_cache
+    )
 
-    original_text = file.read_text(encoding="utf-8")
-    original_lines = original_text.splitlines()
+    _, original_lines, newline, had_trailing_newline = _read_lines(file)
     lines = list(original_lines)
 
     enabled_ops = [op for op in plan.operations if op.enabled and op.target.file == file]
@@ -422,14 +477,10 @@ def apply_patch_plan_from_disk(
             no_change=True,
         )
 
-    new_text = "\n".join(lines)
-    if original_text.endswith("\n"):
-        new_text += "\n"
-
     diff = _render_diff(original_lines, lines, file) if (dry_run or show_diff) else None
 
     if not dry_run:
-        file.write_text(new_text, encoding="utf-8")
+        _write_lines(file, lines, had_trailing_newline, newline)
 
     result = PatchResult(
         file=file,
@@ -456,7 +507,38 @@ def apply_patch_plan_from_disk(
     return result
 
 
+_NEWLINE_RE = re.compile(r"\r\n|\r|\n")
+
+
+def _read_lines(file: Path) -> Tuple[str, List[str], str, bool]:
+    """Return ``(source, lines without terminators, newline, trailing newline)`` for ``file``.
+
+    The file is decoded from raw bytes (no universal-newline translation) and split only on real
+    line terminators, so form feeds or U+2028 inside a line stay put and line indexes match ``ast``
+    line numbers. ``newline`` is the terminator of the first line (``\\r\\n``, ``\\r`` or ``\\n``);
+    rewritten files use it throughout, so a file with mixed endings comes back normalized to it.
+    """
+
+    source = file.read_bytes().decode("utf-8")
+    match = _NEWLINE_RE.search(source)
+    newline = match.group() if match is not None else "\n"
+    lines = _NEWLINE_RE.split(source)
+    if lines[-1] == "":
+        lines.pop()
+    return source, lines, newline, source.endswith(("\n", "\r"))
+
+
+def _write_lines(file: Path, lines: List[str], trailing_newline: bool, newline: str = "\n") -> None:
+    text = newline.join(lines)
+    if trailing_newline:
+        text += newline
+    file.write_bytes(text.encode("utf-8"))
+
+
 def _render_diff(old: List[str], new: List[str], file: Path) -> str:
+    if old == new:
+        # Idempotent re-runs (guard/stub already present) are common; skip difflib's matcher entirely.
+        return ""
     return "\n".join(
         difflib.unified_diff(
             old,
@@ -469,65 +551,48 @@ def _render_diff(old: List[str], new: List[str], file: Path) -> str:
 
 
 def _has_neurocode_guard(func_node: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
-    for node in ast.walk(func_node):
-        if isinstance(node, ast.Expr) and isinstance(getattr(node, "value", None), ast.Constant):
-            if isinstance(node.value.value, str) and "neurocode guard" in node.value.value:
+    # Guards are only ever inserted as top-level statements of the body, so there is no need to
+    # walk the whole function: look at top-level string expressions and ``if`` blocks that raise.
+    for stmt in func_node.body:
+        if isinstance(stmt, ast.Expr):
+            if _is_guard_text(stmt.value):
                 return True
-        if not isinstance(node, ast.If):
-            continue
-        test = node.test
-        # Look for simple "arg is None" checks.
-        if isinstance(test, ast.Compare):
-            left = test.left
-            comparators = test.comparators
-            if isinstance(left, ast.Name) and comparators and isinstance(comparators[0], ast.Constant):
-                if comparators[0].value is None:
-                    # Look for ValueError with neurocode guard text.
-                    for stmt in node.body:
-                        if isinstance(stmt, ast.Raise) and isinstance(stmt.exc, ast.Call):
-                            func = stmt.exc.func
-                            if isinstance(func, ast.Name) and func.id == "ValueError":
-                                args = stmt.exc.args
-                                if args and isinstance(args[0], ast.Constant) and isinstance(args[0].value, str):
-                                    if "neurocode guard" in args[0].value:
-                                        return True
-        # Fallback: match on any string constant containing neurocode guard.
-        if any(
-            isinstance(child, ast.Constant)
-            and isinstance(child.value, str)
-            and "neurocode guard" in child.value
-            for child in ast.walk(node)
-        ):
-            return True
+        elif isinstance(stmt, ast.If):
+            for inner in stmt.body:
+                if isinstance(inner, ast.Raise) and isinstance(inner.exc, ast.Call):
+                    args = inner.exc.args
+                    if args and _is_guard_text(args[0]):
+                        return True
     return False
 
 
-def _body_insert_index(func_node: ast.FunctionDef | ast.AsyncFunctionDef, lines: List[str], def_line_idx: int) -> int:
-    insert_at = def_line_idx + 1
+def _is_guard_text(node: ast.AST) -> bool:
+    return isinstance(node, ast.Constant) and isinstance(node.value, str) and "neurocode guard" in node.value
+
 
-    if func_node.decorator_list:
-        dec_end = max(getattr(dec, "end_lineno", dec.lineno) for dec in func_node.decorator_list)
-        insert_at = max(insert_at, dec_end)
+def _leading_whitespace(line: str) -> str:
+    # Copied verbatim (not rebuilt from a column count) so tab-indented files stay consistent.
+    return line[: len(line) - len(line.lstrip())]
 
+
+def _body_insert_index(func_node: ast.FunctionDef | ast.AsyncFunctionDef, lines: List[str], def_line_idx: int) -> int:
+    # Decorators always end above the ``def`` line, so only the body decides where the body starts:
+    # after a docstring, else at the first statement (which may follow a multi-line signature).
+    insert_at = def_line_idx + 1
     if func_node.body:
         first_stmt = func_node.body[0]
-        insert_at = max(insert_at, first_stmt.lineno - 1)
-        if (
-            isinstance(first_stmt, ast.Expr)
-            and isinstance(getattr(first_stmt, "value", None), ast.Constant)
-            and isinstance(first_stmt.value.value, str)
-        ):
-            doc_end = getattr(first_stmt, "end_lineno", first_stmt.lineno)
-            insert_at = max(insert_at, doc_end)
-
-    while insert_at < len(lines):
-        stripped = lines[insert_at].strip()
-        if stripped == "" or stripped.startswith("#"):
-            insert_at += 1
-            continue
-        break
+        if ast.get_docstring(func_node, clean=False) is not None:
+            insert_at = max(insert_at, first_stmt.end_lineno or first_stmt.lineno)
+        else:
+            insert_at = max(insert_at, first_stmt.lineno - 1)
 
-    return min(insert_at, len(lines))
+    num_lines = len(lines)
+    while insert_at < num_lines:
+        stripped = lines[insert_at].strip()
+        if stripped and not stripped.startswith("#"):
+            break
+        insert_at += 1
+    return min(insert_at, num_lines)
 
 
 def _choose_arg_name(func_node: ast.FunctionDef | ast.AsyncFunctionDef) -> str | None:
@@ -537,28 +602,55 @@ def _choose_arg_name(func_node: ast.FunctionDef | ast.AsyncFunctionDef) -> str |
     if not args:
         return None
 
-    def _annotation_text(arg: ast.arg) -> str:
-        if arg.annotation is None:
-            return ""
-        try:
-            return ast.unparse(arg.annotation)
-        except Exception:
-            return ""
-
-    def allows_none(arg: ast.arg) -> bool:
-        ann_text = _annotation_text(arg)
-        lowered = ann_text.lower()
-        return "optional" in lowered or "none" in lowered or "any" in lowered
-
     candidates = [arg for arg in args if arg.arg not in {"self", "cls"}]
-    annotated_none = [arg for arg in candidates if allows_none(arg)]
-    if annotated_none:
-        return annotated_none[0].arg
+    for arg in candidates:
+        if _annotation_allows_none(arg.annotation):
+            return arg.arg
     if candidates:
         return candidates[0].arg
     return args[0].arg
 
 
+def _annotation_allows_none(annotation: ast.expr | None) -> bool:
+    """True when the annotation's source text mentions Optional/None/Any (case-insensitive).
+
+    Common shapes are decided from the AST; ``ast.unparse`` is only used for the rest.
+    """
+
+    if annotation is None:
+        return False
+    if isinstance(annotation, ast.Name):
+        return _mentions_none(annotation.id)
+    if isinstance(annotation, ast.Constant):
+        if annotation.value is None:
+            return True
+        if isinstance(annotation.value, str):
+            return _mentions_none(annotation.value)
+    if isinstance(annotation, ast.Subscript) and isinstance(annotation.value, ast.Name):
+        if annotation.value.id == "Optional":
+            return True
+    if isinstance(annotation, ast.BinOp) and isinstance(annotation.op, ast.BitOr):
+        if _is_none_constant(annotation.left) or _is_none_constant(annotation.right):
+            return True
+    try:
+        return _mentions_none(ast.unparse(annotation))
+    except Exception:
+        return False
+
+
+def _is_none_constant(node: ast.expr) -> bool:
+    return isinstance(node, ast.Constant) and node.value is None
+
+
+def _mentions_none(text: str) -> bool:
+    lowered = text.lower()
+    return "optional" in lowered or "none" in lowered or "any" in lowered
+
+
+# Decorators (by final name) whose functions are attribute accessors rather than guardable calls.
+_GUARD_SKIP_DECORATORS = frozenset({"property", "cached_property"})
+
+
 def _decorator_name(dec: ast.AST) -> str:
     if isinstance(dec, ast.Name):
         return dec.id
@@ -602,25 +694,13 @@ def _has_inject_marker(func_node: ast.FunctionDef | ast.AsyncFunctionDef) -> boo
 def _inject_stub(
     lines: List[str],
     target_fn: FunctionIR,
+    func_node: _FunctionNode | None,
     fix_description: str,
     kind: str = "notimplemented",
     message_override: str | None = None,
 ) -> tuple[bool, int, str]:
     """Inject a stub (NotImplementedError or logging.debug) at the top of the function."""
 
-    source = "\n".join(lines) + "\n"
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
-        return False, 0, ""
-
-    func_node: ast.FunctionDef | ast.AsyncFunctionDef | None = None
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if node.lineno == target_fn.lineno and node.name == target_fn.name:
-                func_node = node
-                break
-
     if func_node is None:
         return False, 0, ""
 
@@ -628,7 +708,7 @@ def _inject_stub(
         return True, func_node.lineno + 1, ""
 
     insert_at = _body_insert_index(func_node, lines, target_fn.lineno - 1)
-    indent = lines[target_fn.lineno - 1][: len(lines[target_fn.lineno - 1]) - len(lines[target_fn.lineno - 1].lstrip())]
+    indent = _leading_whitespace(lines[target_fn.lineno - 1])
     message = message_override or fix_description
 
     marker = "  # neurocode:inject"
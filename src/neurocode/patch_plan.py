@@ -1,12 +1,19 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import os
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List, Mapping
+from typing import Any, Callable, List, Mapping, Tuple
 
+from . import json_compat
 from .patch_plan_schema import PATCH_PLAN_SCHEMA
 
+try:  # optional compiled schema validator
+    import fastjsonschema  # type: ignore[import-not-found]
+except ModuleNotFoundError:  # pragma: no cover - depends on installed extras
+    fastjsonschema = None  # type: ignore[assignment]
+
 
 @dataclass
 class PlanTarget:
@@ -47,7 +54,76 @@ def _require(cond: bool, msg: str, *, field: str | None = None) -> None:
         raise RuntimeError(prefix + msg)
 
 
+@lru_cache(maxsize=1)
+def _compiled_validator() -> Callable[[Any], Any] | None:
+    """Compile ``PATCH_PLAN_SCHEMA`` with ``fastjsonschema`` on first use; ``None`` when not installed."""
+
+    if fastjsonschema is None:
+        return None
+    return fastjsonschema.compile(PATCH_PLAN_SCHEMA)
+
+
 def _validate_schema(data: Mapping[str, Any]) -> None:
+    validator = _compiled_validator()
+    if validator is not None:
+        try:
+            validator(data)
+        except fastjsonschema.JsonSchemaValueException as exc:
+            message = exc.message
+            # Report paths the same way as the fallback walker ("patch_plan.operations[0].op ...").
+            if message.startswith("data"):
+                message = "patch_plan" + message[len("data") :]
+            raise RuntimeError(message) from exc
+        # fastjsonschema accepts integral floats (``2.0``) as "integer"; the walker and the line
+        # arithmetic downstream do not, so reject them here to accept exactly the same documents.
+        for fields in _integer_field_paths():
+            _check_integer_field(data, fields, "patch_plan")
+        return
+    _walk_schema(data)
+
+
+@lru_cache(maxsize=1)
+def _integer_field_paths() -> Tuple[Tuple[str, ...], ...]:
+    """Paths of integer-typed fields in ``PATCH_PLAN_SCHEMA``; ``"[]"`` marks array items, ``"*"`` any key."""
+
+    paths: List[Tuple[str, ...]] = []
+
+    def visit(schema: Mapping[str, Any], prefix: Tuple[str, ...]) -> None:
+        schema_type = schema.get("type")
+        if schema_type == "integer" or (isinstance(schema_type, list) and "integer" in schema_type):
+            paths.append(prefix)
+        for key, subschema in schema.get("properties", {}).items():
+            visit(subschema, prefix + (key,))
+        additional = schema.get("additionalProperties")
+        if isinstance(additional, dict):
+            visit(additional, prefix + ("*",))
+        items = schema.get("items")
+        if isinstance(items, dict):
+            visit(items, prefix + ("[]",))
+
+    visit(PATCH_PLAN_SCHEMA, ())
+    return tuple(paths)
+
+
+def _check_integer_field(value: Any, fields: Tuple[str, ...], path: str) -> None:
+    if not fields:
+        # ``None`` only gets here when the schema allows null for this field.
+        _require(value is None or (isinstance(value, int) and not isinstance(value, bool)), f"{path} has wrong type")
+        return
+    head, rest = fields[0], fields[1:]
+    if head == "[]":
+        if isinstance(value, list):
+            for idx, item in enumerate(value):
+                _check_integer_field(item, rest, f"{path}[{idx}]")
+    elif head == "*":
+        if isinstance(value, dict):
+            for key, item in value.items():
+                _check_integer_field(item, rest, f"{path}.{key}")
+    elif isinstance(value, dict) and head in value:
+        _check_integer_field(value[head], rest, f"{path}.{head}")
+
+
+def _walk_schema(data: Mapping[str, Any]) -> None:
     def _check_object(obj: Any, schema: Mapping[str, Any], path: str) -> None:
         _require(isinstance(obj, dict), f"{path} must be an object")
         allowed = set(schema.get("properties", {}).keys())
@@ -108,73 +184,87 @@ def load_patch_plan(
     *,
     require_filled: bool = False,
     allow_multi_file: bool = False,
+    use_cache: bool = True,
 ) -> PatchPlan:
+    """Load and validate the plan at ``path``.
+
+    Parsed plans are memoized by path, stat and working directory; pass ``use_cache=False`` for
+    one-shot files (e.g. temporary plans) whose entries could never be hit again.
+    """
+
+    load = _load_patch_plan_cached if use_cache else _load_patch_plan_cached.__wrapped__
+    try:
+        st = os.stat(path)
+        # A relative ``repo_root`` resolves against the working directory, so that is part of the key too.
+        plan = load(os.fspath(Path(path).resolve()), st.st_mtime_ns, st.st_size, os.getcwd())
+    except OSError as exc:
+        raise RuntimeError(f"Failed to read patch plan: {exc}") from exc
+
+    if expected_file is not None and not allow_multi_file:
+        expected = expected_file.resolve()
+        if plan.file != expected:
+            raise RuntimeError(f"Patch plan file {plan.file} does not match requested file {expected_file}")
+        for op in plan.operations:
+            if op.target.file != expected:
+                raise RuntimeError(
+                    f"Operation target file {op.target.file} does not match requested file {expected_file}"
+                )
+
+    if require_filled:
+        for op in plan.operations:
+            if op.enabled:
+                _require(op.code.strip(), f"Enabled operation {op.id} has empty code")
+
+    # The cached plan is shared; hand out a fresh operations list so callers may reorder it.
+    return replace(plan, operations=list(plan.operations))
+
+
+@lru_cache(maxsize=128)
+def _load_patch_plan_cached(path: str, mtime_ns: int, size: int, cwd: str) -> PatchPlan:
+    """Read, validate and build the plan at ``path``; keyed on its stat and ``cwd`` so edits miss the cache."""
+
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json_compat.loads(Path(path).read_bytes())
     except Exception as exc:
         raise RuntimeError(f"Failed to read patch plan: {exc}") from exc
 
     _require(isinstance(data, dict), "Patch plan must be a JSON object")
     _validate_schema(data)
 
-    version = data["version"]
     repo_root = Path(data["repo_root"]).resolve()
-    file_str = data["file"]
-    file_path = (repo_root / file_str).resolve()
-    if expected_file is not None and file_path != expected_file.resolve() and not allow_multi_file:
-        raise RuntimeError(f"Patch plan file {file_path} does not match requested file {expected_file}")
-
-    fix = data["fix"]
-    target_raw = data["target"]
-    _ = target_raw  # validated via schema; kept for symmetry
-    operations_raw = data["operations"]
+    file_path = (repo_root / data["file"]).resolve()
 
     operations: List[PlanOperation] = []
-    for op_raw in operations_raw:
+    for op_raw in data["operations"]:
         op_type = op_raw["op"]
         _require(op_type in SUPPORTED_OPS, f"Unsupported op type: {op_type}", field="op")
-        op_id = op_raw["id"]
-        target_file = op_raw["file"]
-        target_file_path = (repo_root / target_file).resolve()
-        if expected_file is not None and target_file_path != expected_file.resolve() and not allow_multi_file:
-            raise RuntimeError(
-                f"Operation target file {target_file_path} does not match requested file {expected_file}"
-            )
         lineno = op_raw["lineno"]
         end_lineno = op_raw["end_lineno"]
         if end_lineno is not None:
             _require(end_lineno >= lineno, "end_lineno must be >= lineno", field="end_lineno")
-        code = op_raw["code"]
-        enabled = op_raw["enabled"]
-        description = op_raw["description"]
         operations.append(
             PlanOperation(
-                id=op_id,
+                id=op_raw["id"],
                 op=op_type,
                 target=PlanTarget(
                     symbol=op_raw["symbol"],
                     kind="function",
-                    file=target_file_path,
+                    file=(repo_root / op_raw["file"]).resolve(),
                     lineno=lineno,
                     end_lineno=end_lineno,
                 ),
-                code=code,
-                description=description,
-                enabled=enabled,
+                code=op_raw["code"],
+                description=op_raw["description"],
+                enabled=op_raw["enabled"],
             )
         )
 
-    if require_filled:
-        for op in operations:
-            if op.enabled:
-                _require(op.code.strip(), f"Enabled operation {op.id} has empty code")
-
     return PatchPlan(
-        version=version,
+        version=data["version"],
         engine_version=data["engine_version"],
         repo_root=repo_root,
         file=file_path,
         module=data["module"],
-        fix=fix,
+        fix=data["fix"],
         operations=operations,
     )
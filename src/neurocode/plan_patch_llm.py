@@ -4,27 +4,25 @@ from pathlib import Path
 from typing import List
 
 from .explain import _find_module_for_file, _find_repo_root_for_file
-from .explain_llm import build_explain_llm_bundle
+from .explain_llm import _cached_repository_ir, build_explain_llm_bundle
 from .ir_model import FunctionIR
-from .toon_parse import load_repository_ir
 
 
 def _find_target_function(ir, module, symbol: str | None) -> FunctionIR | None:
     if symbol:
         sym_norm = symbol.replace(":", ".")
-        for fn in module.functions:
-            if fn.kind == "module":
-                continue
-            if fn.qualified_name == sym_norm or fn.qualified_name.endswith(f".{sym_norm}"):
+        exact = ir.functions_by_qualified_name().get(sym_norm)
+        candidates = [exact] if exact is not None else []
+        candidates.extend(ir.functions_by_qualified_suffix().get(sym_norm, ()))
+        for fn in candidates:
+            if fn.module_id == module.id and fn.kind != "module":
                 return fn
-    # fallback: first module-level function
-    module_level = [fn for fn in module.functions if fn.parent_class_id is None and fn.kind != "module"]
-    if module_level:
-        return min(module_level, key=lambda f: f.lineno)
-    non_entry = [fn for fn in module.functions if fn.kind != "module"]
-    if non_entry:
-        return min(non_entry, key=lambda f: f.lineno)
-    return None
+    # fallback: first module-level function, else the first function of any kind
+    non_entry = ir.functions_by_module().get(module.id, [])
+    for fn in non_entry:
+        if fn.parent_class_id is None:
+            return fn
+    return non_entry[0] if non_entry else None
 
 
 def _initial_operations(target_fn: FunctionIR | None, fix: str, file_rel: str) -> List[dict]:
@@ -69,21 +67,20 @@ def _call_neighbors(
 
     if target_fn is None:
         return [], [], {}
-    fn_by_id = {fn.id: fn for m in ir.modules for fn in m.functions}
+    fn_by_id = ir.functions_by_id()
     callers: list[FunctionIR] = []
     callees: list[FunctionIR] = []
     callsite_map: dict[tuple[int, int], int] = {}
-    for edge in ir.call_edges:
-        if edge.callee_function_id == target_fn.id and edge.caller_function_id in fn_by_id:
-            caller = fn_by_id[edge.caller_function_id]
-            if caller.kind != "module":
-                callers.append(caller)
-                callsite_map[(caller.id, target_fn.id)] = edge.lineno
-        if edge.caller_function_id == target_fn.id and edge.callee_function_id in fn_by_id:
-            callee = fn_by_id[edge.callee_function_id]
-            if callee.kind != "module":
-                callees.append(callee)
-                callsite_map[(target_fn.id, callee.id)] = edge.lineno
+    for edge in ir.call_edges_by_callee().get(target_fn.id, ()):
+        caller = fn_by_id.get(edge.caller_function_id)
+        if caller is not None and caller.kind != "module":
+            callers.append(caller)
+            callsite_map[(caller.id, target_fn.id)] = edge.lineno
+    for edge in ir.call_edges_by_caller().get(target_fn.id, ()):
+        callee = fn_by_id.get(edge.callee_function_id)
+        if callee is not None and callee.kind != "module":
+            callees.append(callee)
+            callsite_map[(target_fn.id, callee.id)] = edge.lineno
     return callers, callees, callsite_map
 
 
@@ -116,7 +113,7 @@ def build_patch_plan_bundle(
     if not ir_file.is_file():
         raise RuntimeError(f"{ir_file} not found. Run `neurocode ir {repo_root}` first.")
 
-    ir = load_repository_ir(ir_file)
+    ir = _cached_repository_ir(ir_file)
     module = _find_module_for_file(ir, repo_root, file_path)
     if module is None:
         raise RuntimeError(f"No module found in IR for file {file_path}")
@@ -138,6 +135,7 @@ def build_patch_plan_bundle(
         file_path,
         symbol=target_fn.qualified_name if target_fn else None,
         k_neighbors=k_neighbors,
+        include=(),
     ).data
 
     callers, callees, callsite_map = _call_neighbors(ir, target_fn)
@@ -145,7 +143,7 @@ def build_patch_plan_bundle(
     file_rel = str(file_path.relative_to(repo_root))
     operations = _initial_operations(target_fn, fix, file_rel)
 
-    module_paths: dict[int, Path] = {m.id: m.path for m in ir.modules}
+    module_paths: dict[int, Path] = ir.module_paths_by_id()
     op_counter = len(operations) + 1
     neighbor_ops: list[dict] = []
     for caller in callers:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Tuple
@@ -28,9 +29,9 @@ def run_query(
 ) -> QueryResult:
     """Execute a structural query over the IR."""
 
-    modules_by_id: Dict[int, ModuleIR] = {m.id: m for m in ir.modules}
+    modules_by_id: Dict[int, ModuleIR] = ir.modules_by_id()
     functions: List[FunctionIR] = [fn for m in ir.modules for fn in m.functions]
-    fn_by_id: Dict[int, FunctionIR] = {fn.id: fn for fn in functions}
+    fn_by_id: Dict[int, FunctionIR] = ir.functions_by_id()
 
     def _modules_in_scope() -> List[ModuleIR]:
         if not module_filter:
@@ -79,14 +80,13 @@ def run_query(
             raise QueryError(f"Symbol '{target}' is ambiguous; provide fully qualified name")
         return candidates[0]
 
+    # Single-symbol lookups read the per-function edge buckets; only the graph-wide fan-in/fan-out
+    # counts below scan every edge, and they use the columnar view for that.
     if kind == "callers":
         target_fn = _resolve_function(symbol)
-        callers = [
-            edge.caller_function_id
-            for edge in ir.call_edges
-            if edge.callee_function_id == target_fn.id
-        ]
-        unique_callers = sorted(set(callers))
+        unique_callers = sorted(
+            {edge.caller_function_id for edge in ir.call_edges_by_callee().get(target_fn.id, ())}
+        )
         items: List[dict] = []
         for fid in unique_callers:
             caller_fn = fn_by_id[fid]
@@ -110,11 +110,12 @@ def run_query(
 
     if kind == "callees":
         target_fn = _resolve_function(symbol)
-        edges = [
-            edge for edge in ir.call_edges if edge.caller_function_id == target_fn.id
-        ]
         unique_callees = sorted(
-            {edge.callee_function_id for edge in edges if edge.callee_function_id is not None}
+            {
+                edge.callee_function_id
+                for edge in ir.call_edges_by_caller().get(target_fn.id, ())
+                if edge.callee_function_id is not None
+            }
         )
         items: List[dict] = []
         for fid in unique_callees:
@@ -140,18 +141,17 @@ def run_query(
     def _fan_counts(reverse: bool) -> List[Tuple[FunctionIR, int]]:
         scope_functions = _functions_in_scope()
         counts: Dict[int, set[int]] = {fn.id: set() for fn in scope_functions}
-        for edge in ir.call_edges:
-            caller = edge.caller_function_id
-            callee = edge.callee_function_id
-            if callee is None:
+        columns = ir.call_edge_columns()
+        for caller, callee in zip(columns.caller_function_ids, columns.callee_function_ids):
+            if callee == -1:
                 continue
             if reverse:
                 # fan-in: how many distinct callers?
-                if callee in counts and caller is not None:
+                if callee in counts:
                     counts[callee].add(caller)
             else:
                 # fan-out: how many distinct callees?
-                if caller in counts and callee is not None:
+                if caller in counts:
                     counts[caller].add(callee)
         ordered = sorted(
             ((fn, len(counts[fn.id])) for fn in scope_functions),
@@ -200,8 +200,6 @@ def run_query(
 
 def render_query_result(result: QueryResult, output_format: str = "text") -> str:
     if output_format == "json":
-        import json
-
         payload = {
             "kind": result.kind,
             "symbol": result.symbol,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 from typing import Dict, List
 
@@ -144,7 +145,7 @@ def repository_ir_from_toon(text: str) -> RepositoryIR:
 
     for row in modules_table:
         module_id = int(row["module_id"])
-        module_name = _unescape_value(row["module_name"])
+        module_name = sys.intern(_unescape_value(row["module_name"]))
         path_str = _unescape_value(row["path"])
         file_hash = _unescape_value(row.get("file_hash", ""))
         has_main_guard = row.get("has_main_guard", "0") == "1"
@@ -176,8 +177,9 @@ def repository_ir_from_toon(text: str) -> RepositoryIR:
         module_id = int(row["module_id"])
         module = modules_by_id[module_id]
         name = _unescape_value(row["name"])
-        qualified_name = _unescape_value(row["qualified_name"])
-        module_name = _unescape_value(row.get("module", module.module_name))
+        # A class's qualified name doubles as parent_class_qualified_name on every method row.
+        qualified_name = sys.intern(_unescape_value(row["qualified_name"]))
+        module_name = sys.intern(_unescape_value(row.get("module", module.module_name)))
         symbol_id = _unescape_value(row.get("symbol_id", ""))
         lineno = int(row["lineno"])
         base_names_raw = _unescape_value(row.get("base_names", ""))
@@ -203,9 +205,9 @@ def repository_ir_from_toon(text: str) -> RepositoryIR:
     for row in imports_table:
         module_id = int(row["module_id"])
         module = modules_by_id[module_id]
-        kind = _unescape_value(row["kind"])
-        module_name = _unescape_value(row.get("module", ""))
-        name = _unescape_value(row["name"])
+        kind = sys.intern(_unescape_value(row["kind"]))
+        module_name = sys.intern(_unescape_value(row.get("module", "")))
+        name = sys.intern(_unescape_value(row["name"]))
         alias = _unescape_value(row.get("alias", ""))
         module.imports.append(
             ImportIR(
@@ -226,13 +228,16 @@ def repository_ir_from_toon(text: str) -> RepositoryIR:
         module_id = int(row["module_id"])
         module = modules_by_id[module_id]
         name = _unescape_value(row["name"])
-        qualified_name = _unescape_value(row["qualified_name"])
-        module_name = _unescape_value(row.get("module", module.module_name))
+        # Function names are lookup keys during resolution, and each module's name repeats on every row.
+        qualified_name = sys.intern(_unescape_value(row["qualified_name"]))
+        module_name = sys.intern(_unescape_value(row.get("module", module.module_name)))
         qualname = _unescape_value(row.get("qualname", ""))
         symbol_id = _unescape_value(row.get("symbol_id", ""))
-        kind = _unescape_value(row.get("kind", "function"))
+        kind = sys.intern(_unescape_value(row.get("kind", "function")))
         is_entrypoint = row.get("is_entrypoint", "0") == "1"
         lineno = int(row["lineno"])
+        end_lineno_raw = row.get("end_lineno", "")
+        end_lineno = int(end_lineno_raw) if end_lineno_raw not in {"", None} else None
         signature = _unescape_value(row.get("signature", ""))
         docstring = _unescape_value(row.get("docstring", ""))
 
@@ -253,6 +258,7 @@ def repository_ir_from_toon(text: str) -> RepositoryIR:
             name=name,
             qualified_name=qualified_name,
             lineno=lineno,
+            end_lineno=end_lineno,
             module=module_name or module.module_name,
             qualname=qualname,
             symbol_id=symbol_id or "",
@@ -278,7 +284,7 @@ def repository_ir_from_toon(text: str) -> RepositoryIR:
     for row in calls_table:
         function_id = int(row["function_id"])
         lineno = int(row["lineno"])
-        target = _unescape_value(row["target"])
+        target = sys.intern(_unescape_value(row["target"]))
         fn = functions_by_id.get(function_id)
         if fn is None:
             continue
@@ -290,7 +296,7 @@ def repository_ir_from_toon(text: str) -> RepositoryIR:
     module_imports_table = tables.get("module_imports", [])
     for row in module_imports_table:
         module_id = int(row["module_id"])
-        imported_module = _unescape_value(row["imported_module"])
+        imported_module = sys.intern(_unescape_value(row["imported_module"]))
         module_import_edges.append(
             ModuleImportEdgeIR(importer_module_id=module_id, imported_module=imported_module)
         )
@@ -304,9 +310,9 @@ def repository_ir_from_toon(text: str) -> RepositoryIR:
         callee_raw = row.get("callee_function_id", "")
         callee_id = int(callee_raw) if callee_raw not in {"", None} else None
         lineno = int(row["lineno"])
-        target = _unescape_value(row["target"])
-        caller_symbol_id = _unescape_value(row.get("caller_symbol_id", ""))
-        callee_symbol_id = _unescape_value(row.get("callee_symbol_id", ""))
+        target = sys.intern(_unescape_value(row["target"]))
+        caller_symbol_id = sys.intern(_unescape_value(row.get("caller_symbol_id", "")))
+        callee_symbol_id = sys.intern(_unescape_value(row.get("callee_symbol_id", "")))
         caller_fn = functions_by_id.get(caller_id)
         resolved_caller_symbol = caller_symbol_id or (caller_fn.symbol_id if caller_fn else "")
         resolved_callee_symbol: str | None
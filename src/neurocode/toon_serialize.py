@@ -126,7 +126,7 @@ def repository_ir_to_toon(ir: RepositoryIR) -> str:
 
     all_functions = [fn for m in ir.modules for fn in m.functions]
     lines.append(
-        "functions[{n}]{{function_id,module_id,name,qualified_name,module,qualname,symbol_id,kind,is_entrypoint,lineno,parent_class_id,parent_class_qualified_name,num_calls,signature,docstring}}:".format(
+        "functions[{n}]{{function_id,module_id,name,qualified_name,module,qualname,symbol_id,kind,is_entrypoint,lineno,end_lineno,parent_class_id,parent_class_qualified_name,num_calls,signature,docstring}}:".format(
             n=len(all_functions)
         )
     )
@@ -147,6 +147,7 @@ def repository_ir_to_toon(ir: RepositoryIR) -> str:
                 _escape_value(fn.kind),
                 "1" if fn.is_entrypoint else "0",
                 str(fn.lineno),
+                "" if fn.end_lineno is None else str(fn.end_lineno),
                 parent_class_id,
                 parent_class_name,
                 str(len(fn.calls)),
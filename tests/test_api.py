@@ -44,8 +44,12 @@ def test_api_apply_patch_plan(repo_with_ir: Path, tmp_path: Path) -> None:
     plan = project.plan_patch_llm(repo_with_ir / "package" / "mod_a.py", fix="add comment")
     for op in plan.data["operations"]:
         op["code"] = "# patched"
+    from neurocode.patch_plan import _load_patch_plan_cached
+
+    cached_before = _load_patch_plan_cached.cache_info().currsize
     result = project.apply_patch_plan(plan, dry_run=True)
     assert "# patched" in result.diff
+    assert _load_patch_plan_cached.cache_info().currsize == cached_before  # temp plan files are not memoized
 
 
 def test_build_ir_rebuilds_stale(sample_repo: Path) -> None:
@@ -44,6 +44,8 @@ def test_expanded_checks_detect_issues(tmp_path: Path) -> None:
     repo = _write_repo(tmp_path)
     ir = build_repository_ir(repo)
     config = load_config(repo)
+    assert config.enabled_checks == {"UNUSED_PARAM", "LONG_FUNCTION", "CALL_CYCLE", "UNUSED_RETURN", "IMPORT_CYCLE"}
+    assert config.long_function_threshold == 4
 
     # Unused param and long function.
     params_path = repo / "mod_params.py"
@@ -42,3 +42,10 @@ def test_cli_embed_json(repo_with_ir: Path, project_root: Path) -> None:
     assert result.returncode == 0, result.stderr
     assert store_path.exists()
     assert "items" in result.stdout
+
+
+def test_cli_embed_rejects_ascii_with_single_file(repo_with_ir: Path, project_root: Path) -> None:
+    result = _run_cli(project_root, "embed", str(repo_with_ir), "--provider", "dummy", "--ascii", "--single-file")
+    assert result.returncode == 2
+    assert "not allowed with argument" in result.stderr
+    assert not (repo_with_ir / ".neurocode" / "ir-embeddings.toon").exists()
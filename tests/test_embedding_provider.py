@@ -19,6 +19,24 @@ def test_dummy_provider_differs() -> None:
     assert a != b
 
 
+def test_embed_unique_sends_each_text_once() -> None:
+    calls: list[list[str]] = []
+
+    class RecordingProvider(DummyEmbeddingProvider):
+        def embed_batch(self, texts):  # noqa: ANN001
+            calls.append(list(texts))
+            return super().embed_batch(texts)
+
+    provider = RecordingProvider(dim=8)
+    vectors = provider.embed_unique(["a", "b", "a", "c", "b"])
+    assert calls == [["a", "b", "c"]]
+    assert len(vectors) == 5
+    assert vectors[0] == vectors[2]
+    assert vectors[0] is not vectors[2]
+    assert vectors[1] == vectors[4]
+    assert vectors == provider.embed_batch(["a", "b", "a", "c", "b"])
+
+
 def test_make_embedding_provider_allows_dummy_when_enabled() -> None:
     from neurocode.config import Config
     from neurocode.embedding_provider import make_embedding_provider
@@ -30,6 +48,53 @@ def test_make_embedding_provider_allows_dummy_when_enabled() -> None:
     assert model == "dummy-embedding-v0"
 
 
+def test_openai_providers_share_http_client_per_base_url(monkeypatch) -> None:
+    import types
+
+    from neurocode import embedding_provider
+    from neurocode.config import Config
+    from neurocode.embedding_provider import close_shared_http_clients, make_embedding_provider
+
+    class FakeResponse:
+        content = b'{"data": [{"embedding": [0.0, 2.0]}]}'
+
+        def raise_for_status(self) -> None:
+            return None
+
+    class FakeClient:
+        def __init__(self, **kwargs) -> None:  # noqa: ANN003
+            self.kwargs = kwargs
+            self.auth: list[str] = []
+            self.closed = False
+
+        def post(self, url, content=None, headers=None):  # noqa: ANN001
+            self.auth.append(headers["Authorization"])
+            return FakeResponse()
+
+        def close(self) -> None:
+            self.closed = True
+
+    monkeypatch.setattr(embedding_provider, "httpx", types.SimpleNamespace(Client=FakeClient, HTTPError=OSError))
+    monkeypatch.setattr(embedding_provider, "_SHARED_HTTP_CLIENTS", {})
+
+    cfg = Config()
+    cfg.embedding_provider = "openai"
+    cfg.embedding_api_key = "key-1"
+    first, name, _ = make_embedding_provider(cfg)
+    cfg.embedding_api_key = "key-2"
+    second, _, _ = make_embedding_provider(cfg)
+    assert name == "openai"
+    first.embed_batch(["a"])
+    second.embed_batch(["b"])
+
+    (client,) = embedding_provider._SHARED_HTTP_CLIENTS.values()
+    assert client.auth == ["Bearer key-1", "Bearer key-2"]
+    assert "headers" not in client.kwargs
+
+    close_shared_http_clients()
+    assert client.closed and not embedding_provider._SHARED_HTTP_CLIENTS
+
+
 def test_openai_provider_stubbed(monkeypatch) -> None:
     from neurocode.embedding_provider import OpenAIEmbeddingProvider
 
@@ -53,9 +118,72 @@ def test_openai_provider_stubbed(monkeypatch) -> None:
         return FakeResp(json.dumps(data).encode("utf-8"))
 
     monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    monkeypatch.setattr("neurocode.embedding_provider.httpx", None)
 
     provider = OpenAIEmbeddingProvider(model="m", api_key="key", dim=2)
     vectors = provider.embed_batch(["a", "b"])
     assert len(vectors) == 2
     assert vectors[0][0] == 1.0
     assert vectors[1][1] == 1.0
+
+
+def test_openai_provider_decodes_base64(monkeypatch) -> None:
+    import base64
+    import json
+    import struct
+
+    from neurocode.embedding_provider import OpenAIEmbeddingProvider
+
+    sent: dict = {}
+
+    class FakeResp:
+        def __init__(self, payload: bytes) -> None:
+            self.payload = payload
+
+        def read(self) -> bytes:
+            return self.payload
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    def fake_urlopen(req, timeout=None):  # noqa: ANN001
+        sent.update(json.loads(req.data))
+        blob = base64.b64encode(struct.pack("<3f", 3.0, 4.0, 0.0)).decode("ascii")
+        return FakeResp(json.dumps({"data": [{"embedding": blob}]}).encode("utf-8"))
+
+    monkeypatch.setattr("urllib.request.urlopen", fake_urlopen)
+    monkeypatch.setattr("neurocode.embedding_provider.httpx", None)
+
+    provider = OpenAIEmbeddingProvider(model="m", api_key="key")
+    vectors = provider.embed_batch(["a"])
+    assert sent["encoding_format"] == "base64"
+    assert vectors == [[0.6, 0.8, 0.0]]
+
+
+def test_openai_provider_reuses_http_client() -> None:
+    import json
+
+    from neurocode.embedding_provider import OpenAIEmbeddingProvider
+
+    class FakeResponse:
+        content = json.dumps({"data": [{"embedding": [0.0, 2.0]}]}).encode("utf-8")
+
+        def raise_for_status(self) -> None:
+            return None
+
+    class FakeClient:
+        def __init__(self) -> None:
+            self.posts = 0
+
+        def post(self, url, content=None, headers=None):  # noqa: ANN001
+            self.posts += 1
+            return FakeResponse()
+
+    client = FakeClient()
+    provider = OpenAIEmbeddingProvider(model="m", api_key="key", http_client=client)
+    assert provider.embed_batch(["a"]) == [[0.0, 1.0]]
+    assert provider.embed_batch(["b"]) == [[0.0, 1.0]]
+    assert client.posts == 2
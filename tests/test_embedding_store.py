@@ -2,17 +2,20 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from neurocode.embedding_model import (
     EmbeddingItem,
     EmbeddingStore,
     embedding_store_from_toon,
     embedding_store_to_toon,
+    iter_toon_lines,
     load_embedding_store,
     save_embedding_store,
 )
 
 
-def test_embedding_store_roundtrip(tmp_path: Path) -> None:
+def _sample_store(tmp_path: Path) -> EmbeddingStore:
     store = EmbeddingStore.new(repo_root=tmp_path, engine_version="0.0.0", model="dummy", provider="dummy")
     store.items.append(
         EmbeddingItem(
@@ -28,6 +31,11 @@ def test_embedding_store_roundtrip(tmp_path: Path) -> None:
             embedding=[0.1, 0.2, 0.3],
         )
     )
+    return store
+
+
+def test_embedding_store_roundtrip(tmp_path: Path) -> None:
+    store = _sample_store(tmp_path)
     toon = embedding_store_to_toon(store)
     parsed = embedding_store_from_toon(toon)
     assert parsed.model == "dummy"
@@ -36,6 +44,55 @@ def test_embedding_store_roundtrip(tmp_path: Path) -> None:
     assert parsed.items[0].embedding == [0.1, 0.2, 0.3]
 
     path = tmp_path / "store.toon"
-    save_embedding_store(store, path)
+    save_embedding_store(store, path, ascii_format=True)
     loaded = load_embedding_store(path)
     assert loaded.items[0].name == "fn"
+    assert not path.with_suffix(".npy").exists()
+    assert path.read_text(encoding="utf-8") == "".join(iter_toon_lines(store)) == toon
+
+
+def test_embedding_store_columnar_sidecar(tmp_path: Path) -> None:
+    store = _sample_store(tmp_path)
+    path = tmp_path / "store.toon"
+    save_embedding_store(store, path)
+
+    assert path.with_suffix(".npy").is_file()
+    assert "0.100000" not in path.read_text(encoding="utf-8")
+    loaded = load_embedding_store(path)
+    assert loaded.embeddings_file == "store.npy"
+    assert loaded.items[0].id == "package.mod.fn"
+    assert loaded.items[0].embedding == pytest.approx([0.1, 0.2, 0.3])
+
+    text = path.read_text(encoding="utf-8")
+    with pytest.raises(ValueError, match="store.npy"):
+        embedding_store_from_toon(text)
+    assert embedding_store_from_toon(text, base_dir=tmp_path).items[0].embedding == pytest.approx([0.1, 0.2, 0.3])
+
+
+def test_embedding_store_rejects_truncated_sidecar(tmp_path: Path) -> None:
+    path = tmp_path / "store.toon"
+    save_embedding_store(_sample_store(tmp_path), path)
+    npy_path = path.with_suffix(".npy")
+    data = npy_path.read_bytes()
+
+    for cut in (0, 7, 9, 20, len(data) - 4):
+        npy_path.write_bytes(data[:cut])
+        with pytest.raises(ValueError, match="is not a .npy file|is truncated"):
+            load_embedding_store(path)
+
+
+def test_embedding_store_single_file_packed(tmp_path: Path) -> None:
+    store = _sample_store(tmp_path)
+    path = tmp_path / "store.toon"
+    save_embedding_store(store, path, single_file=True)
+
+    assert not path.with_suffix(".npy").exists()
+    assert "embedding_b64" in path.read_text(encoding="utf-8")
+    loaded = load_embedding_store(path)
+    assert loaded.items[0].lineno == 1
+    assert loaded.items[0].embedding == pytest.approx([0.1, 0.2, 0.3])
+
+
+def test_embedding_store_rejects_two_inline_layouts(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        save_embedding_store(_sample_store(tmp_path), tmp_path / "store.toon", ascii_format=True, single_file=True)
@@ -5,7 +5,13 @@ import subprocess
 import sys
 from pathlib import Path
 
-from neurocode.explain_llm import build_explain_llm_bundle
+import pytest
+
+from neurocode.explain_llm import (
+    _cached_embedding_store,
+    _load_source_file,
+    build_explain_llm_bundle,
+)
 
 
 def _run_cli(project_root: Path, *args: str) -> subprocess.CompletedProcess[str]:
@@ -76,3 +82,82 @@ def test_cli_explain_llm_json(repo_with_ir: Path, project_root: Path) -> None:
     assert "call_graph_neighbors" in payload
     assert payload["call_graph_neighbors"]["callees"]
     assert payload["source_slices"]
+
+
+def test_build_explain_llm_bundle_caps_source_text(repo_with_ir: Path) -> None:
+    target_file = repo_with_ir / "package" / "mod_a.py"
+    bundle = build_explain_llm_bundle(target_file, max_source_chars=10).data
+
+    assert bundle["source"]["text"] == target_file.read_text(encoding="utf-8")[:10]
+    assert bundle["source"]["truncated"] is True
+
+
+def test_source_file_slices_match_splitlines(tmp_path: Path) -> None:
+    path = tmp_path / "mod.py"
+    path.write_bytes(b"def f():\r\n    return 1\r\n\r\n\ndef g():\n    pass\rdef h():\r    pass\r")
+    lines = path.read_text(encoding="utf-8").splitlines()
+
+    source = _load_source_file(str(path))
+    assert source is not None
+    assert source.num_lines == len(lines)
+    assert source.end_map == {1: 2, 5: 6, 7: 8}
+    for start in range(len(lines)):
+        for end in range(start, len(lines) + 1):
+            assert source.lines_text(start, end) == "\n".join(lines[start:end])
+
+
+def test_embedding_store_is_reused_until_rewritten(repo_with_ir: Path) -> None:
+    embed = [sys.executable, "-m", "neurocode.cli", "embed", str(repo_with_ir), "--provider", "dummy"]
+    subprocess.run(embed, check=True, capture_output=True, text=True)
+
+    store, queries = _cached_embedding_store(repo_with_ir)
+    assert _cached_embedding_store(repo_with_ir)[0] is store
+    assert queries == {}
+
+    subprocess.run([*embed, "--ascii"], check=True, capture_output=True, text=True)
+    assert _cached_embedding_store(repo_with_ir)[0] is not store
+
+
+def test_build_explain_llm_bundle_skips_excluded_sections(repo_with_ir: Path) -> None:
+    target_file = repo_with_ir / "package" / "mod_a.py"
+    bundle = build_explain_llm_bundle(target_file, symbol="package.mod_a.orchestrator", include=["checks"]).data
+
+    assert bundle["call_graph"]["callees"]
+    assert bundle["checks"]
+    assert bundle["semantic_neighbors"] == []
+    assert bundle["source_slices"] == {}
+    assert bundle["source"]["text"] == ""
+
+
+def test_source_file_slice_decodes_only_capped_prefix(tmp_path: Path) -> None:
+    path = tmp_path / "big.py"
+    body = "".join(f"    x{i} = 'é€'\n" for i in range(2000))
+    path.write_text(f"def f():\n{body}", encoding="utf-8")
+    full = "\n".join(path.read_text(encoding="utf-8").splitlines())
+
+    source = _load_source_file(str(path))
+    assert source is not None
+    capped = source.lines_text(0, source.num_lines, limit=100)
+    assert 100 < len(capped) < len(full)
+    assert full.startswith(capped[:100])
+
+
+def test_source_file_capped_slice_decodes_like_uncapped(tmp_path: Path) -> None:
+    path = tmp_path / "wide.py"
+    # 3-byte characters so the capped byte window ends in the middle of one.
+    path.write_text("x = '" + "€" * 400 + "'\n", encoding="utf-8")
+    source = _load_source_file(str(path))
+    assert source is not None
+    for limit in (10, 11, 12):
+        capped = source.lines_text(0, 1, limit=limit)
+        assert len(capped) > limit
+        assert source.lines_text(0, 1).startswith(capped)
+
+    bad = tmp_path / "bad.py"
+    bad.write_bytes(b"x = '" + b"\xff" * 400 + b"'\n")
+    bad_source = _load_source_file(str(bad))
+    assert bad_source is not None
+    with pytest.raises(UnicodeDecodeError):
+        bad_source.lines_text(0, 1)
+    with pytest.raises(UnicodeDecodeError):
+        bad_source.lines_text(0, 1, limit=10)
@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+import ast
+import os
+import time
 from pathlib import Path
 
+from neurocode import ir_build
 from neurocode.check import check_file
-from neurocode.ir_build import build_repository_ir
+from neurocode.explain import _find_module_for_file, _staleness_warning
+from neurocode.ir_build import (
+    build_repository_ir,
+    cached_file_hash,
+    compute_file_hash,
+    render_base_name,
+    render_call_target,
+)
+from neurocode.ir_model import RepositoryIR
+from neurocode.toon_parse import load_repository_ir
+from neurocode.toon_serialize import repository_ir_to_toon
 
 
 def test_build_repository_ir_captures_structure(sample_repo: Path) -> None:
@@ -93,3 +107,190 @@ def test_check_file_surfaces_unused_imports_dead_code_and_fanout(sample_repo: Pa
     assert any("unused_utility" in result.message for result in results if result.code == "UNUSED_IMPORT")
     assert any("package.mod_a.unused_local" in result.message for result in results if result.code == "UNUSED_FUNCTION")
     assert any("package.mod_a.orchestrator" in result.message for result in results if result.code == "HIGH_FANOUT")
+
+
+def test_render_call_target_and_base_name_without_unparse() -> None:
+    def callee(src: str) -> str:
+        return render_call_target(ast.parse(src, mode="eval").body.func)
+
+    assert callee("pkg.mod.func()") == "pkg.mod.func"
+    assert callee("handlers[key]()") == "handlers[]"
+    assert callee("make()()") == "make()"
+    assert callee("super().run()") == "super().run"
+    assert callee("(lambda: 1)()") == "<expr>"
+
+    (cls,) = ast.parse("class A(t.Generic[T], Base): pass").body
+    assert [render_base_name(base) for base in cls.bases] == ["t.Generic", "Base"]
+
+
+def test_build_repository_ir_resolves_package_reexports(tmp_path: Path) -> None:
+    pkg = tmp_path / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("from pkg.impl import helper as public_helper\n\ndef top():\n    return 1\n")
+    (pkg / "impl.py").write_text("def helper():\n    return 2\n")
+    (tmp_path / "app.py").write_text(
+        "import pkg\nfrom pkg import public_helper, top\n\n"
+        "def run():\n    public_helper()\n    top()\n    pkg.public_helper()\n"
+    )
+
+    ir = build_repository_ir(tmp_path, use_cache=False)
+
+    callees = {edge.target: edge.callee_symbol_id for edge in ir.call_edges if edge.caller_symbol_id == "app:run"}
+    assert callees == {
+        "public_helper": "pkg.impl:helper",
+        "top": "pkg.__init__:top",
+        "pkg.public_helper": "pkg.impl:helper",
+    }
+
+
+def test_build_repository_ir_leaves_root_untouched(tmp_path: Path) -> None:
+    (tmp_path / "mod.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+    before = sorted(p.relative_to(tmp_path) for p in tmp_path.rglob("*"))
+
+    build_repository_ir(tmp_path)
+
+    assert sorted(p.relative_to(tmp_path) for p in tmp_path.rglob("*")) == before
+
+
+def test_build_repository_ir_skips_unparseable_files(tmp_path: Path) -> None:
+    (tmp_path / "good.py").write_text("def ok():\n    return 1\n")
+    (tmp_path / "broken.py").write_text("def nope(:\n")
+    (tmp_path / "nulls.py").write_bytes(b"x = 1\x00\n")
+    (tmp_path / "latin1.py").write_bytes(b"name = '\xe9'\n")
+
+    ir = build_repository_ir(tmp_path, use_cache=False)
+
+    assert [module.module_name for module in ir.modules] == ["good"]
+
+
+def test_cached_file_hash_tracks_file_changes(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(ir_build, "_FILE_HASH_CACHE", {})
+    path = tmp_path / "mod.py"
+    path.write_text("x = 1\n", encoding="utf-8")
+    first = cached_file_hash(path)
+    assert first == compute_file_hash(path)
+    assert cached_file_hash(path) == first
+
+    path.write_text("x = 12345\n", encoding="utf-8")
+    assert cached_file_hash(path) == compute_file_hash(path) != first
+    assert list(ir_build._FILE_HASH_CACHE) == [os.fspath(path)]
+
+
+def test_repo_root_cache_is_bounded(tmp_path: Path, monkeypatch) -> None:
+    from neurocode import explain
+
+    monkeypatch.setattr(explain, "_REPO_ROOT_CACHE", {})
+    monkeypatch.setattr(explain, "_REPO_ROOT_CACHE_SIZE", 2)
+    (tmp_path / ".neurocode").mkdir()
+    (tmp_path / ".neurocode" / "ir.toon").write_text("", encoding="utf-8")
+    for idx in range(3):
+        package = tmp_path / f"pkg_{idx}"
+        package.mkdir()
+        assert explain._find_repo_root_for_file(package / "mod.py") == tmp_path.resolve()
+
+    assert len(explain._REPO_ROOT_CACHE) <= 2
+
+
+def test_staleness_warning_ignores_restored_mtime(repo_with_ir: Path) -> None:
+    ir = load_repository_ir(repo_with_ir / ".neurocode" / "ir.toon")
+    target = repo_with_ir / "package" / "mod_a.py"
+    module = _find_module_for_file(ir, repo_with_ir, target)
+    assert module is not None
+    assert _staleness_warning(module, repo_with_ir) is None
+
+    # e.g. `cp -p` / `tar x` of changed content carrying an mtime older than ir.toon
+    ir_mtime = (repo_with_ir / ".neurocode" / "ir.toon").stat().st_mtime_ns
+    target.write_text(target.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    os.utime(target, ns=(ir_mtime - 10**9, ir_mtime - 10**9))
+    assert "stale" in (_staleness_warning(module, repo_with_ir) or "")
+
+
+def test_build_repository_ir_parallel_parse_matches_serial(sample_repo: Path, monkeypatch) -> None:
+    serial = build_repository_ir(sample_repo, use_cache=False)
+    monkeypatch.setattr(ir_build, "_PARALLEL_PARSE_MIN_FILES", 0)
+    monkeypatch.setattr(ir_build, "_THREADED_READ_MIN_FILES", 0)
+    monkeypatch.setattr(ir_build.os, "cpu_count", lambda: 2)
+    parallel = build_repository_ir(sample_repo, use_cache=False)
+
+    assert _ir_text(parallel) == _ir_text(serial)
+    for module in parallel.modules:
+        for cls in module.classes:
+            assert all(any(method is fn for fn in module.functions) for method in cls.methods)
+
+
+def _ir_text(ir: RepositoryIR) -> str:
+    return "\n".join(line for line in repository_ir_to_toon(ir).splitlines() if "build_timestamp" not in line)
+
+
+def test_fragment_memo_is_scoped_to_build_root(tmp_path: Path) -> None:
+    inner = tmp_path / "inner"
+    inner.mkdir()
+    (inner / "mod.py").write_text("def f():\n    return 1\n", encoding="utf-8")
+
+    outer_ir = build_repository_ir(tmp_path, use_cache=True)
+    assert [m.module_name for m in outer_ir.modules] == ["inner.mod"]
+
+    inner_ir = build_repository_ir(inner, use_cache=True)
+    assert [m.module_name for m in inner_ir.modules] == ["mod"]
+    assert [fn.qualified_name for fn in inner_ir.modules[0].functions if fn.kind != "module"] == ["mod.f"]
+    assert _ir_text(inner_ir) == _ir_text(build_repository_ir(inner, use_cache=False))
+
+
+def _age_sources(root: Path, seconds: int = 60) -> None:
+    past = time.time_ns() - seconds * 10**9
+    for path in root.rglob("*.py"):
+        os.utime(path, ns=(past, past))
+
+
+def test_build_repository_ir_reuses_cached_fragments(sample_repo: Path, monkeypatch) -> None:
+    monkeypatch.setattr(ir_build, "_RACY_WINDOW_NS", 0)  # utime itself bumps ctime to "now"
+    _age_sources(sample_repo)
+    cold = build_repository_ir(sample_repo, use_cache=True)
+    assert (sample_repo / ".neurocode" / "ir-cache.sqlite").is_file()
+
+    parsed: list[Path] = []
+    real_parse = ir_build._parse_module
+
+    def tracking_parse(root, rel_path, source, file_hash):
+        parsed.append(rel_path)
+        return real_parse(root, rel_path, source, file_hash)
+
+    read: list[Path] = []
+    real_read = ir_build._read_source
+
+    def tracking_read(path):
+        read.append(path)
+        return real_read(path)
+
+    monkeypatch.setattr(ir_build, "_parse_module", tracking_parse)
+    monkeypatch.setattr(ir_build, "_read_source", tracking_read)
+    warm = build_repository_ir(sample_repo, use_cache=True)
+    assert parsed == [] and read == []  # unchanged stats: served from the in-process memo
+    assert _ir_text(warm) == _ir_text(cold)
+
+    monkeypatch.setattr(ir_build, "_FRAGMENT_MEMO", {})
+    from_disk = build_repository_ir(sample_repo, use_cache=True)
+    assert parsed == [] and read  # memo gone: files are re-read but fragments come from sqlite
+    assert _ir_text(from_disk) == _ir_text(cold)
+
+    target = sample_repo / "package" / "mod_b.py"
+    target.write_text(target.read_text(encoding="utf-8") + "\n\ndef added():\n    return 1\n", encoding="utf-8")
+    rebuilt = build_repository_ir(sample_repo, use_cache=True)
+    assert parsed == [Path("package/mod_b.py")]
+    assert _ir_text(rebuilt) == _ir_text(build_repository_ir(sample_repo, use_cache=False))
+
+
+def test_fragment_memo_rehashes_same_size_edit_with_restored_mtime(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(ir_build, "_FRAGMENT_MEMO", {})
+    path = tmp_path / "mod.py"
+    path.write_text("def f():\n    return 1\n", encoding="utf-8")
+    _age_sources(tmp_path)
+    stamp = path.stat().st_mtime_ns
+    build_repository_ir(tmp_path, use_cache=True)
+
+    path.write_text("def g():\n    return 1\n", encoding="utf-8")
+    os.utime(path, ns=(stamp, stamp))
+    rebuilt = build_repository_ir(tmp_path, use_cache=True)
+
+    assert [fn.name for fn in rebuilt.modules[0].functions if fn.kind != "module"] == ["g"]
+    assert rebuilt.modules[0].file_hash == compute_file_hash(path)
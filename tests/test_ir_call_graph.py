@@ -23,3 +23,50 @@ def test_call_graph_has_symbol_ids_and_cross_module_edges(sample_repo) -> None:
         if edge.caller_symbol_id == orchestrator_id
     ]
     assert (orchestrator_id, helper_id) in edges
+
+
+def test_function_indexes_are_cached_until_invalidated(sample_repo) -> None:
+    ir = build_repository_ir(sample_repo)
+
+    by_id = ir.functions_by_id()
+    assert by_id is ir.functions_by_id()
+    assert all(by_id[fn.id] is fn for module in ir.modules for fn in module.functions)
+    assert ir.functions_by_qualified_name()["package.mod_a.orchestrator"].symbol_id == "package.mod_a:orchestrator"
+
+    ir.invalidate_indexes()
+    assert ir.functions_by_id() is not by_id
+
+
+def test_qualified_suffix_index_matches_dotted_tails(sample_repo) -> None:
+    ir = build_repository_ir(sample_repo)
+
+    index = ir.functions_by_qualified_suffix()
+    assert [fn.symbol_id for fn in index["orchestrator"]] == ["package.mod_a:orchestrator"]
+    assert index["mod_a.orchestrator"] == index["orchestrator"]
+    assert "package.mod_a.orchestrator" not in index
+
+
+def test_aggregate_counts_are_cached_until_invalidated(sample_repo) -> None:
+    ir = build_repository_ir(sample_repo)
+    calls = sum(len(fn.calls) for module in ir.modules for fn in module.functions)
+    assert ir.num_calls == calls
+
+    caller = next(fn for module in ir.modules for fn in module.functions if fn.calls)
+    caller.calls.append(caller.calls[0])
+    assert ir.num_calls == calls
+    ir.invalidate_indexes()
+    assert ir.num_calls == calls + 1
+
+
+def test_call_edge_columns_mirror_edges(sample_repo) -> None:
+    ir = build_repository_ir(sample_repo)
+
+    columns = ir.call_edge_columns()
+    assert columns is ir.call_edge_columns()
+    assert list(columns.caller_function_ids) == [edge.caller_function_id for edge in ir.call_edges]
+    assert list(columns.callee_function_ids) == [
+        -1 if edge.callee_function_id is None else edge.callee_function_id for edge in ir.call_edges
+    ]
+    assert list(columns.linenos) == [edge.lineno for edge in ir.call_edges]
+    assert -1 in columns.callee_function_ids
+
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from neurocode import json_compat
+from neurocode.explain_llm import build_explain_llm_bundle
+from neurocode.plan_patch_llm import build_patch_plan_bundle
+
+pytest.importorskip("orjson")
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+def _dumps_with_both_backends(obj, monkeypatch) -> tuple[str, str]:
+    fast = json_compat.dumps(obj)
+    monkeypatch.setattr(json_compat, "orjson", None)
+    return fast, json_compat.dumps(obj)
+
+
+def test_dumps_agrees_across_backends(monkeypatch) -> None:
+    payload = {
+        "module": "café.naïve",
+        "docstring": "Grüße → 世界",
+        "counts": {1: "one", 2: ["two", None, True]},
+        "score": 0.25,
+        "empty": {},
+    }
+    fast, fallback = _dumps_with_both_backends(payload, monkeypatch)
+    assert json.loads(fast) == json.loads(fallback)
+    assert '"1": "one"' in fast and '"1": "one"' in fallback
+    assert fallback == json.dumps(payload, indent=2)  # stdlib output unchanged, ASCII-escaped
+
+
+def test_dumps_rejects_the_same_types_across_backends(monkeypatch) -> None:
+    payload = {"when": datetime(2024, 1, 1, tzinfo=timezone.utc), "item": _Point(1, 2)}
+    with pytest.raises(TypeError):
+        json_compat.dumps({"when": payload["when"]})
+    with pytest.raises(TypeError):
+        json_compat.dumps({"item": payload["item"]})
+    monkeypatch.setattr(json_compat, "orjson", None)
+    with pytest.raises(TypeError):
+        json_compat.dumps({"when": payload["when"]})
+    with pytest.raises(TypeError):
+        json_compat.dumps({"item": payload["item"]})
+
+
+def test_dumps_floats_decode_equal_across_backends(monkeypatch) -> None:
+    payload = {"scores": [3.2e-05, -7.5e-06, 1e16, 0.1, 1.0]}
+    fast, fallback = _dumps_with_both_backends(payload, monkeypatch)
+    assert json.loads(fast) == json.loads(fallback) == payload
+
+
+def test_llm_bundles_decode_equal_across_backends(repo_with_ir: Path, monkeypatch) -> None:
+    target_file = repo_with_ir / "package" / "mod_a.py"
+    bundles = [
+        build_explain_llm_bundle(target_file, symbol="package.mod_a.orchestrator", k_neighbors=3).data,
+        build_patch_plan_bundle(target_file, fix="Add logging", symbol="package.mod_a.orchestrator", k_neighbors=3),
+    ]
+    fast = [json.loads(json_compat.dumps(bundle)) for bundle in bundles]
+    monkeypatch.setattr(json_compat, "orjson", None)
+    assert [json.loads(json_compat.dumps(bundle)) for bundle in bundles] == fast
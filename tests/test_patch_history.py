@@ -6,6 +6,14 @@ import sys
 from pathlib import Path
 
 from neurocode.api import open_project
+from neurocode.history_model import (
+    PatchHistory,
+    PatchHistoryEntry,
+    append_patch_history,
+    history_from_toon,
+    history_to_toon,
+    load_patch_history,
+)
 
 
 def test_patch_history_written_on_apply(repo_with_ir: Path) -> None:
@@ -58,3 +66,45 @@ def test_cli_patch_history(repo_with_ir: Path, project_root: Path) -> None:
     payload = json.loads(result.stdout)
     assert payload
     assert any(entry["fix"] == "history cli" for entry in payload)
+
+
+def test_history_toon_roundtrips_commas_and_newlines() -> None:
+    entry = PatchHistoryEntry(
+        id="p1",
+        timestamp="2024-01-01T00:00:00Z",
+        fix="guard a, b\nthen return",
+        files_changed=["pkg/a.py", "pkg/b,c.py"],
+        is_noop=False,
+        summary="two files, one fix",
+        warnings=["stale IR", "line 1\nline 2"],
+        plan_id="plan-1",
+    )
+    history = history_from_toon(history_to_toon(PatchHistory(entries=[entry])))
+    assert history.entries == [entry]
+
+
+def test_append_patch_history_keeps_file_consistent(tmp_path: Path) -> None:
+    for i in range(11):
+        append_patch_history(tmp_path, fix=f"fix {i}, again", files_changed=["a.py"], is_noop=False, summary="s")
+
+    history = load_patch_history(tmp_path)
+    assert [e.fix for e in history.entries] == [f"fix {i}, again" for i in range(11)]
+    text = (tmp_path / ".neurocode" / "patch-history.toon").read_text(encoding="utf-8")
+    assert text == history_to_toon(history)
+
+
+def test_concurrent_appends_keep_count_and_rows_in_sync(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    append_patch_history(tmp_path, fix="seed", files_changed=["a.py"], is_noop=False, summary="s")
+
+    def _append(i: int) -> None:
+        append_patch_history(tmp_path, fix=f"fix {i}", files_changed=["a.py"], is_noop=False, summary="s")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_append, range(40)))
+
+    text = (tmp_path / ".neurocode" / "patch-history.toon").read_text(encoding="utf-8")
+    history = history_from_toon(text)
+    assert len(history.entries) == 41
+    assert text == history_to_toon(history)
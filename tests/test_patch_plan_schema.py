@@ -82,3 +82,77 @@ def test_empty_code_rejected_when_applying(tmp_path: Path, repo_with_ir: Path) -
     plan_path.write_text(json.dumps(payload), encoding="utf-8")
     with pytest.raises(RuntimeError):
         load_patch_plan(plan_path, require_filled=True)
+
+
+def test_compiled_validator_reports_plan_paths(tmp_path: Path, repo_with_ir: Path) -> None:
+    pytest.importorskip("fastjsonschema")
+    plan_path = _write_plan(tmp_path, repo_with_ir)
+    payload = json.loads(plan_path.read_text(encoding="utf-8"))
+    payload["operations"][0]["lineno"] = "one"
+    plan_path.write_text(json.dumps(payload), encoding="utf-8")
+    with pytest.raises(RuntimeError, match=r"^patch_plan\.operations\[0\]\.lineno"):
+        load_patch_plan(plan_path)
+
+
+@pytest.mark.parametrize("validator", ["walker", "compiled"])
+@pytest.mark.parametrize(
+    ("field_path", "message"),
+    [
+        (("operations", 0, "lineno"), r"^patch_plan\.operations\[0\]\.lineno has wrong type"),
+        (("version",), r"^patch_plan\.version has wrong type"),
+    ],
+)
+def test_integral_floats_rejected_for_integer_fields(
+    tmp_path: Path, repo_with_ir: Path, monkeypatch, validator: str, field_path: tuple, message: str
+) -> None:
+    import neurocode.patch_plan as patch_plan_module
+
+    if validator == "compiled":
+        pytest.importorskip("fastjsonschema")
+    else:
+        monkeypatch.setattr(patch_plan_module, "_compiled_validator", lambda: None)
+    plan_path = _write_plan(tmp_path, repo_with_ir)
+    payload = json.loads(plan_path.read_text(encoding="utf-8"))
+    container = payload
+    for key in field_path[:-1]:
+        container = container[key]
+    container[field_path[-1]] = 2.0
+    plan_path.write_text(json.dumps(payload), encoding="utf-8")
+    with pytest.raises(RuntimeError, match=message):
+        load_patch_plan(plan_path)
+
+
+def test_unchanged_plan_is_loaded_once(tmp_path: Path, repo_with_ir: Path, monkeypatch) -> None:
+    import neurocode.patch_plan as patch_plan_module
+
+    plan_path = _write_plan(tmp_path, repo_with_ir)
+    first = load_patch_plan(plan_path)
+
+    def fail(data):  # noqa: ANN001, ANN202
+        raise AssertionError("cached plan should not be re-validated")
+
+    monkeypatch.setattr(patch_plan_module, "_validate_schema", fail)
+    second = load_patch_plan(plan_path)
+    assert second == first
+    assert second.operations is not first.operations
+
+    payload = json.loads(plan_path.read_text(encoding="utf-8"))
+    payload["fix"] = "add more logging"
+    plan_path.write_text(json.dumps(payload), encoding="utf-8")
+    monkeypatch.undo()
+    assert load_patch_plan(plan_path).fix == "add more logging"
+
+
+def test_relative_repo_root_follows_working_directory(tmp_path: Path, monkeypatch) -> None:
+    plan_dir = tmp_path / "plans"
+    plan_dir.mkdir()
+    plan_path = _write_plan(plan_dir, Path("repo"))
+    first_cwd = tmp_path / "first"
+    second_cwd = tmp_path / "second"
+    for cwd in (first_cwd, second_cwd):
+        (cwd / "repo").mkdir(parents=True)
+
+    monkeypatch.chdir(first_cwd)
+    assert load_patch_plan(plan_path).repo_root == (first_cwd / "repo").resolve()
+    monkeypatch.chdir(second_cwd)
+    assert load_patch_plan(plan_path).repo_root == (second_cwd / "repo").resolve()
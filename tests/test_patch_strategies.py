@@ -67,6 +67,31 @@ def test_guard_skips_property_and_falls_back_to_todo(sample_repo: Path) -> None:
     assert result.summary.startswith("todo")
 
 
+def test_guard_skips_cached_property(sample_repo: Path) -> None:
+    file_path = sample_repo / "package" / "classy.py"
+    file_path.write_text(
+        "import functools\n"
+        "\n"
+        "class Holder:\n"
+        "    @functools.cached_property\n"
+        "    def value(self):\n"
+        "        return 1\n"
+    )
+    ir = build_repository_ir(sample_repo)
+
+    result = apply_patch(
+        ir=ir,
+        repo_root=sample_repo,
+        file=file_path,
+        fix_description="cached skip",
+        strategy="guard",
+        target="Holder.value",
+    )
+
+    assert "neurocode guard" not in file_path.read_text(encoding="utf-8")
+    assert result.summary.startswith("todo")
+
+
 def test_guard_noop_when_already_present(sample_repo: Path) -> None:
     file_path = sample_repo / "package" / "mod_b.py"
     ir = build_repository_ir(sample_repo)
@@ -271,3 +296,154 @@ def test_inject_noop_when_present(sample_repo: Path) -> None:
 
     assert result.no_change is True
     assert "inject already present" in result.summary
+
+
+def test_guard_preserves_crlf_line_endings(sample_repo: Path) -> None:
+    file_path = sample_repo / "package" / "crlf_mod.py"
+    file_path.write_bytes(b"def crlf_fn(x):\r\n    return x\r\n")
+    ir = build_repository_ir(sample_repo)
+
+    apply_patch(
+        ir=ir,
+        repo_root=sample_repo,
+        file=file_path,
+        fix_description="crlf guard",
+        strategy="guard",
+        target="crlf_fn",
+    )
+
+    raw = file_path.read_bytes()
+    assert b"neurocode guard: crlf guard" in raw
+    assert raw.endswith(b"    return x\r\n")
+    assert raw.count(b"\n") == raw.count(b"\r\n") == 5
+
+
+def test_guard_preserves_cr_only_line_endings(sample_repo: Path) -> None:
+    file_path = sample_repo / "package" / "cr_mod.py"
+    file_path.write_bytes(b"def cr_fn(x):\r    return x\r")
+    ir = build_repository_ir(sample_repo)
+
+    apply_patch(
+        ir=ir,
+        repo_root=sample_repo,
+        file=file_path,
+        fix_description="cr guard",
+        strategy="guard",
+        target="cr_fn",
+    )
+
+    raw = file_path.read_bytes()
+    assert b"neurocode guard: cr guard" in raw
+    assert b"\n" not in raw
+    assert raw.endswith(b"    return x\r")
+    assert raw.count(b"\r") == 5
+
+
+def test_guard_keeps_form_feed_and_line_separator_inside_lines(sample_repo: Path) -> None:
+    file_path = sample_repo / "package" / "ff_mod.py"
+    original = 'x = 1\x0c\ns = "a\u2028b"\n\n\ndef ff_fn(value):\n    return value\n'
+    file_path.write_bytes(original.encode("utf-8"))
+    ir = build_repository_ir(sample_repo)
+
+    result = apply_patch(
+        ir=ir,
+        repo_root=sample_repo,
+        file=file_path,
+        fix_description="ff guard",
+        strategy="guard",
+        target="ff_fn",
+    )
+
+    text = file_path.read_bytes().decode("utf-8")
+    assert result.inserted_line == 6
+    assert text.startswith('x = 1\x0c\ns = "a\u2028b"\n\n\ndef ff_fn(value):\n')
+    assert text.endswith("    return value\n")
+    assert text.index("def ff_fn") < text.index("ff guard") < text.index("return value")
+
+
+def test_guard_prefers_argument_annotated_as_optional(sample_repo: Path) -> None:
+    file_path = sample_repo / "package" / "optional_mod.py"
+    file_path.write_text(
+        "def opt_fn(count: int, label: str | None, extra: 'Optional[str]'):\n"
+        "    return count\n"
+    )
+    ir = build_repository_ir(sample_repo)
+
+    result = apply_patch(
+        ir=ir,
+        repo_root=sample_repo,
+        file=file_path,
+        fix_description="optional guard",
+        strategy="guard",
+        target="opt_fn",
+    )
+
+    assert "if label is None:" in result.inserted_text
+
+
+def test_repeated_noop_patch_skips_reparse(sample_repo: Path, monkeypatch) -> None:
+    import neurocode.patch as patch_module
+
+    file_path = sample_repo / "package" / "mod_b.py"
+    file_path.write_text(
+        "def foo(x):\n"
+        "    raise NotImplementedError(\"neurocode inject: inject again\")\n"
+        "    return x\n"
+    )
+    ir = build_repository_ir(sample_repo)
+    kwargs = dict(ir=ir, repo_root=sample_repo, file=file_path, fix_description="inject again", strategy="inject")
+
+    first = apply_patch(target="foo", **kwargs)
+    assert first.no_change is True
+
+    def fail(source: str):  # noqa: ANN202
+        raise AssertionError("unchanged no-op patch should not re-parse the file")
+
+    monkeypatch.setattr(patch_module, "_function_nodes", fail)
+    second = apply_patch(target="foo", warnings=["fresh"], **kwargs)
+    assert second.no_change is True
+    assert second.summary == first.summary
+    assert second.warnings == ["fresh"]
+
+
+def test_noop_results_are_bounded(sample_repo: Path, monkeypatch) -> None:
+    import neurocode.patch as patch_module
+
+    monkeypatch.setattr(patch_module, "_NOOP_RESULTS", patch_module.OrderedDict())
+    monkeypatch.setattr(patch_module, "_NOOP_RESULTS_SIZE", 2)
+    file_path = sample_repo / "package" / "mod_b.py"
+    file_path.write_text("# TODO(neurocode): already noted  # neurocode:todo\n")
+    ir = build_repository_ir(sample_repo)
+
+    for idx in range(4):
+        result = apply_patch(
+            ir=ir, repo_root=sample_repo, file=file_path, fix_description=f"note {idx}", strategy="todo"
+        )
+        assert result.no_change is True
+    assert [key[2] for key in patch_module._NOOP_RESULTS] == ["note 2", "note 3"]
+
+
+def test_noop_from_stale_ir_is_not_replayed_after_rebuild(sample_repo: Path, monkeypatch) -> None:
+    import neurocode.patch as patch_module
+
+    monkeypatch.setattr(patch_module, "_NOOP_RESULTS", patch_module.OrderedDict())
+    file_path = sample_repo / "package" / "moved.py"
+    file_path.write_text("def moved(value):\n    return value\n")
+    stale_ir = build_repository_ir(sample_repo)
+    file_path.write_text("# TODO(neurocode): earlier note  # neurocode:todo\n\n\ndef moved(value):\n    return value\n")
+
+    stale = apply_patch(
+        ir=stale_ir, repo_root=sample_repo, file=file_path, fix_description="guard moved", target="moved", dry_run=True
+    )
+    assert stale.no_change is True
+
+    fresh = apply_patch(
+        ir=build_repository_ir(sample_repo),
+        repo_root=sample_repo,
+        file=file_path,
+        fix_description="guard moved",
+        target="moved",
+        dry_run=True,
+    )
+    assert fresh.no_change is False
+    assert fresh.summary == "guard inserted near package.moved.moved"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pickle
 from pathlib import Path
 
 from neurocode.ir_build import build_repository_ir
@@ -109,3 +110,21 @@ def test_toon_roundtrip_preserves_structure(sample_repo: Path, tmp_path: Path) -
         for edge in ir.call_edges
     }
     assert parsed_edges == original_edges
+
+    parsed_spans = {(fn.qualified_name, fn.lineno, fn.end_lineno) for m in parsed.modules for fn in m.functions}
+    original_spans = {(fn.qualified_name, fn.lineno, fn.end_lineno) for m in ir.modules for fn in m.functions}
+    assert parsed_spans == original_spans
+    assert all(fn.end_lineno for m in parsed.modules for fn in m.functions if fn.kind != "module")
+
+
+def test_slotted_ir_survives_pickle_and_toon_reload(sample_repo: Path, tmp_path: Path) -> None:
+    ir = build_repository_ir(sample_repo)
+    assert not hasattr(ir.modules[0].functions[0], "__dict__")
+
+    clone = pickle.loads(pickle.dumps(ir))
+    assert repository_ir_to_toon(clone) == repository_ir_to_toon(ir)
+
+    toon_path = tmp_path / "ir.toon"
+    toon_path.write_text(repository_ir_to_toon(ir), encoding="utf-8")
+    reloaded = pickle.loads(pickle.dumps(load_repository_ir(toon_path)))
+    assert reloaded.functions_by_symbol_id().keys() == ir.functions_by_symbol_id().keys()